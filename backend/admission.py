@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+
+class OverloadedError(RuntimeError):
+    """Raised when a gate's wait queue is full (or the wait timed out); endpoints map it to 503."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionGate:
+    """
+    Per-endpoint admission control for expensive handlers.
+
+    At most `limit` requests run at once and at most `queue` more wait, in FIFO
+    order, for up to `max_wait` seconds. Anything beyond that is rejected
+    immediately with a Retry-After estimate. The estimate is the time to drain
+    the current backlog, using an EWMA of the observed service time.
+    Waiting happens on the event loop, not in a worker thread, so a burst of
+    exports cannot exhaust the threadpool that cheap endpoints also use.
+
+    Must only be used from event-loop code; no locking is needed there.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int = 2,
+        queue: int = 16,
+        max_wait: float = 30.0,
+        initial_estimate: float = 1.0,
+        alpha: float = 0.2,
+    ):
+        self.name = name
+        self.limit = max(1, limit)
+        self.queue = max(0, queue)
+        self.max_wait = max_wait
+        self.alpha = alpha
+        self.ewma_seconds = initial_estimate
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    @classmethod
+    def from_env(cls, name: str, prefix: str, limit: int = 2, queue: int = 16, max_wait: float = 30.0) -> "AdmissionGate":
+        """Reads INDICURE_<prefix>_CONCURRENCY / _QUEUE / _MAX_WAIT, falling back to the given defaults."""
+        env = f"INDICURE_{prefix}_"
+        return cls(
+            name,
+            limit=int(os.getenv(env + "CONCURRENCY", limit)),
+            queue=int(os.getenv(env + "QUEUE", queue)),
+            max_wait=float(os.getenv(env + "MAX_WAIT", max_wait)),
+        )
+
+    def retry_after(self) -> int:
+        backlog = self.active + len(self._waiters)
+        return max(1, math.ceil(self.ewma_seconds * backlog / self.limit))
+
+    async def _acquire(self) -> None:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        if len(self._waiters) >= self.queue:
+            self.rejected += 1
+            raise OverloadedError(f"{self.name}: too many requests in flight", self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.max_wait)
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up: pass it on.
+                self._release()
+            else:
+                waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(exc, asyncio.TimeoutError):
+                self.timed_out += 1
+                raise OverloadedError(f"{self.name}: queued longer than {self.max_wait:g}s",
+                                      self.retry_after()) from None
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # hand the slot over; `active` is unchanged
+                return
+        self.active -= 1
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        await self._acquire()
+        self.admitted += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.ewma_seconds += self.alpha * (elapsed - self.ewma_seconds)
+            self._release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "queue": self.queue,
+            "max_wait_seconds": self.max_wait,
+            "active": self.active,
+            "waiting": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "ewma_seconds": round(self.ewma_seconds, 4),
+            "retry_after": self.retry_after(),
+        }
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import hashlib
+import heapq
+import math
+import os
+import pickle
+import re
+import threading
+from array import array
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+CORPUS_DIR = Path(os.getenv("INDICURE_CORPUS_DIR", DATA_DIR / "corpus"))
+CORPUS_INDEX_PATH = Path(os.getenv("INDICURE_CORPUS_INDEX", DATA_DIR / "corpus.idx"))
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the their to was were with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _encode_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _decode_postings(buf: bytes) -> Iterator[Tuple[int, int]]:
+    """Yields (passage_id, term_frequency) from a delta + varint encoded postings list."""
+    pid = 0
+    values = []
+    n = shift = 0
+    for byte in buf:
+        n |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(n)
+        n = shift = 0
+        if len(values) == 2:
+            pid += values[0]
+            yield pid, values[1]
+            values.clear()
+
+
+class BM25Index:
+    """
+    Inverted index with Okapi BM25 ranking over passages (blank-line separated
+    paragraphs) of a local directory of guideline/review text files.
+
+    Postings are per-term bytearrays of varint (passage-id delta, tf) pairs, and
+    passage lengths live in an array('I'), so the index stays compact as the
+    corpus grows. refresh() re-indexes only new/changed files: removed passages
+    become tombstones that are dropped by an automatic compaction.
+    """
+
+    k1 = 1.5
+    b = 0.75
+
+    def __init__(self):
+        self.docs: Dict[str, Dict] = {}            # file name -> {sha1, title, passages: [ids]}
+        self.passages: List[Optional[Tuple[str, str]]] = []  # id -> (doc, text) or None if deleted
+        self.lengths = array("I")
+        self.postings: Dict[str, bytearray] = {}
+        self._last_pid: Dict[str, int] = {}
+        self._df: Counter = Counter()
+        self._live = 0
+        self._total_len = 0
+        self._lock = threading.RLock()
+
+    # ---- building -------------------------------------------------------
+
+    def add_document(self, name: str, text: str, sha1: str = "") -> None:
+        blocks = [b.strip() for b in re.split(r"\n\s*\n", text) if b.strip()]
+        title = blocks[0] if blocks else name
+        with self._lock:
+            self.remove_document(name)
+            ids = []
+            for block in blocks[1:] or blocks:
+                pid = len(self.passages)
+                tokens = tokenize(block)
+                self.passages.append((name, " ".join(block.split())))
+                self.lengths.append(len(tokens))
+                for term, tf in Counter(tokens).items():
+                    buf = self.postings.setdefault(term, bytearray())
+                    _encode_varint(buf, pid - self._last_pid.get(term, 0))
+                    _encode_varint(buf, tf)
+                    self._last_pid[term] = pid
+                    self._df[term] += 1
+                self._live += 1
+                self._total_len += len(tokens)
+                ids.append(pid)
+            self.docs[name] = {"sha1": sha1, "title": title, "passages": ids}
+
+    def remove_document(self, name: str) -> None:
+        with self._lock:
+            doc = self.docs.pop(name, None)
+            if doc is None:
+                return
+            for pid in doc["passages"]:
+                _, text = self.passages[pid]
+                for term in set(tokenize(text)):
+                    self._df[term] -= 1
+                self.passages[pid] = None
+                self._live -= 1
+                self._total_len -= self.lengths[pid]
+
+    def compact(self) -> None:
+        """Rebuilds postings without tombstoned passages."""
+        with self._lock:
+            docs = [(name, doc) for name, doc in self.docs.items()]
+            texts = {
+                name: "\n\n".join([doc["title"]] + [self.passages[pid][1] for pid in doc["passages"]])
+                for name, doc in docs
+            }
+            fresh = BM25Index()
+            for name, doc in docs:
+                fresh.add_document(name, texts[name], doc["sha1"])
+            self.__dict__.update({k: v for k, v in fresh.__dict__.items() if k != "_lock"})
+
+    def refresh(self, corpus_dir: Path = CORPUS_DIR) -> Dict[str, int]:
+        """Incremental re-index of corpus_dir (*.txt, *.md). Returns counts of added/updated/removed files."""
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        seen = set()
+        with self._lock:
+            for path in sorted(Path(corpus_dir).glob("*")):
+                if path.suffix.lower() not in (".txt", ".md"):
+                    continue
+                raw = path.read_bytes()
+                sha1 = hashlib.sha1(raw).hexdigest()
+                seen.add(path.name)
+                known = self.docs.get(path.name)
+                if known is not None and known["sha1"] == sha1:
+                    continue
+                counts["updated" if known else "added"] += 1
+                self.add_document(path.name, raw.decode("utf-8", errors="replace"), sha1)
+            for name in [n for n in self.docs if n not in seen]:
+                self.remove_document(name)
+                counts["removed"] += 1
+            if self.passages and self._live < 0.7 * len(self.passages):
+                self.compact()
+        return counts
+
+    # ---- querying -------------------------------------------------------
+
+    def search(self, query: str, k: int = 5, require: str = "") -> List[Dict]:
+        """
+        Top-k passages by BM25 score: [{text, doc, title, score}].
+        `require` restricts results to passages containing every one of its terms.
+        """
+        with self._lock:
+            if not self._live:
+                return []
+            avgdl = self._total_len / self._live
+            scores: Dict[int, float] = {}
+            allowed = None
+            for term in set(tokenize(require)):
+                pids = {pid for pid, _ in _decode_postings(self.postings.get(term, b""))}
+                allowed = pids if allowed is None else allowed & pids
+            for term in set(tokenize(query)):
+                df = self._df.get(term, 0)
+                if df <= 0:
+                    continue
+                idf = math.log(1 + (self._live - df + 0.5) / (df + 0.5))
+                for pid, tf in _decode_postings(self.postings[term]):
+                    if self.passages[pid] is None or (allowed is not None and pid not in allowed):
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self.lengths[pid] / avgdl)
+                    scores[pid] = scores.get(pid, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+            top = heapq.nlargest(k, scores.items(), key=lambda kv: kv[1])
+            return [
+                {
+                    "text": self.passages[pid][1],
+                    "doc": self.passages[pid][0],
+                    "title": self.docs[self.passages[pid][0]]["title"],
+                    "score": round(score, 4),
+                }
+                for pid, score in top
+            ]
+
+    # ---- persistence ----------------------------------------------------
+
+    def save(self, path: Path = CORPUS_INDEX_PATH) -> None:
+        tmp = Path(path).with_suffix(".tmp")
+        with self._lock, open(tmp, "wb") as f:
+            state = {k: v for k, v in self.__dict__.items() if k != "_lock"}
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path = CORPUS_INDEX_PATH) -> "BM25Index":
+        index = cls()
+        with open(path, "rb") as f:
+            index.__dict__.update(pickle.load(f))
+        return index
+
+
+@lru_cache(maxsize=1)
+def get_corpus_index() -> BM25Index:
+    """Loads the persisted index if present, brings it up to date with the corpus directory, and saves changes."""
+    try:
+        index = BM25Index.load()
+    except (OSError, pickle.UnpicklingError, EOFError):
+        index = BM25Index()
+    if any(index.refresh().values()):
+        try:
+            index.save()
+        except OSError:
+            pass
+    return index
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+EVIDENCE_DB_PATH = Path(os.getenv("INDICURE_EVIDENCE_DB", DATA_DIR / "evidence.sqlite3"))
+EVIDENCE_SEED_PATH = DATA_DIR / "evidence_seed.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pairs (
+    id INTEGER PRIMARY KEY,
+    drug TEXT NOT NULL COLLATE NOCASE,
+    indication TEXT NOT NULL COLLATE NOCASE,
+    safety TEXT NOT NULL DEFAULT '',
+    updated_at REAL NOT NULL,
+    UNIQUE (drug, indication)
+);
+CREATE TABLE IF NOT EXISTS findings (
+    pair_id INTEGER NOT NULL REFERENCES pairs(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (pair_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS endpoints (
+    pair_id INTEGER NOT NULL REFERENCES pairs(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    metric TEXT NOT NULL,
+    result TEXT NOT NULL,
+    significance TEXT NOT NULL,
+    PRIMARY KEY (pair_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS pairs_indication ON pairs (indication);
+"""
+
+
+class EvidenceStore:
+    """
+    On-disk trial evidence keyed by (drug, indication), backed by SQLite.
+
+    The UNIQUE (drug, indication) index makes a lookup a single B-tree probe
+    plus two clustered range scans, so only the requested pair is read into
+    memory. Each thread gets its own connection; WAL mode lets readers run
+    while a bulk load or update is writing.
+    """
+
+    def __init__(self, path: Path = EVIDENCE_DB_PATH):
+        self.path = Path(path)
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def bulk_load(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Inserts or replaces many pairs in one transaction.
+        Each record: {drug, indication, key_findings: [str], endpoints: [{metric, result, significance}], safety}.
+        """
+        conn = self._conn()
+        n = 0
+        with conn:
+            for rec in records:
+                self._write(conn, rec)
+                n += 1
+        return n
+
+    def upsert(self, record: Dict[str, Any]) -> None:
+        """Incremental update of a single (drug, indication) pair."""
+        conn = self._conn()
+        with conn:
+            self._write(conn, record)
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, rec: Dict[str, Any]) -> None:
+        pair_id = conn.execute(
+            "INSERT INTO pairs (drug, indication, safety, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (drug, indication) DO UPDATE SET safety = excluded.safety, updated_at = excluded.updated_at "
+            "RETURNING id",
+            (rec["drug"], rec["indication"], rec.get("safety", ""), time.time()),
+        ).fetchone()[0]
+        conn.execute("DELETE FROM findings WHERE pair_id = ?", (pair_id,))
+        conn.execute("DELETE FROM endpoints WHERE pair_id = ?", (pair_id,))
+        conn.executemany(
+            "INSERT INTO findings (pair_id, position, text) VALUES (?, ?, ?)",
+            [(pair_id, i, t) for i, t in enumerate(rec.get("key_findings", []))],
+        )
+        conn.executemany(
+            "INSERT INTO endpoints (pair_id, position, metric, result, significance) VALUES (?, ?, ?, ?, ?)",
+            [
+                (pair_id, i, e.get("metric", ""), e.get("result", ""), e.get("significance", ""))
+                for i, e in enumerate(rec.get("endpoints", []))
+            ],
+        )
+
+    def delete(self, drug: str, indication: str) -> bool:
+        conn = self._conn()
+        with conn:
+            cur = conn.execute("DELETE FROM pairs WHERE drug = ? AND indication = ?", (drug, indication))
+        return cur.rowcount > 0
+
+    def lookup(self, drug: str, indication: str) -> Optional[Dict[str, Any]]:
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT id, safety FROM pairs WHERE drug = ? AND indication = ?", (drug, indication)
+        ).fetchone()
+        if row is None:
+            return None
+        pair_id, safety = row
+        findings = [t for (t,) in conn.execute(
+            "SELECT text FROM findings WHERE pair_id = ? ORDER BY position", (pair_id,)
+        )]
+        endpoints = [
+            {"metric": m, "result": r, "significance": s}
+            for m, r, s in conn.execute(
+                "SELECT metric, result, significance FROM endpoints WHERE pair_id = ? ORDER BY position", (pair_id,)
+            )
+        ]
+        return {"key_findings": findings, "endpoints": endpoints, "safety": safety}
+
+    def drugs_for(self, indication: str) -> List[str]:
+        return [d for (d,) in self._conn().execute(
+            "SELECT drug FROM pairs WHERE indication = ? ORDER BY drug", (indication,)
+        )]
+
+    def endpoints_for(self, indication: str) -> List[Tuple[str, str]]:
+        """(drug, significance) for every endpoint recorded against indication, in one indexed scan."""
+        return self._conn().execute(
+            "SELECT p.drug, e.significance FROM pairs p JOIN endpoints e ON e.pair_id = p.id "
+            "WHERE p.indication = ? ORDER BY p.drug, e.position",
+            (indication,),
+        ).fetchall()
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM pairs").fetchone()[0]
+
+
+@lru_cache(maxsize=1)
+def get_evidence_store() -> EvidenceStore:
+    """Process-wide store; seeded from data/evidence_seed.json the first time the database is empty."""
+    store = EvidenceStore()
+    if store.count() == 0 and EVIDENCE_SEED_PATH.exists():
+        with open(EVIDENCE_SEED_PATH, encoding="utf-8") as f:
+            store.bulk_load(json.load(f))
+    return store
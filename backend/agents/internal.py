@@ -8,17 +8,59 @@ def run_internal_knowledge_agent(drug: str, indication: str) -> dict:
 
     Working (prototype):
       - In production: internal decks + knowledge graph + mechanistic literature.
-      - Here: returns the precise mechanistic rationale you validated.
+      - Here: searches the drug → target → disease knowledge graph (agents/knowledge_graph.py)
+        for mechanistic paths, and contrasts them with other drugs that reach the same disease.
 
     Output:
       - Mechanism bullet points + differentiation.
     """
+    # Imported here so NumPy stays off the app's cold-start path.
+    from agents.knowledge_graph import get_knowledge_graph
+
+    kg = get_knowledge_graph()
+    others = [d for d in kg.nodes_of_type("drug") if d.lower() != drug.lower()]
+    # One reverse search from the indication serves the queried drug and every comparator.
+    all_paths = kg.paths_from([drug] + others, indication)
+    paths = all_paths[drug]
+    if not paths:
+        return {
+            "mechanism": [f"No mechanistic path from {drug} to {indication} found in the knowledge graph."],
+            "differentiation": "Differentiation not assessed (no mechanistic link on record).",
+            "paths": []
+        }
+
+    mechanism = [" → ".join([paths[0][0]["source"]] + [e["target"] for e in paths[0]])]
+    for path in paths:
+        for e in path:
+            if e["text"] and e["text"] not in mechanism:
+                mechanism.append(e["text"])
+
+    own_targets = {e["target"] for path in paths for e in path[:-1]}
+    distinct, overlapping = [], []
+    for other in others:
+        other_paths = all_paths[other][:3]
+        if not other_paths:
+            continue
+        other_class = kg.node_class(other) or other
+        shared = own_targets & {e["target"] for path in other_paths for e in path[:-1]}
+        bucket = overlapping if shared else distinct
+        if other_class not in bucket:
+            bucket.append(other_class)
+
+    if distinct and not overlapping:
+        differentiation = (
+            f"Mechanistically distinct from {' / '.join(distinct)}; complements existing therapy."
+        )
+    elif overlapping:
+        differentiation = (
+            f"Shares mechanistic nodes with {' / '.join(overlapping)}"
+            + (f"; distinct from {' / '.join(distinct)}." if distinct else ".")
+        )
+    else:
+        differentiation = f"No other mapped therapy reaches {indication}; first-in-mechanism positioning."
+
     return {
-        "mechanism": [
-            "Inhibits late sodium current (INaL) → reduces intracellular Na⁺.",
-            "Reduces Ca²⁺ overload → improves diastolic relaxation and filling.",
-            "Addresses ionic dysfunction central to HFpEF pathophysiology.",
-            "Evidence supports improvements in diastolic indices without BP/HR compromise."
-        ],
-        "differentiation": "Mechanistically distinct from SGLT2 inhibitors / ARNIs; complements existing therapy."
-    }
\ No newline at end of file
+        "mechanism": mechanism,
+        "differentiation": differentiation,
+        "paths": [[f"{e['source']} —{e['relation']}→ {e['target']}" for e in path] for path in paths]
+    }
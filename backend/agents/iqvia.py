@@ -1,3 +1,6 @@
+import math
+
+
 def run_iqvia_insights_agent(geography: str, indication: str) -> dict:
     """
     IQVIA Insights Agent (Market)
@@ -8,13 +11,52 @@ def run_iqvia_insights_agent(geography: str, indication: str) -> dict:
 
     Working (prototype):
       - In production: IQVIA/market datasets + CAGR + therapy adoption.
-      - Here: returns directional market rationale consistent with your demo story.
+      - Here: computes CAGR, spend share and treatment-rate trends from the local columnar
+        market panel (data/market.csv, agents/market_data.py) and phrases them as rationale.
 
     Output:
       - Market trend + patient gap + commercial rationale.
     """
+    # Imported here so NumPy stays off the app's cold-start path.
+    from agents.market_data import get_market_dataset
+
+    m = get_market_dataset().lookup(geography, indication)
+    if m is None:
+        return {
+            "market_trend": f"No market panel data for {indication} in {geography}.",
+            "patient_gap": "Patient gap not quantified (no prevalence/treatment data).",
+            "commercial_rationale": "Commercial case requires a market data pull for this indication."
+        }
+
+    p0, p1 = m["period_first"], m["period_last"]
+    untreated = max(m["prevalent_last"] - m["treated_last"], 0.0)
+    gap = untreated / m["prevalent_last"] if m["prevalent_last"] else float("nan")
+    cagr = m["cagr"]
+    growing = not math.isnan(cagr) and cagr > 0.05
+
     return {
-        "market_trend": "Growing HF burden in India driven by aging, diabetes, and lifestyle risk factors.",
-        "patient_gap": "Large underdiagnosed population suggests significant screening and treatment opportunity.",
-        "commercial_rationale": "Affordable repurposed therapy could fit unmet need and resource constraints."
-    }
\ No newline at end of file
+        "market_trend": (
+            f"{indication} therapy spend in {geography} grew from ${m['sales_first']:.1f}M ({p0}) to "
+            f"${m['sales_last']:.1f}M ({p1}), a {cagr:.1%} CAGR and {m['share_of_geography']:.1%} of tracked "
+            f"cardiometabolic spend; {m['top_class']} lead the segment."
+        ),
+        "patient_gap": (
+            f"~{untreated:,.0f}k of ~{m['prevalent_last']:,.0f}k prevalent patients ({gap:.0%}) are not on "
+            f"tracked therapy; treatment rate moved from {m['treatment_rate_first']:.0%} to "
+            f"{m['treatment_rate_last']:.0%} since {p0}."
+        ),
+        "commercial_rationale": (
+            ("Growing, under-penetrated market: " if growing else "Under-penetrated market: ")
+            + "an affordable repurposed therapy could fit the unmet need and resource constraints."
+            if gap > 0.5 else
+            "Market is comparatively well served; positioning would rest on differentiation rather than access."
+        ),
+        "metrics": {
+            "period": [p0, p1],
+            "sales_usd_mn": [round(float(m["sales_first"]), 2), round(float(m["sales_last"]), 2)],
+            "cagr": round(float(cagr), 4),
+            "share_of_geography": round(float(m["share_of_geography"]), 4),
+            "treated_k": round(float(m["treated_last"]), 1),
+            "prevalent_k": round(float(m["prevalent_last"]), 1),
+        }
+    }
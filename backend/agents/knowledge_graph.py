@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+KG_SOURCE_PATH = Path(os.getenv("INDICURE_KG_SOURCE", DATA_DIR / "knowledge_graph.json"))
+KG_SNAPSHOT_DIR = Path(os.getenv("INDICURE_KG_SNAPSHOT", DATA_DIR / "kg_snapshot"))
+
+_ARRAYS = ("indptr", "indices", "relations", "edge_text", "rindptr", "rindices")
+
+
+class KnowledgeGraph:
+    """
+    Directed drug → target → process → disease graph in CSR form.
+
+    Out-edges of node i are indices[indptr[i]:indptr[i+1]], with parallel
+    relation codes and edge-text ids; a transposed CSR (rindptr/rindices) backs
+    the reverse search. Only these int arrays scale with the edge count, so a
+    snapshot saved with save() can be opened with np.load(mmap_mode="r") and
+    paged in on demand instead of being parsed at startup.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], meta: Dict):
+        for name in _ARRAYS:
+            setattr(self, name, arrays[name])
+        self.names: List[str] = meta["names"]
+        self.types: List[str] = meta["types"]
+        self.classes: List[str] = meta["classes"]
+        self.relation_labels: List[str] = meta["relation_labels"]
+        self.texts: List[str] = meta["texts"]
+        self._ids = {n.lower(): i for i, n in enumerate(self.names)}
+
+    @classmethod
+    def from_edges(cls, nodes: List[Dict], edges: List[Dict]) -> "KnowledgeGraph":
+        names = [n["name"] for n in nodes]
+        ids = {n: i for i, n in enumerate(names)}
+        relation_labels = sorted({e["relation"] for e in edges})
+        rel_ids = {r: i for i, r in enumerate(relation_labels)}
+        texts: List[str] = []
+
+        src = np.array([ids[e["source"]] for e in edges], dtype=np.int32)
+        dst = np.array([ids[e["target"]] for e in edges], dtype=np.int32)
+        rel = np.array([rel_ids[e["relation"]] for e in edges], dtype=np.int16)
+        txt = np.full(len(edges), -1, dtype=np.int32)
+        for i, e in enumerate(edges):
+            if e.get("text"):
+                txt[i] = len(texts)
+                texts.append(e["text"])
+
+        n = len(names)
+        order = np.argsort(src, kind="stable")
+        rorder = np.argsort(dst, kind="stable")
+        arrays = {
+            "indptr": np.concatenate(([0], np.cumsum(np.bincount(src, minlength=n)))).astype(np.int64),
+            "indices": dst[order],
+            "relations": rel[order],
+            "edge_text": txt[order],
+            "rindptr": np.concatenate(([0], np.cumsum(np.bincount(dst, minlength=n)))).astype(np.int64),
+            "rindices": src[rorder],
+        }
+        meta = {
+            "names": names,
+            "types": [node.get("type", "") for node in nodes],
+            "classes": [node.get("class", "") for node in nodes],
+            "relation_labels": relation_labels,
+            "texts": texts,
+        }
+        return cls(arrays, meta)
+
+    @classmethod
+    def from_json(cls, path: Path = KG_SOURCE_PATH) -> "KnowledgeGraph":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls.from_edges(data["nodes"], data["edges"])
+
+    def save(self, directory: Path = KG_SNAPSHOT_DIR) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in _ARRAYS:
+            np.save(directory / f"{name}.npy", np.ascontiguousarray(getattr(self, name)))
+        meta = {
+            "names": self.names,
+            "types": self.types,
+            "classes": self.classes,
+            "relation_labels": self.relation_labels,
+            "texts": self.texts,
+        }
+        with open(directory / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory: Path = KG_SNAPSHOT_DIR) -> "KnowledgeGraph":
+        directory = Path(directory)
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in _ARRAYS}
+        with open(directory / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        return cls(arrays, meta)
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.indptr[-1])
+
+    def node_id(self, name: str) -> Optional[int]:
+        return self._ids.get(name.lower())
+
+    def _distances_to(self, target: int, max_depth: int) -> Dict[int, int]:
+        """Reverse BFS: hop distance from every node that can reach target within max_depth."""
+        dist = {target: 0}
+        queue = deque([target])
+        while queue:
+            v = queue.popleft()
+            if dist[v] == max_depth:
+                continue
+            for u in self.rindices[self.rindptr[v]:self.rindptr[v + 1]].tolist():
+                if u not in dist:
+                    dist[u] = dist[v] + 1
+                    queue.append(u)
+        return dist
+
+    def distances_to(self, target: str, max_depth: int = 5) -> Dict[str, int]:
+        """Hop distance to target for every node that reaches it within max_depth, from one reverse BFS."""
+        t = self.node_id(target)
+        if t is None:
+            return {}
+        return {self.names[v]: d for v, d in self._distances_to(t, max_depth).items()}
+
+    def paths(self, source: str, target: str, max_depth: int = 5, limit: int = 5) -> List[List[Dict]]:
+        """Simple paths source → target of at most max_depth edges, shortest first."""
+        return self.paths_from([source], target, max_depth, limit)[source]
+
+    def paths_from(
+        self, sources: List[str], target: str, max_depth: int = 5, limit: int = 5
+    ) -> Dict[str, List[List[Dict]]]:
+        """
+        Up to `limit` simple paths to target from each source, shortest first.
+        One reverse BFS from the target serves every source, and it prunes each
+        branch that cannot still reach the target, so the forward search only
+        walks edges that lie on some valid path.
+        """
+        found: Dict[str, List[List[Dict]]] = {source: [] for source in sources}
+        t = self.node_id(target)
+        if t is None:
+            return found
+        dist = self._distances_to(t, max_depth)
+        for source in sources:
+            s = self.node_id(source)
+            if s is not None and s in dist:
+                found[source] = [[self._edge(e) for e in path] for path in self._walk(s, t, dist, max_depth, limit)]
+        return found
+
+    def _walk(self, s: int, t: int, dist: Dict[int, int], max_depth: int, limit: int) -> List[List[int]]:
+        """
+        Edge-id paths s → t in order of length: one pruned DFS per length, from
+        the BFS distance of s up to max_depth, so the first `limit` are the shortest.
+        """
+        found: List[List[int]] = []
+
+        def walk(v: int, edges: List[int], on_path: set, length: int) -> None:
+            if len(found) >= limit:
+                return
+            if v == t:
+                if len(edges) == length:
+                    found.append(list(edges))
+                return
+            remaining = length - len(edges) - 1
+            for e in range(int(self.indptr[v]), int(self.indptr[v + 1])):
+                u = int(self.indices[e])
+                if u in on_path or dist.get(u, max_depth + 1) > remaining:
+                    continue
+                edges.append(e)
+                on_path.add(u)
+                walk(u, edges, on_path, length)
+                on_path.discard(u)
+                edges.pop()
+
+        for length in range(dist[s], max_depth + 1):
+            walk(s, [], {s}, length)
+        return found
+
+    def _edge(self, e: int) -> Dict:
+        src = int(np.searchsorted(self.indptr, e, side="right") - 1)
+        text_id = int(self.edge_text[e])
+        return {
+            "source": self.names[src],
+            "relation": self.relation_labels[int(self.relations[e])],
+            "target": self.names[int(self.indices[e])],
+            "text": self.texts[text_id] if text_id >= 0 else "",
+        }
+
+    def neighbours(self, name: str) -> List[str]:
+        v = self.node_id(name)
+        if v is None:
+            return []
+        return [self.names[u] for u in self.indices[self.indptr[v]:self.indptr[v + 1]].tolist()]
+
+    def nodes_of_type(self, node_type: str) -> List[str]:
+        return [n for n, t in zip(self.names, self.types) if t == node_type]
+
+    def node_class(self, name: str) -> str:
+        v = self.node_id(name)
+        return self.classes[v] if v is not None else ""
+
+
+@lru_cache(maxsize=1)
+def get_knowledge_graph() -> KnowledgeGraph:
+    """
+    Memory-maps the snapshot when it is newer than the JSON source; otherwise
+    rebuilds the CSR arrays from JSON and refreshes the snapshot.
+    """
+    meta = KG_SNAPSHOT_DIR / "meta.json"
+    if meta.exists() and (not KG_SOURCE_PATH.exists() or meta.stat().st_mtime >= KG_SOURCE_PATH.stat().st_mtime):
+        return KnowledgeGraph.load()
+    graph = KnowledgeGraph.from_json()
+    try:
+        graph.save()
+    except OSError:
+        pass
+    return graph
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import csv
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+MARKET_PATH = Path(os.getenv("INDICURE_MARKET_DATA", DATA_DIR / "market.csv"))
+
+CATEGORICAL = ("geography", "indication", "therapy_class")
+NUMERIC = ("sales_usd_mn", "volume_mn_units", "treated_k", "prevalent_k")
+
+
+class MarketDataset:
+    """
+    Columnar market panel: one row per (geography, indication, therapy_class, period).
+
+    Categorical columns are stored as integer codes plus a label array, numeric
+    columns as float64 arrays. All aggregations are group-bys done with
+    np.bincount / ufunc.at over combined group codes, so computing metrics for
+    every indication and region at once costs a handful of array passes.
+    """
+
+    def __init__(self, columns: Dict[str, Sequence]):
+        self.labels: Dict[str, np.ndarray] = {}
+        self.codes: Dict[str, np.ndarray] = {}
+        for name in CATEGORICAL:
+            self.labels[name], self.codes[name] = np.unique(np.asarray(columns[name], dtype=str), return_inverse=True)
+        self.periods, self.period_idx = np.unique(np.asarray(columns["period"], dtype=np.int64), return_inverse=True)
+        self.values = {name: np.asarray(columns[name], dtype=np.float64) for name in NUMERIC}
+
+    @classmethod
+    def from_csv(cls, path: Path = MARKET_PATH) -> "MarketDataset":
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        return cls({name: [r[name] for r in rows] for name in (*CATEGORICAL, "period", *NUMERIC)})
+
+    def __len__(self) -> int:
+        return len(self.period_idx)
+
+    def _group_ids(self, by: Tuple[str, ...]) -> Tuple[np.ndarray, Tuple[int, ...]]:
+        shape = tuple(len(self.labels[b]) for b in by)
+        if not by:
+            return np.zeros(len(self), dtype=np.int64), ()
+        return np.ravel_multi_index(tuple(self.codes[b] for b in by), shape), shape
+
+    def _panel(self, gid: np.ndarray, n_groups: int, column: str, how: str = "sum") -> np.ndarray:
+        """(groups x periods) matrix of `column` aggregated by sum or max."""
+        n_periods = len(self.periods)
+        flat = gid * n_periods + self.period_idx
+        if how == "sum":
+            out = np.bincount(flat, weights=self.values[column], minlength=n_groups * n_periods)
+        else:
+            out = np.zeros(n_groups * n_periods)
+            np.maximum.at(out, flat, self.values[column])
+        return out.reshape(n_groups, n_periods)
+
+    def metrics(self, by: Tuple[str, ...] = ("geography", "indication")) -> Dict[str, np.ndarray]:
+        """
+        Per-group market metrics, all as arrays aligned with the group labels:
+        first/last-period sales, CAGR, share of geography spend, treated and
+        prevalent patients, treatment rate change, and the leading therapy class.
+        """
+        if not set(by) <= {"geography", "indication"}:
+            # Prevalence is only defined per (geography, indication).
+            raise ValueError("metrics() groups by geography and/or indication only")
+        gid, shape = self._group_ids(by)
+        n_groups = int(np.prod(shape)) if shape else 1
+
+        sales = self._panel(gid, n_groups, "sales_usd_mn")
+        treated = self._panel(gid, n_groups, "treated_k")
+        # Prevalence is an indication-level figure repeated on each class row: take the max per
+        # (geography, indication), then sum over the indications inside each group.
+        gi_id, gi_shape = self._group_ids(("geography", "indication"))
+        prev_gi = self._panel(gi_id, int(np.prod(gi_shape)), "prevalent_k", how="max")
+        gi_to_group = np.zeros(int(np.prod(gi_shape)), dtype=np.int64)
+        gi_to_group[gi_id] = gid
+        present = np.zeros(int(np.prod(gi_shape)), dtype=bool)
+        present[gi_id] = True
+        prevalent = np.zeros((n_groups, len(self.periods)))
+        np.add.at(prevalent, gi_to_group[present], prev_gi[present])
+
+        years = max(int(self.periods[-1] - self.periods[0]), 1)
+        first, last = sales[:, 0], sales[:, -1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cagr = np.where(first > 0, (last / first) ** (1.0 / years) - 1.0, np.nan)
+            rate_first = np.where(prevalent[:, 0] > 0, treated[:, 0] / prevalent[:, 0], np.nan)
+            rate_last = np.where(prevalent[:, -1] > 0, treated[:, -1] / prevalent[:, -1], np.nan)
+
+        geo_id, geo_shape = self._group_ids(("geography",))
+        geo_last = np.bincount(geo_id[self.period_idx == len(self.periods) - 1],
+                               weights=self.values["sales_usd_mn"][self.period_idx == len(self.periods) - 1],
+                               minlength=int(np.prod(geo_shape)))
+        if "geography" in by:
+            group_geo = np.zeros(n_groups, dtype=np.int64)
+            group_geo[gid] = self.codes["geography"]
+            denominator = geo_last[group_geo]
+        else:
+            denominator = np.full(n_groups, geo_last.sum())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            share = np.where(denominator > 0, last / denominator, np.nan)
+
+        n_classes = len(self.labels["therapy_class"])
+        latest = self.period_idx == len(self.periods) - 1
+        class_sales = np.bincount(
+            gid[latest] * n_classes + self.codes["therapy_class"][latest],
+            weights=self.values["sales_usd_mn"][latest],
+            minlength=n_groups * n_classes,
+        ).reshape(n_groups, n_classes)
+
+        group_codes = np.unravel_index(np.arange(n_groups), shape) if shape else ()
+        return {
+            "groups": {b: self.labels[b][c] for b, c in zip(by, group_codes)},
+            "present": np.bincount(gid, minlength=n_groups) > 0,
+            "sales_first": first,
+            "sales_last": last,
+            "cagr": cagr,
+            "share_of_geography": share,
+            "treated_last": treated[:, -1],
+            "prevalent_last": prevalent[:, -1],
+            "treatment_rate_first": rate_first,
+            "treatment_rate_last": rate_last,
+            "top_class": self.labels["therapy_class"][class_sales.argmax(axis=1)],
+        }
+
+    def lookup(self, geography: str, indication: str) -> Optional[Dict[str, object]]:
+        """Metrics for a single (geography, indication), read from the cached all-groups table."""
+        table = _metrics_table(self)
+        idx = table["index"].get((geography.lower(), indication.lower()))
+        if idx is None:
+            return None
+        row = {k: v[idx] for k, v in table["metrics"].items() if k not in ("groups", "present")}
+        row["period_first"] = int(self.periods[0])
+        row["period_last"] = int(self.periods[-1])
+        return row
+
+    def class_shares(self, geography: str, indication: str) -> Dict[str, float]:
+        """Latest-period share of (geography, indication) sales held by each therapy class."""
+        g = np.flatnonzero(np.char.lower(self.labels["geography"]) == geography.lower())
+        i = np.flatnonzero(np.char.lower(self.labels["indication"]) == indication.lower())
+        if not len(g) or not len(i):
+            return {}
+        mask = (
+            (self.codes["geography"] == g[0])
+            & (self.codes["indication"] == i[0])
+            & (self.period_idx == len(self.periods) - 1)
+        )
+        sales = np.bincount(self.codes["therapy_class"][mask], weights=self.values["sales_usd_mn"][mask],
+                            minlength=len(self.labels["therapy_class"]))
+        total = sales.sum()
+        if total <= 0:
+            return {}
+        return {str(c): float(s / total) for c, s in zip(self.labels["therapy_class"], sales) if s > 0}
+
+
+@lru_cache(maxsize=4)
+def _metrics_table(dataset: MarketDataset) -> Dict[str, object]:
+    metrics = dataset.metrics(("geography", "indication"))
+    groups = metrics["groups"]
+    index = {
+        (g.lower(), i.lower()): n
+        for n, (g, i) in enumerate(zip(groups["geography"], groups["indication"])) if metrics["present"][n]
+    }
+    return {"metrics": metrics, "index": index}
+
+
+@lru_cache(maxsize=1)
+def get_market_dataset() -> MarketDataset:
+    return MarketDataset.from_csv()
@@ -1,72 +1,505 @@
+import asyncio
+import copy
+import inspect
+import json
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
 from agents.clinical import run_clinical_trials_agent
 from agents.web import run_web_intelligence_agent
 from agents.patent import run_patent_landscape_agent
 from agents.iqvia import run_iqvia_insights_agent
 from agents.internal import run_internal_knowledge_agent
+from agents.matcher import AhoCorasick
+from cache import TTLCache, make_cache, memoize
+from metrics import AGENT_DURATION, ORCHESTRATION_DURATION
+
+VOCABULARY_PATH = Path(os.getenv(
+    "INDICURE_VOCABULARY",
+    Path(__file__).resolve().parent.parent / "data" / "vocabulary.json",
+))
+
+DEFAULT_DRUG = "Ranolazine"
+DEFAULT_INDICATION = "HFpEF"
+DEFAULT_GEOGRAPHY = "India"
+
+_UNSET = object()
+
+
+@lru_cache(maxsize=1)
+def _vocabulary():
+    """
+    Loads the drug/indication/geography vocabulary once and compiles every name,
+    brand and synonym into a single automaton. Returns (matcher, current_use by drug).
+    """
+    with open(VOCABULARY_PATH, encoding="utf-8") as f:
+        vocab = json.load(f)
+
+    matcher = AhoCorasick()
+    current_use = {}
+    for category in ("drugs", "indications", "geographies"):
+        for entry in vocab.get(category, []):
+            for term in [entry["name"], *entry.get("synonyms", [])]:
+                matcher.add(term, (category, entry["name"]))
+            if "current_use" in entry:
+                current_use[entry["name"]] = entry["current_use"]
+    return matcher.build(), current_use
+
+
+def _mentions(text: str) -> Dict[str, str]:
+    """Canonical name per vocabulary category; the earliest (then longest) mention wins."""
+    matcher, _ = _vocabulary()
+    found = {}
+    for start, end, (category, name) in matcher.finditer(text):
+        best = found.get(category)
+        if best is None or (start, -(end - start)) < best[0]:
+            found[category] = ((start, -(end - start)), name)
+    return {category: name for category, (_, name) in found.items()}
+
+
+def canonical_term(category: str, text: str) -> str:
+    """
+    Canonical vocabulary name for free text in one category, e.g. "heart failure
+    with preserved ejection fraction" → "HFpEF"; text without a match is returned stripped.
+    """
+    return _mentions(text).get(category, text.strip())
+
 
 def normalize_query(query: str) -> dict:
     """
     Master Orchestration Agent — parsing/normalization.
     Extracts: drug, current use, target indication, geography.
-    For the prototype, we default to Ranolazine/HFpEF/India unless clearly overridden.
+    One pass of the compiled vocabulary automaton over the query; per category the
+    earliest (then longest) mention wins. Falls back to Ranolazine/HFpEF/India.
     """
-    q = query.lower()
-    drug = "Ranolazine" if "ranolazine" in q else "Ranolazine"  # demo locked
-    indication = "HFpEF" if ("hfpef" in q or "preserved ejection" in q or "diastolic" in q) else "HFpEF"
-    geography = "India" if ("india" in q or "indian" in q) else "India"
-    current_use = "Chronic stable angina / ischaemic heart disease"
+    _, current_use = _vocabulary()
+    found = _mentions(query)
+    drug = found.get("drugs", DEFAULT_DRUG)
+    indication = found.get("indications", DEFAULT_INDICATION)
+    geography = found.get("geographies", DEFAULT_GEOGRAPHY)
+    return {
+        "drug": drug,
+        "current_use": current_use.get(drug, ""),
+        "repurposing_target": indication,
+        "geography": geography
+    }
+
+
+def known_drugs() -> list:
+    """Canonical names of every drug in the query vocabulary."""
+    return list(_vocabulary()[1])
+
+
+def normalize_pair(drug: str, indication: str, geography: str = DEFAULT_GEOGRAPHY) -> dict:
+    """Normalized form of an explicit (drug, indication) pair, e.g. a screening candidate."""
+    _, current_use = _vocabulary()
     return {
         "drug": drug,
-        "current_use": current_use,
+        "current_use": current_use.get(drug, ""),
         "repurposing_target": indication,
         "geography": geography
     }
 
-def run_orchestration(query: str, geography: str) -> dict:
+
+MASTER_AGENT = "Master Orchestration Agent"
+REPORT_AGENT = "Report Generator Agent"
+
+# Per-agent memo TTLs (seconds): patents move slowly, web intelligence the fastest.
+AGENT_CACHE_TTLS: Dict[str, float] = {
+    "Clinical Trials Agent": 6 * 3600,
+    "Web Intelligence Agent": 30 * 60,
+    "Patent Landscape Agent": 24 * 3600,
+    "IQVIA Insights Agent": 6 * 3600,
+    "Internal Knowledge Agent": 12 * 3600,
+}
+
+DEFAULT_AGENT_TIMEOUT = float(os.getenv("INDICURE_AGENT_TIMEOUT", "15"))
+
+# Per-agent deadlines (seconds). Agents not listed use DEFAULT_AGENT_TIMEOUT.
+AGENT_TIMEOUTS: Dict[str, float] = {}
+
+
+def _memo(name: str, fn):
+    # Callers waiting on another caller's run give up at the agent's own deadline.
+    return memoize(ttl=AGENT_CACHE_TTLS[name], name=name,
+                   wait_timeout=AGENT_TIMEOUTS.get(name, DEFAULT_AGENT_TIMEOUT))(fn)
+
+
+# Worker agents, in report order, with the inputs each one actually depends on.
+# Each agent is memoized on exactly those inputs, so e.g. two drugs queried for the
+# same indication and geography share the web and market results.
+WORKER_AGENTS = [
+    ("Clinical Trials Agent", _memo("Clinical Trials Agent", run_clinical_trials_agent), ("drug", "indication")),
+    ("Web Intelligence Agent", _memo("Web Intelligence Agent", run_web_intelligence_agent), ("geography", "indication")),
+    ("Patent Landscape Agent", _memo("Patent Landscape Agent", run_patent_landscape_agent), ("drug", "indication")),
+    ("IQVIA Insights Agent", _memo("IQVIA Insights Agent", run_iqvia_insights_agent), ("geography", "indication")),
+    ("Internal Knowledge Agent", _memo("Internal Knowledge Agent", run_internal_knowledge_agent), ("drug", "indication")),
+]
+
+AGENT_WORKERS = int(os.getenv("INDICURE_AGENT_WORKERS", "16"))
+
+# Blocking agents run here; coroutine agents run on the event loop instead.
+_AGENT_POOL = ThreadPoolExecutor(
+    max_workers=AGENT_WORKERS,
+    thread_name_prefix="indicure-agent",
+)
+
+
+def _agent_timeout(name: str, timeouts: Optional[Dict[str, float]]) -> float:
+    if timeouts and name in timeouts:
+        return timeouts[name]
+    return AGENT_TIMEOUTS.get(name, DEFAULT_AGENT_TIMEOUT)
+
+
+def _agent_inputs(norm: dict, geography: str) -> dict:
+    return {
+        "drug": norm["drug"],
+        "indication": norm["repurposing_target"],
+        "geography": geography,
+    }
+
+
+def _status(status: str, duration_ms: float, error: str = "") -> dict:
+    out = {"status": status, "duration_ms": round(duration_ms, 3)}
+    if error:
+        out["error"] = error
+    return out
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+def _timed_call(fn, *args):
+    """Runs a blocking agent and returns (output, own runtime in ms), excluding pool queueing."""
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, _elapsed_ms(started)
+
+
+def _run_agents(norm: dict, geography: str, timeouts: Optional[Dict[str, float]] = None):
+    """
+    Fans the worker agents out on the agent pool and collects whatever finishes
+    before each agent's deadline. All agents start together, so the wall time is
+    bounded by the slowest deadline rather than the sum of agent runtimes.
+    """
+    inputs = _agent_inputs(norm, geography)
+    started = time.perf_counter()
+    futures = {
+        name: _AGENT_POOL.submit(_timed_call, fn, *(inputs[k] for k in keys))
+        for name, fn, keys in WORKER_AGENTS
+    }
+
+    outputs: Dict[str, dict] = {}
+    statuses: Dict[str, dict] = {}
+    for name, future in futures.items():
+        remaining = started + _agent_timeout(name, timeouts) - time.perf_counter()
+        try:
+            outputs[name], duration_ms = future.result(timeout=max(remaining, 0))
+            statuses[name] = _status("completed", duration_ms)
+        except FutureTimeoutError:
+            future.cancel()
+            statuses[name] = _status("timeout", _elapsed_ms(started), "Agent exceeded its deadline.")
+        except Exception as exc:
+            statuses[name] = _status("failed", _elapsed_ms(started), f"{type(exc).__name__}: {exc}")
+    return outputs, statuses
+
+
+async def _timed_coro(coro):
+    started = time.perf_counter()
+    result = await coro
+    return result, _elapsed_ms(started)
+
+
+# Progress callback: receives {"agent", "status", "elapsed_ms", ...} dicts on the event loop.
+EventCallback = Callable[[dict], None]
+
+
+def _event(agent: str, status: str, started: float, **extra) -> dict:
+    return {"agent": agent, "status": status, "elapsed_ms": round(_elapsed_ms(started), 3), **extra}
+
+
+async def _run_agents_async(
+    norm: dict,
+    geography: str,
+    timeouts: Optional[Dict[str, float]] = None,
+    on_event: Optional[EventCallback] = None,
+):
+    """
+    Async counterpart of _run_agents: coroutine agents are awaited, blocking ones go to the pool.
+    When on_event is given it sees each agent move queued -> running -> completed/timeout/failed.
+    """
+    loop = asyncio.get_running_loop()
+    inputs = _agent_inputs(norm, geography)
+    started = time.perf_counter()
+
+    def emit(name: str, status: str, **extra) -> None:
+        if on_event is not None:
+            on_event(_event(name, status, started, **extra))
+
+    async def _one(name, fn, keys):
+        args = [inputs[k] for k in keys]
+        if inspect.iscoroutinefunction(fn):
+            emit(name, "running")
+            call = _timed_coro(fn(*args))
+        else:
+            def _call():
+                # Runs on a pool thread: hop back to the loop to report the start.
+                loop.call_soon_threadsafe(emit, name, "running")
+                return _timed_call(fn, *args)
+
+            call = loop.run_in_executor(_AGENT_POOL, _call)
+        try:
+            result, duration_ms = await asyncio.wait_for(call, timeout=_agent_timeout(name, timeouts))
+            status = _status("completed", duration_ms)
+        except asyncio.TimeoutError:
+            result, status = None, _status("timeout", _elapsed_ms(started), "Agent exceeded its deadline.")
+        except Exception as exc:
+            result, status = None, _status("failed", _elapsed_ms(started), f"{type(exc).__name__}: {exc}")
+        emit(name, **status)
+        return name, result, status
+
+    for name, _, _ in WORKER_AGENTS:
+        emit(name, "queued")
+
+    outputs: Dict[str, dict] = {}
+    statuses: Dict[str, dict] = {}
+    for name, result, status in await asyncio.gather(*(_one(*spec) for spec in WORKER_AGENTS)):
+        if result is not None:
+            outputs[name] = result
+        statuses[name] = status
+    return outputs, statuses
+
+
+def run_orchestration(query: str, geography: str, timeouts: Optional[Dict[str, float]] = None) -> dict:
     """
     Master Orchestration Agent — delegation + aggregation.
-    Calls 5 worker agents and aggregates outputs into a report-ready structure.
+    Calls 5 worker agents concurrently and aggregates outputs into a report-ready structure.
+    Agents that miss their deadline or fail are reported in `agent_status` and left out.
     """
+    started = time.perf_counter()
     norm = normalize_query(query)
-    drug = norm["drug"]
-    indication = norm["repurposing_target"]
+    normalized = time.perf_counter()
+    outputs, statuses = _run_agents(norm, geography, timeouts)
+    aggregated = time.perf_counter()
+    report = _aggregate(norm, outputs, statuses)
+    _record_timings(report, started, normalized, aggregated, "sync")
+    return report
+
 
-    clinical = run_clinical_trials_agent(drug, indication)
-    web = run_web_intelligence_agent(geography, indication)
-    patent = run_patent_landscape_agent(drug, indication)
-    market = run_iqvia_insights_agent(geography, indication)
-    internal = run_internal_knowledge_agent(drug, indication)
+def _record_timings(report: dict, started: float, normalized: float, aggregated: float, mode: str) -> None:
+    """Stores phase timings on the report and feeds the latency histograms."""
+    finished = time.perf_counter()
+    report["timings"] = {
+        "normalize_ms": round((normalized - started) * 1000, 3),
+        "agents_ms": round((aggregated - normalized) * 1000, 3),
+        "aggregate_ms": round((finished - aggregated) * 1000, 3),
+        "total_ms": round((finished - started) * 1000, 3),
+    }
+    for name, st in report["agent_status"].items():
+        AGENT_DURATION.observe(st["duration_ms"] / 1000, agent=name, status=st["status"])
+    ORCHESTRATION_DURATION.observe(finished - started, mode=mode)
+
+
+async def run_orchestration_async(
+    query: str,
+    geography: str,
+    timeouts: Optional[Dict[str, float]] = None,
+    on_event: Optional[EventCallback] = None,
+    norm: Optional[dict] = None,
+) -> dict:
+    """
+    Async variant of run_orchestration for use from event-loop code (e.g. async endpoints).
+    on_event receives live progress for the master agent, each worker and the report generator.
+    A precomputed `norm` (see normalize_pair) skips query parsing.
+    """
+    started = time.perf_counter()
+    norm = norm or normalize_query(query)
+    normalized = time.perf_counter()
+    if on_event is not None:
+        on_event(_event(MASTER_AGENT, "completed", started, duration_ms=round(_elapsed_ms(started), 3)))
+    outputs, statuses = await _run_agents_async(norm, geography, timeouts, on_event)
+    aggregated = time.perf_counter()
+    report = _aggregate(norm, outputs, statuses)
+    _record_timings(report, started, normalized, aggregated, "async")
+    if on_event is not None:
+        on_event(_event(REPORT_AGENT, "completed", started, duration_ms=report["timings"]["aggregate_ms"]))
+    return report
+
+
+# Whole-report cache shared by /analyze and the PDF endpoints (and, with
+# INDICURE_CACHE_BACKEND=sqlite, by every worker process on the host).
+orchestration_cache = make_cache(
+    maxsize=int(os.getenv("INDICURE_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("INDICURE_CACHE_TTL", "900")),
+    name="orchestration",
+)
+
+
+# Reports in which an agent timed out or failed are only cached this long (0 disables),
+# so one slow upstream does not pin an empty section until the normal TTL expires.
+DEGRADED_CACHE_TTL = float(os.getenv("INDICURE_DEGRADED_CACHE_TTL", "5"))
+
+
+def is_degraded(report: dict) -> bool:
+    return any(st.get("status") != "completed" for st in report.get("agent_status", {}).values())
+
+
+def cache_for_report(cache: TTLCache, key, report: dict, value=_UNSET) -> None:
+    """
+    Stores `value` (default: the report itself) under the cache's TTL, or under
+    DEGRADED_CACHE_TTL when the report it derives from is degraded. Used for the
+    report and for everything rendered from it (payloads, PDFs).
+    """
+    value = report if value is _UNSET else value
+    if not is_degraded(report):
+        cache.set(key, value)
+    elif DEGRADED_CACHE_TTL > 0:
+        cache.set(key, value, ttl=DEGRADED_CACHE_TTL)
 
-    executive_summary = (
+
+def agent_caches() -> Dict[str, TTLCache]:
+    return {name: fn.cache for name, fn, _ in WORKER_AGENTS if hasattr(fn, "cache")}
+
+
+def orchestration_key(query: str, geography: str, mode: str = "General", norm: Optional[dict] = None) -> Tuple:
+    """Cache key: the normalized query (not the raw text) plus geography and mode."""
+    norm = norm or normalize_query(query)
+    return tuple(sorted(norm.items())), geography, mode
+
+
+def get_orchestration(query: str, geography: str, mode: str = "General") -> dict:
+    """
+    Cached run_orchestration. Returns a private copy, so callers may annotate
+    the report (e.g. analysis_mode) without touching the cached entry.
+    """
+    key = orchestration_key(query, geography, mode)
+    report = orchestration_cache.get(key)
+    if report is None:
+        report = run_orchestration(query, geography)
+        cache_for_report(orchestration_cache, key, report)
+    return copy.deepcopy(report)
+
+
+async def get_orchestration_async(
+    query: str,
+    geography: str,
+    mode: str = "General",
+    on_event: Optional[EventCallback] = None,
+    norm: Optional[dict] = None,
+) -> dict:
+    """
+    Async counterpart of get_orchestration. On a cache hit, on_event is replayed
+    from the cached agent_status with "cached": True. Passing `norm` instead of
+    query text shares the cache entry with any query that normalizes to it.
+    """
+    key = orchestration_key(query, geography, mode, norm)
+    report = orchestration_cache.get(key)
+    if report is None:
+        report = await run_orchestration_async(query, geography, on_event=on_event, norm=norm)
+        cache_for_report(orchestration_cache, key, report)
+    elif on_event is not None:
+        timings = report.get("timings", {})
+        overall = {
+            MASTER_AGENT: {"status": "completed", "duration_ms": timings.get("normalize_ms")},
+            REPORT_AGENT: {"status": "completed", "duration_ms": timings.get("aggregate_ms")},
+        }
+        for agent in (MASTER_AGENT, *report["agent_status"], REPORT_AGENT):
+            status = report["agent_status"].get(agent) or overall[agent]
+            on_event({"agent": agent, "elapsed_ms": 0.0, "cached": True, **status})
+    return copy.deepcopy(report)
+
+
+# Hand-written narrative for the reference pair; every other pair gets one built by _narrative().
+_CURATED_NARRATIVES: Dict[Tuple[str, str], Tuple[str, str, List[dict]]] = {
+    (DEFAULT_DRUG, DEFAULT_INDICATION): (
         "Ranolazine, approved for chronic angina, demonstrates strong mechanistic and clinical potential "
         "for repurposing in HFpEF: a major, undertreated cardiac condition in India. "
         "Clinical evidence shows statistically significant improvement in diastolic indices without "
         "hemodynamic compromise. Given the therapy gap in Indian HFpEF guidance and Ranolazine’s favorable "
-        "safety and cost profile, it is a viable mechanism-driven repurposing candidate."
+        "safety and cost profile, it is a viable mechanism-driven repurposing candidate.",
+        "Proceed with targeted Phase II/III Indian clinical trials evaluating Ranolazine as an adjunct therapy "
+        "for HFpEF, prioritizing diastolic function endpoints (E/E′, LVEDV), symptoms/quality of life, and "
+        "hospitalization reduction; stratify patients by phenotype and comorbidities.",
+        [
+            {"title": "HFpEF Guidelines (JAPI 2022)", "url": "https://heartfailure.org.in/assets/Uploads/guidelines/HFPEF_Guidelines_JAPI_2022.pdf"},
+            {"title": "HFpEF India Review (2025)", "url": "https://journals.lww.com/jicc/fulltext/2025/04000/heart_failure_with_preserved_ejection_fraction_in.2.aspx"},
+            {"title": "Clinical evidence summary (HFpEF/Ranolazine meta-analysis)", "url": "https://pmc.ncbi.nlm.nih.gov/articles/PMC9947928/"},
+            {"title": "Ranolazine mechanism overview (AJC abstract)", "url": "https://www.ajconline.org/article/S0002-9149(23)01060-3/abstract"},
+            {"title": "RALI-DHF proof-of-concept (JACC HF 2013)", "url": "https://www.sciencedirect.com/science/article/pii/S2213177913000383"}
+        ],
+    ),
+}
+
+
+def _narrative(norm: dict, clinical: dict, web: dict, patent: dict, internal: dict) -> Tuple[str, str, List[dict]]:
+    """Executive summary, recommendation and references for any pair, from the agents' own findings."""
+    drug, indication, geography = norm["drug"], norm["repurposing_target"], norm["geography"]
+    findings = clinical.get("key_findings") or []
+    has_mechanism = bool(internal.get("paths"))
+
+    summary = [
+        f"{drug}" + (f", approved for {norm['current_use']}," if norm.get("current_use") else "")
+        + f" was assessed for repurposing in {indication} ({geography})."
+    ]
+    if findings:
+        summary.append(f"Clinical evidence: {findings[0]}")
+    else:
+        summary.append(f"No curated clinical evidence links {drug} to {indication}.")
+    summary.append(
+        f"A mechanistic path from {drug} to {indication} is on record in the knowledge graph."
+        if has_mechanism else "No mechanistic link is on record in the knowledge graph."
     )
+    if "fto_risk" in patent:
+        summary.append(f"Freedom-to-operate risk: {patent['fto_risk']}")
+
+    if findings:
+        recommendation = (
+            f"Proceed with targeted Phase II/III clinical trials in {geography} evaluating {drug} as an adjunct "
+            f"therapy for {indication}, building on the endpoints that reached significance."
+        )
+    elif has_mechanism:
+        recommendation = (
+            f"Generate proof-of-concept evidence (preclinical and early Phase II) for {drug} in {indication} "
+            f"before committing to a larger {geography} trial program."
+        )
+    else:
+        recommendation = (
+            f"Do not prioritize {drug} for {indication} until new mechanistic or clinical evidence emerges."
+        )
+
+    # Same {title, url} shape as the curated references; corpus documents carry no URL.
+    references = [{"title": str(title), "url": ""} for title in web.get("sources", [])]
+    return " ".join(summary), recommendation, references
+
+
+def _aggregate(norm: dict, outputs: Dict[str, dict], statuses: Dict[str, dict]) -> dict:
+    """Aggregates worker outputs; missing agents degrade to empty sections instead of failing the report."""
+    clinical = outputs.get("Clinical Trials Agent", {})
+    web = outputs.get("Web Intelligence Agent", {})
+    patent = outputs.get("Patent Landscape Agent", {})
+    market = outputs.get("IQVIA Insights Agent", {})
+    internal = outputs.get("Internal Knowledge Agent", {})
 
     risk_feasibility = {
-        "patent_risk": patent["fto_risk"],
-        "patent_notes": patent["status"],
+        "patent_risk": patent.get("fto_risk", "Unknown (patent agent unavailable)."),
+        "patent_notes": patent.get("status", "Patent landscape not available for this run."),
         "regulatory_path": "Supplemental indication pathway (conceptual; depends on regulator and evidence).",
         "cost_profile": "Favorable (repurposed small molecule).",
         "market_notes": market
     }
 
-    recommendation = (
-        "Proceed with targeted Phase II/III Indian clinical trials evaluating Ranolazine as an adjunct therapy "
-        "for HFpEF, prioritizing diastolic function endpoints (E/E′, LVEDV), symptoms/quality of life, and "
-        "hospitalization reduction; stratify patients by phenotype and comorbidities."
-    )
-
-    references = [
-        {"title": "HFpEF Guidelines (JAPI 2022)", "url": "https://heartfailure.org.in/assets/Uploads/guidelines/HFPEF_Guidelines_JAPI_2022.pdf"},
-        {"title": "HFpEF India Review (2025)", "url": "https://journals.lww.com/jicc/fulltext/2025/04000/heart_failure_with_preserved_ejection_fraction_in.2.aspx"},
-        {"title": "Clinical evidence summary (HFpEF/Ranolazine meta-analysis)", "url": "https://pmc.ncbi.nlm.nih.gov/articles/PMC9947928/"},
-        {"title": "Ranolazine mechanism overview (AJC abstract)", "url": "https://www.ajconline.org/article/S0002-9149(23)01060-3/abstract"},
-        {"title": "RALI-DHF proof-of-concept (JACC HF 2013)", "url": "https://www.sciencedirect.com/science/article/pii/S2213177913000383"}
-    ]
+    curated = _CURATED_NARRATIVES.get((norm["drug"], norm["repurposing_target"]))
+    if curated is not None:
+        executive_summary, recommendation, references = curated
+        references = [dict(ref) for ref in references]
+    else:
+        executive_summary, recommendation, references = _narrative(norm, clinical, web, patent, internal)
 
     return {
         "normalized": norm,
@@ -77,6 +510,7 @@ def run_orchestration(query: str, geography: str) -> dict:
             "IQVIA Insights Agent": market,
             "Internal Knowledge Agent": internal
         },
+        "agent_status": statuses,
         "executive_summary": executive_summary,
         "evidence": {
             "clinical": clinical,
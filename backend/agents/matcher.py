@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """
+    Multi-pattern string matcher (Aho–Corasick automaton).
+
+    Patterns are added once, compiled with build(), and then every query is
+    scanned in a single pass: cost is linear in the text length plus the
+    number of matches, independent of how many patterns are loaded.
+    Matching is case-insensitive and, by default, restricted to whole words.
+    """
+
+    def __init__(self, whole_words: bool = True):
+        self.whole_words = whole_words
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]
+        self._built = False
+        self.size = 0
+
+    def add(self, pattern: str, value: Any) -> None:
+        pattern = pattern.lower().strip()
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(pattern), value))
+        self.size += 1
+        self._built = False
+
+    def build(self) -> "AhoCorasick":
+        """Computes failure links breadth-first and folds suffix outputs into each state."""
+        queue: List[int] = []
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        self._built = True
+        return self
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """Yields (start, end, value) for every pattern occurrence in text."""
+        if not self._built:
+            self.build()
+        text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, value in out[state]:
+                start, end = i - length + 1, i + 1
+                if self.whole_words and not _is_word_bounded(text, start, end):
+                    continue
+                yield start, end, value
+
+
+def _is_word_bounded(text: str, start: int, end: int) -> bool:
+    return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
@@ -1,3 +1,13 @@
+from datetime import date
+
+from agents.patent_index import get_patent_index
+
+PATENT_JURISDICTION = "IN"
+
+# Claim types that block a repurposed indication outright vs. ones that can be designed around.
+BLOCKING_CLAIMS = ("compound", "use")
+
+
 def run_patent_landscape_agent(drug: str, indication: str) -> dict:
     """
     Patent Landscape Agent
@@ -8,14 +18,57 @@ def run_patent_landscape_agent(drug: str, indication: str) -> dict:
 
     Working (prototype):
       - In production: PatentScope/Google Patents + expiry + FTO evaluation.
-      - Here: deterministic, demo-safe conclusion consistent with your narrative.
+      - Here: queries the local patent table (data/patents.csv) through an interval index
+        over patent terms (agents/patent_index.py) for patents in force in India today,
+        and derives FTO risk and indication claim density from those counts.
 
     Output:
       - Patent status + FTO risk + path forward.
     """
+    index = get_patent_index()
+    today = date.today()
+    in_force = index.in_force(drug, PATENT_JURISDICTION, today, use=indication)
+    blocking = [p for p in in_force if p["claim_type"] in BLOCKING_CLAIMS]
+    other = [p for p in in_force if p["claim_type"] not in BLOCKING_CLAIMS]
+
+    history = index.for_drug(drug)
+    use_claims = [p for p in history if p["claim_type"] == "use" and p["use"].lower() == indication.lower()]
+    use_in_force = [p for p in use_claims if p in in_force]
+
+    if blocking:
+        fto_risk = f"High ({len(blocking)} compound/use patent(s) in force in India)."
+    elif other:
+        fto_risk = f"Moderate ({len(other)} formulation/process patent(s) in force in India; design-around likely)."
+    else:
+        fto_risk = "Low (no patents covering this use in force in India)."
+
+    if not history:
+        status = f"No patent records on file for {drug}; landscape search required."
+    elif in_force:
+        status = (
+            f"{len(in_force)} relevant patent(s) in force in India; latest expiry {in_force[-1]['expiry_date']}."
+        )
+    else:
+        local = [p for p in history if p["jurisdiction"].upper() == PATENT_JURISDICTION]
+        latest = max(local or history, key=lambda p: p["expiry_date"])
+        status = (
+            f"Off-patent for this use in India (latest recorded {latest['jurisdiction']} expiry "
+            f"{latest['expiry_date']})."
+        )
+
     return {
-        "status": "Off-patent / near-expiry positioning (prototype assumption for demo).",
-        "hfpef_claim_density": "HFpEF-specific claims appear limited in high-level scan (prototype).",
-        "fto_risk": "Low (prototype).",
-        "feasibility": "Repurposing feasible via indication extension + evidence-backed labeling strategy."
-    }
\ No newline at end of file
+        "status": status,
+        "hfpef_claim_density": (
+            f"{len(use_claims)} {indication}-specific use claim(s) on record across jurisdictions, "
+            f"{len(use_in_force)} in force in India."
+        ),
+        "fto_risk": fto_risk,
+        "feasibility": (
+            "Repurposing feasible via indication extension + evidence-backed labeling strategy."
+            if not blocking else
+            "Repurposing requires licensing or awaiting expiry of blocking compound/use claims."
+        ),
+        "in_force_patents": [
+            {k: p[k] for k in ("patent_id", "claim_type", "use", "expiry_date", "title")} for p in in_force
+        ]
+    }
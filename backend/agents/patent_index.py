@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import csv
+import os
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+PATENTS_PATH = Path(os.getenv("INDICURE_PATENTS", DATA_DIR / "patents.csv"))
+
+
+class IntervalTree:
+    """
+    Static centered interval tree over half-open [start, end) integer intervals.
+
+    Built once in O(n log n); a stabbing query ("which intervals contain t")
+    costs O(log n + k) for k hits. Each node keeps its intervals sorted both by
+    start and by descending end so the scan stops at the first miss.
+    """
+
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, intervals: List[Tuple[int, int, int]]):
+        # intervals: (start, end, payload index). Empty intervals (end <= start) contain
+        # no point, so they are dropped. Centering on the median start keeps the tree
+        # balanced and guarantees that (non-empty) interval lands here, so recursion shrinks.
+        intervals = [iv for iv in intervals if iv[0] < iv[1]]
+        starts = sorted(s for s, _, _ in intervals)
+        self.center = starts[len(starts) // 2] if starts else 0
+        here, left, right = [], [], []
+        for iv in intervals:
+            if iv[1] <= self.center:
+                left.append(iv)
+            elif iv[0] > self.center:
+                right.append(iv)
+            else:
+                here.append(iv)
+        self.by_start = sorted(here, key=lambda iv: iv[0])
+        self.by_end = sorted(here, key=lambda iv: -iv[1])
+        self.left = IntervalTree(left) if left else None
+        self.right = IntervalTree(right) if right else None
+
+    def stab(self, t: int) -> List[int]:
+        hits: List[int] = []
+        node: Optional[IntervalTree] = self
+        while node is not None:
+            if t < node.center:
+                for s, _, idx in node.by_start:
+                    if s > t:
+                        break
+                    hits.append(idx)
+                node = node.left
+            elif t > node.center:
+                for _, e, idx in node.by_end:
+                    if e <= t:
+                        break
+                    hits.append(idx)
+                node = node.right
+            else:
+                hits.extend(idx for _, _, idx in node.by_start)
+                break
+        return hits
+
+
+class PatentIndex:
+    """
+    Patent records grouped by (drug, jurisdiction), each group with an interval
+    tree over the patent term [priority_date, expiry_date). Answers "which
+    patents on drug X are in force in jurisdiction J at date T" in logarithmic
+    time, then filters on claim scope.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, str]]):
+        self.records: List[Dict[str, str]] = []
+        groups: Dict[Tuple[str, str], List[Tuple[int, int, int]]] = {}
+        self._by_drug: Dict[str, List[int]] = {}
+        for rec in records:
+            idx = len(self.records)
+            self.records.append(rec)
+            start = date.fromisoformat(rec["priority_date"]).toordinal()
+            end = date.fromisoformat(rec["expiry_date"]).toordinal()
+            key = (rec["drug"].lower(), rec["jurisdiction"].upper())
+            groups.setdefault(key, []).append((start, end, idx))
+            self._by_drug.setdefault(rec["drug"].lower(), []).append(idx)
+        self._trees = {key: IntervalTree(ivs) for key, ivs in groups.items()}
+
+    @classmethod
+    def from_csv(cls, path: Path = PATENTS_PATH) -> "PatentIndex":
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls(list(csv.DictReader(f)))
+
+    @staticmethod
+    def covers(rec: Dict[str, str], use: Optional[str]) -> bool:
+        """Compound/formulation/process claims cover every use; use claims only their own indication."""
+        if rec["claim_type"] != "use" or use is None:
+            return True
+        return rec["use"].lower() == use.lower()
+
+    def in_force(self, drug: str, jurisdiction: str, at: date, use: Optional[str] = None) -> List[Dict[str, str]]:
+        tree = self._trees.get((drug.lower(), jurisdiction.upper()))
+        if tree is None:
+            return []
+        hits = (self.records[i] for i in tree.stab(at.toordinal()))
+        return sorted((r for r in hits if self.covers(r, use)), key=lambda r: r["expiry_date"])
+
+    def for_drug(self, drug: str) -> List[Dict[str, str]]:
+        return [self.records[i] for i in self._by_drug.get(drug.lower(), [])]
+
+
+@lru_cache(maxsize=1)
+def get_patent_index() -> PatentIndex:
+    return PatentIndex.from_csv()
@@ -1,26 +1,34 @@
 from __future__ import annotations
 
+import os
+import re
+import tempfile
+import time
+from functools import lru_cache
+from xml.sax.saxutils import escape
 from io import BytesIO
-from typing import Any, Dict, List, Optional
-
-import matplotlib
-matplotlib.use("Agg")
-
-import matplotlib.pyplot as plt
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
 
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.shapes import Drawing, Group, String
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib import colors
 from reportlab.platypus import (
+    Flowable,
     SimpleDocTemplate,
     Paragraph,
     Spacer,
     Table,
+    LongTable,
     TableStyle,
     Image,
     PageBreak,
 )
 from reportlab.lib.units import inch
+from reportlab.pdfgen.canvas import Canvas
+
+from metrics import PDF_PHASE_DURATION, span
 
 
 def _p(text: str, style: ParagraphStyle) -> Paragraph:
@@ -42,10 +50,13 @@ def _make_wrapped_table(
     col_widths: List[int],
     styles: Dict[str, ParagraphStyle],
     header_bg=colors.HexColor("#E6E6E6"),
+    long: bool = False,
 ) -> Table:
     """
     Wraps ALL cell content using Paragraph so text stays inside cells.
+    long=True builds a LongTable, which splits across many pages in linear time.
     """
+    started = time.perf_counter()
     data: List[List[Any]] = []
 
     header_row = [_p(f"<b>{h}</b>", styles["cell_header"]) for h in headers]
@@ -60,7 +71,7 @@ def _make_wrapped_table(
                 wrapped.append(_p(str(cell) if cell is not None else "", styles["cell"]))
         data.append(wrapped)
 
-    t = Table(data, colWidths=col_widths, repeatRows=1)
+    t = (LongTable if long else Table)(data, colWidths=col_widths, repeatRows=1)
     t.setStyle(
         TableStyle(
             [
@@ -74,10 +85,98 @@ def _make_wrapped_table(
             ]
         )
     )
+    PDF_PHASE_DURATION.observe(time.perf_counter() - started, phase="tables")
     return t
 
 
+# "vector" draws charts with reportlab.graphics; "matplotlib" keeps the old PNG path.
+CHART_BACKEND = os.getenv("INDICURE_CHART_BACKEND", "vector")
+
+CHART_WIDTH = 6.5 * inch
+CHART_HEIGHT = 3.25 * inch
+
+
+def _bar_chart_drawing(title: str, labels: Tuple[str, ...], values: Tuple[float, ...], ylabel: str) -> Drawing:
+    """Native ReportLab bar chart, embedded as vector graphics."""
+    d = Drawing(CHART_WIDTH, CHART_HEIGHT)
+
+    bc = VerticalBarChart()
+    bc.x = 70
+    bc.y = 40
+    bc.width = CHART_WIDTH - 100
+    bc.height = CHART_HEIGHT - 85
+    bc.data = [list(values)]
+    bc.categoryAxis.categoryNames = list(labels)
+    bc.categoryAxis.labels.fontName = "Helvetica"
+    bc.categoryAxis.labels.fontSize = 9
+    bc.valueAxis.valueMin = 0
+    bc.valueAxis.valueMax = max(values) * 1.25 if values and max(values) > 0 else 1
+    bc.valueAxis.labels.fontName = "Helvetica"
+    bc.valueAxis.labels.fontSize = 9
+    bc.bars[0].fillColor = colors.HexColor("#1F77B4")
+    bc.bars[0].strokeColor = None
+    bc.barWidth = 10
+    bc.groupSpacing = 25
+    d.add(bc)
+
+    d.add(String(CHART_WIDTH / 2, CHART_HEIGHT - 22, title,
+                 fontName="Helvetica-Bold", fontSize=12, textAnchor="middle"))
+
+    y_label = Group(String(0, 0, ylabel, fontName="Helvetica", fontSize=9, textAnchor="middle"))
+    y_label.translate(25, bc.y + bc.height / 2)
+    y_label.rotate(90)
+    d.add(y_label)
+
+    return d.expandUserNodes()
+
+
+@lru_cache(maxsize=128)
+def _bar_chart_vector(title: str, labels: Tuple[str, ...], values: Tuple[float, ...], ylabel: str) -> _Recording:
+    """
+    Memoized on the chart data as a recording: the drawing is rendered once and
+    builds replay its operators (drawing a shared Drawing is not thread-safe,
+    the renderer tags its groups while walking them).
+    """
+    return _Recording(lambda: _bar_chart_drawing(title, labels, values, ylabel))
+
+
+def _bar_chart(title: str, labels: List[str], values: List[float], ylabel: str):
+    """Chart flowable for the story: vector drawing by default, matplotlib PNG as fallback."""
+    if CHART_BACKEND != "matplotlib":
+        try:
+            return _Replay(_bar_chart_vector(title, tuple(labels), tuple(values), ylabel))
+        except Exception:
+            pass
+    img_buf = _bar_chart_png(title=title, labels=labels, values=values, ylabel=ylabel)
+    return Image(img_buf, width=CHART_WIDTH, height=CHART_HEIGHT)
+
+
+def _is_series(vals: Any) -> bool:
+    """A chartable series: a non-empty {label: int | float} dict (bools and strings don't count)."""
+    return (
+        isinstance(vals, dict) and bool(vals)
+        and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in vals.values())
+    )
+
+
+def _chart_series(charts: Dict[str, Any], demo: bool = True) -> List[Tuple[str, Dict[str, Any]]]:
+    """LVEDV first (with its demo default for the demo pair), then any other {label: number} series in report["charts"]."""
+    series = []
+    lvedv = charts.get("lvedv_change_ml", {"Placebo": 0, "Ranolazine": 33.34} if demo else None)
+    if _is_series(lvedv):
+        series.append(("lvedv_change_ml", lvedv))
+    for key, vals in charts.items():
+        if key != "lvedv_change_ml" and _is_series(vals):
+            series.append((key, vals))
+    return series
+
+
 def _bar_chart_png(title: str, labels: List[str], values: List[float], ylabel: str) -> BytesIO:
+    # matplotlib is optional: only imported when the PNG backend is actually used.
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(6.4, 3.2))  # ~A4-friendly
     ax.bar(labels, values)
     ax.set_title(title)
@@ -92,37 +191,19 @@ def _bar_chart_png(title: str, labels: List[str], values: List[float], ylabel: s
     return buf
 
 
-def build_pdf(report: dict) -> bytes:
-    """
-    Main PDF builder used by FastAPI endpoint.
+# Large-report mode kicks in above either threshold (table rows / raw appendix characters).
+LARGE_REPORT_ROWS = int(os.getenv("INDICURE_PDF_LARGE_ROWS", "100"))
+LARGE_REPORT_CHARS = int(os.getenv("INDICURE_PDF_LARGE_CHARS", "16384"))
+APPENDIX_CHUNK_CHARS = 2048
+TABLE_CHUNK_ROWS = 100
+# build_pdf_spooled keeps output up to this size in memory, then spills to a temp file.
+PDF_SPOOL_BYTES = int(os.getenv("INDICURE_PDF_SPOOL_BYTES", str(8 * 1024 * 1024)))
 
-    Expected (flexible) report structure:
-      - executive_summary: str
-      - signal_dashboard: [{metric, rating, rationale}]
-      - clinical_outcomes: [{parameter, result, p_value}]
-      - feasibility: [str]  OR str
-      - recommendation: str
-      - conclusion: str (optional; will auto-generate if missing)
-      - limitations: [str] (optional)
-      - references: [{title, url}] OR ["..."] (we’ll handle both)
-      - charts: optional dict of chart data
-    """
-    buffer = BytesIO()
-
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=40,
-        leftMargin=40,
-        topMargin=40,
-        bottomMargin=40,
-        title="IndiCure AI – Drug Repurposing Report",
-        author="IndiCure AI",
-    )
 
+def _build_styles() -> Dict[str, ParagraphStyle]:
     base = getSampleStyleSheet()
 
-    styles = {
+    return {
         "title": ParagraphStyle(
             "title",
             parent=base["Title"],
@@ -200,151 +281,529 @@ def build_pdf(report: dict) -> bytes:
         ),
     }
 
+
+# The pair the demo defaults below describe. Reports for any other pair (per
+# report["normalized"]) never fall back to them; reports without it are the demo.
+DEMO_DRUG, DEMO_INDICATION, DEMO_GEOGRAPHY = "Ranolazine", "HFpEF", "India"
+
+# Static sections used when the report does not supply its own.
+DEFAULT_SIGNAL_DASHBOARD = [
+    {"metric": "Clinical Signal", "rating": "Positive", "rationale": "Reported diastolic-function improvements with tolerated hemodynamics in referenced endpoints."},
+    {"metric": "Safety", "rating": "Favorable", "rationale": "No major BP/HR changes reported; QT signal not elevated in the summarized evidence set."},
+    {"metric": "Patent Risk", "rating": "Low", "rationale": "Repurposing typically reduces FTO risk versus de novo development; monitor any formulation/use claims."},
+    {"metric": "India Unmet Need", "rating": "High", "rationale": "HFpEF remains underdiagnosed and undertreated; accessible options and evidence generation are needed."},
+]
+DEFAULT_CLINICAL_OUTCOMES = [
+    {"parameter": "LVEDV", "result": "↑ Significant improvement", "p_value": "&lt; 0.001"},
+    {"parameter": "E/E′", "result": "↓ Improved diastolic function", "p_value": "0.05"},
+    {"parameter": "Blood Pressure / HR", "result": "No meaningful change", "p_value": "&gt; 0.05"},
+    {"parameter": "QT Interval", "result": "No prolongation signal", "p_value": "0.27"},
+]
+DEFAULT_FEASIBILITY = [
+    "Off-patent or reduced exclusivity risk profile relative to novel entities (confirm claim scope).",
+    "Oral administration supports outpatient adoption and affordability assumptions.",
+    "Regulatory pathway may be supplemental indication (jurisdiction-specific validation required).",
+]
+DEFAULT_RECOMMENDATION = (
+    "Proceed with targeted Phase II/III Indian clinical trials evaluating Ranolazine as adjunct therapy for HFpEF, "
+    "focusing on diastolic endpoints and hospitalization reduction."
+)
+DEFAULT_CONCLUSION = (
+    "Overall, the current evidence suggests a positive clinical signal for diastolic-function improvement "
+    "with a favorable tolerability profile in the summarized datasets. The primary value-creation step is "
+    "a well-designed India-focused clinical program with clearly defined HFpEF phenotyping, diastolic endpoints, "
+    "and pragmatic outcomes (including hospitalization and functional status)."
+)
+DEFAULT_LIMITATIONS = [
+    "Evidence summarized here may include heterogeneous study designs and endpoints; external validation required.",
+    "Signal strength depends on patient phenotyping and comparators; India-specific epidemiology may differ.",
+    "Patent/FTO requires a dedicated legal search for jurisdictional claims and formulation/use patents.",
+]
+
+SIGNAL_DASHBOARD_COLUMNS = (["Metric", "Rating", "Rationale"], [120, 90, 305])
+CLINICAL_OUTCOME_COLUMNS = (["Parameter", "Result", "p-value"], [140, 275, 100])
+
+
+_FONT_SELECT = re.compile(r"(/F\d+)( [0-9.]+ Tf)")
+
+
+class _Recording:
+    """
+    A static flowable laid out and drawn once per frame width. The PDF operators
+    of the draw are stored with the font references factored out, so replaying
+    them into another document only needs the fonts registered there. Immutable
+    once recorded, so one recording is shared by every build and every thread.
+    """
+
+    def __init__(self, factory: Callable[[], Flowable]):
+        self.factory = factory
+        self._layouts: Dict[float, tuple] = {}
+        # Frames ask for spacing before wrapping, so take it (and alignment) from a probe now.
+        probe = factory()
+        self.space_before = probe.getSpaceBefore()
+        self.space_after = probe.getSpaceAfter()
+        self.h_align = getattr(probe, "hAlign", "CENTER")
+
+    def layout(self, availWidth: float, availHeight: float) -> tuple:
+        layout = self._layouts.get(availWidth)
+        if layout is None:
+            flowable = self.factory()
+            width, height = flowable.wrap(availWidth, availHeight)
+            canvas = Canvas(BytesIO())
+            start = len(canvas._code)
+            flowable._drawOn(canvas)
+            internal = {v: k for k, v in canvas._doc.fontMapping.items()}
+            parts = _FONT_SELECT.split("\n".join(canvas._code[start:]))
+            # split() alternates text, font reference, "<size> Tf": keep the text and map references to font names.
+            ops = tuple((parts[i], internal.get(parts[i + 1]), parts[i + 2]) for i in range(0, len(parts) - 1, 3))
+            # Drawing can raise the document's minimum PDF version (e.g. setting fill alpha
+            # marks it 1.4); a replay has to do the same for identical output.
+            layout = self._layouts[availWidth] = (width, height, ops, parts[-1], canvas._doc._pdfVersion)
+        return layout
+
+
+class _Replay(Flowable):
+    """
+    One use of a _Recording in a story. Wrapping looks up the recorded size and
+    drawing replays the recorded operators; a split (the section straddles a page
+    break) falls back to a freshly built flowable.
+    """
+
+    def __init__(self, recording: _Recording):
+        super().__init__()
+        self._recording = recording
+        self._layout: Optional[tuple] = None
+        self.hAlign = recording.h_align
+
+    def wrap(self, availWidth, availHeight):
+        self._layout = self._recording.layout(availWidth, availHeight)
+        self.width, self.height = self._layout[:2]
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        flowable = self._recording.factory()
+        flowable.wrap(availWidth, availHeight)
+        return flowable.split(availWidth, availHeight)
+
+    def getSpaceBefore(self):
+        return self._recording.space_before
+
+    def getSpaceAfter(self):
+        return self._recording.space_after
+
+    def draw(self):
+        _, _, ops, tail, pdf_version = self._layout
+        doc = self.canv._doc
+        doc._pdfVersion = max(doc._pdfVersion, pdf_version)
+        fonts = doc.getInternalFontName
+        self.canv._code.append("".join(text + fonts(font) + size for text, font, size in ops) + tail)
+
+
+class ReportTemplate:
+    """
+    The request-independent parts of a report, compiled once per process: the
+    style sheet, headings, and the default sections (signal dashboard and outcome
+    tables, feasibility, recommendation, conclusion, limitations). Each is parsed,
+    laid out and drawn once; later builds replay the recorded PDF operators, so
+    a build only lays out the sections the report actually supplies.
+    """
+
+    def __init__(self):
+        self.styles = _build_styles()
+        self._headings: Dict[str, _Recording] = {}
+        self._sections: Dict[str, List[_Recording]] = {
+            "title": [self._paragraph("IndiCure AI – Drug Repurposing Report", "title")],
+            "signal_dashboard": [self._table(
+                *SIGNAL_DASHBOARD_COLUMNS,
+                [[d["metric"], d["rating"], d["rationale"]] for d in DEFAULT_SIGNAL_DASHBOARD],
+            )],
+            "clinical_outcomes": [self._table(
+                *CLINICAL_OUTCOME_COLUMNS,
+                [[d["parameter"], d["result"], d["p_value"]] for d in DEFAULT_CLINICAL_OUTCOMES],
+            )],
+            "feasibility": [self._paragraph(f"• {item}", "bullet") for item in DEFAULT_FEASIBILITY],
+            "recommendation": [self._paragraph(DEFAULT_RECOMMENDATION, "normal")],
+            "conclusion": [self._paragraph(DEFAULT_CONCLUSION, "normal")],
+            "limitations": [self._paragraph(f"• {item}", "bullet") for item in DEFAULT_LIMITATIONS],
+            "no_references": [self._paragraph("No references available.", "normal")],
+            "no_signal_dashboard": [self._paragraph("No signal dashboard was supplied for this report.", "normal")],
+            "no_clinical_outcomes": [self._paragraph(
+                "No clinical outcomes are on record for this drug and indication.", "normal"
+            )],
+            "no_recommendation": [self._paragraph("No recommendation available.", "normal")],
+            "no_conclusion": [self._paragraph(
+                "No separate conclusion was supplied; see the executive summary and recommendation.", "normal"
+            )],
+            "appendix_note": [self._paragraph(
+                "This section contains unedited agent text for auditability and traceability.", "muted"
+            )],
+        }
+
+    def _paragraph(self, text: str, style: str) -> _Recording:
+        return _Recording(lambda: Paragraph(text, self.styles[style]))
+
+    def _table(self, headers: List[str], col_widths: List[int], rows: List[List[str]]) -> _Recording:
+        return _Recording(lambda: _make_wrapped_table(
+            headers=headers, rows=rows, col_widths=col_widths, styles=self.styles,
+        ))
+
+    def section(self, name: str) -> List[Flowable]:
+        """Flowables of a default section, ready to append to one story."""
+        return [_Replay(r) for r in self._sections[name]]
+
+    def heading(self, text: str) -> Flowable:
+        if text not in self._headings:
+            self._headings[text] = self._paragraph(text, "h1")
+        return _Replay(self._headings[text])
+
+
+@lru_cache(maxsize=1)
+def get_report_template() -> ReportTemplate:
+    return ReportTemplate()
+
+
+def report_subject(report: dict) -> Tuple[str, str, str]:
+    """(drug, indication, geography) of a report, from report["normalized"]; the demo pair if absent."""
+    norm = report.get("normalized")
+    norm = norm if isinstance(norm, dict) else {}
+    return (
+        norm.get("drug") or DEMO_DRUG,
+        norm.get("repurposing_target") or DEMO_INDICATION,
+        norm.get("geography") or DEMO_GEOGRAPHY,
+    )
+
+
+def _endpoint_rows(report: dict) -> List[List[str]]:
+    """Clinical outcome rows from the Clinical Trials Agent's endpoints (plain text, so escaped)."""
+    evidence = report.get("evidence")
+    clinical = evidence.get("clinical") if isinstance(evidence, dict) else None
+    endpoints = clinical.get("endpoints") if isinstance(clinical, dict) else None
+    return [
+        [escape(str(e.get(k, ""))) for k in ("metric", "result", "significance")]
+        for e in (endpoints if isinstance(endpoints, list) else [])
+        if isinstance(e, dict)
+    ]
+
+
+def is_large_report(report: dict) -> bool:
+    rows = max(
+        len(x) if isinstance(x, list) else 0
+        for x in (report.get("signal_dashboard"), report.get("clinical_outcomes"), report.get("references"))
+    )
+    return rows > LARGE_REPORT_ROWS or len(str(report.get("raw_agent_output") or "")) > LARGE_REPORT_CHARS
+
+
+class _Deferred(Flowable):
+    """
+    Placeholder that builds its real flowable on first wrap. doc.build drops
+    flowables once laid out, so in a story of deferred chunks only the chunk
+    being laid out holds parsed paragraphs and table cells.
+    """
+
+    def __init__(self, factory, hAlign: str = "CENTER"):
+        super().__init__()
+        self._factory = factory
+        self._flowable: Optional[Flowable] = None
+        self.hAlign = hAlign
+
+    @property
+    def flowable(self) -> Flowable:
+        if self._flowable is None:
+            self._flowable = self._factory()
+        return self._flowable
+
+    def wrap(self, availWidth, availHeight):
+        self.width, self.height = self.flowable.wrap(availWidth, availHeight)
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        return self.flowable.split(availWidth, availHeight)
+
+    def draw(self):
+        self.flowable.drawOn(self.canv, 0, 0)
+
+    def getSpaceBefore(self):
+        return self.flowable.getSpaceBefore()
+
+    def getSpaceAfter(self):
+        return self.flowable.getSpaceAfter()
+
+
+def _table_flowables(
+    headers: List[str],
+    rows: List[List[Any]],
+    col_widths: List[int],
+    styles: Dict[str, ParagraphStyle],
+    large: bool,
+) -> List[Flowable]:
+    """One table, or in large-report mode deferred LongTables of TABLE_CHUNK_ROWS rows each (header repeated)."""
+    if not large:
+        return [_make_wrapped_table(headers=headers, rows=rows, col_widths=col_widths, styles=styles)]
+    return [
+        _Deferred(lambda chunk=rows[i:i + TABLE_CHUNK_ROWS]: _make_wrapped_table(
+            headers=headers, rows=chunk, col_widths=col_widths, styles=styles, long=True,
+        ))
+        for i in range(0, len(rows), TABLE_CHUNK_ROWS)
+    ]
+
+
+# Paragraph markup the appendix splitter must never cut through: tags, entities, line breaks, spaces.
+_APPENDIX_TOKEN = re.compile(r"(<[^>]*>|&#?\w+;|\n| )")
+_TAG_NAME = re.compile(r"</?\s*([A-Za-z]\w*)")
+
+
+def _appendix_chunks(raw: str, size: int = APPENDIX_CHUNK_CHARS) -> List[str]:
+    """
+    Splits the appendix into ~`size`-character paragraphs on line boundaries (over-long
+    lines on spaces), so layout handles many small paragraphs instead of re-splitting
+    one huge paragraph at every page break. The text is Paragraph markup, as in the
+    single-paragraph form: cuts never fall inside a tag or entity, and inline tags still
+    open at a cut are closed there and reopened in the next chunk, so each chunk parses alone.
+    """
+    chunks: List[str] = []
+    open_tags: List[Tuple[str, str]] = []  # (name, opening tag) in nesting order
+    out: List[str] = []
+    length = line_length = 0
+
+    def cut() -> None:
+        nonlocal out, length, line_length
+        while out and out[-1] == " ":
+            out.pop()
+        if length:
+            chunks.append("".join(out) + "".join(f"</{name}>" for name, _ in reversed(open_tags)))
+        out = [tag for _, tag in open_tags]
+        length = line_length = 0
+
+    for token in _APPENDIX_TOKEN.split(raw):
+        if not token:
+            continue
+        if token == "\n":
+            if length >= size:
+                cut()
+            else:
+                out.append("<br/>")
+                line_length = 0
+            continue
+        if token.startswith("<"):
+            name = _TAG_NAME.match(token)
+            name = name.group(1).lower() if name else ""
+            if token.startswith("</"):
+                for i in range(len(open_tags) - 1, -1, -1):
+                    if open_tags[i][0] == name:
+                        del open_tags[i]
+                        break
+            elif name and name != "br" and not token.endswith("/>"):
+                open_tags.append((name, token))
+            out.append(token)
+            continue
+        if token == " ":
+            if line_length:
+                out.append(token)
+                length += 1
+                line_length += 1
+            continue
+        width = 1 if token.startswith("&") else len(token)
+        if line_length and line_length + width > size:
+            cut()
+        # A single word longer than a chunk is cut hard; entities are one unit.
+        while width > size:
+            out.append(token[:size])
+            length += size
+            cut()
+            token, width = token[size:], width - size
+        out.append(token)
+        length += width
+        line_length += width
+    cut()
+    return chunks
+
+
+def build_pdf(report: dict) -> bytes:
+    """PDF bytes for `report` (see build_pdf_to for the expected structure)."""
+    buffer = BytesIO()
+    try:
+        build_pdf_to(report, buffer)
+        return buffer.getvalue()
+    finally:
+        buffer.close()
+
+
+def build_pdf_spooled(report: dict, large: Optional[bool] = None) -> IO[bytes]:
+    """
+    Renders into a SpooledTemporaryFile (in memory up to PDF_SPOOL_BYTES, then on
+    disk) rewound to the start, for streaming responses. The caller closes it.
+    """
+    out = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_BYTES)
+    try:
+        build_pdf_to(report, out, large)
+    except BaseException:
+        out.close()
+        raise
+    out.seek(0)
+    return out
+
+
+def build_pdf_to(report: dict, out: IO[bytes], large: Optional[bool] = None) -> None:
+    """
+    Main PDF builder used by FastAPI endpoint; writes the document to `out`.
+    large=None picks large-report mode (LongTable, chunked appendix) from the
+    report size; True/False forces it.
+
+    Expected (flexible) report structure:
+      - normalized: {drug, repurposing_target, geography} (optional; the Ranolazine/HFpEF
+        demo defaults are only used for that pair, or when this is missing)
+      - executive_summary: str
+      - signal_dashboard: [{metric, rating, rationale}]
+      - clinical_outcomes: [{parameter, result, p_value}] (else evidence.clinical.endpoints)
+      - feasibility: [str]  OR str
+      - recommendation: str
+      - conclusion: str (optional; will auto-generate if missing)
+      - limitations: [str] (optional)
+      - references: [{title, url}] OR ["..."] (we’ll handle both)
+      - charts: optional dict of chart data
+    """
+    started = time.perf_counter()
+    if large is None:
+        large = is_large_report(report)
+
+    doc = SimpleDocTemplate(
+        out,
+        pagesize=A4,
+        rightMargin=40,
+        leftMargin=40,
+        topMargin=40,
+        bottomMargin=40,
+        title="IndiCure AI – Drug Repurposing Report",
+        author="IndiCure AI",
+    )
+
+    with span(PDF_PHASE_DURATION, phase="styles"):
+        template = get_report_template()
+    styles = template.styles
+
     story = []
 
 
-    story.append(_p("IndiCure AI – Drug Repurposing Report", styles["title"]))
+    drug, indication, geography = report_subject(report)
+    demo = (drug, indication) == (DEMO_DRUG, DEMO_INDICATION)
+
+    story.extend(template.section("title"))
     story.append(_p(
-        "<b>Drug:</b> Ranolazine &nbsp;&nbsp; "
-        "<b>Proposed Indication:</b> HFpEF (India) &nbsp;&nbsp; "
+        f"<b>Drug:</b> {escape(drug)} &nbsp;&nbsp; "
+        f"<b>Proposed Indication:</b> {escape(indication)} ({escape(geography)}) &nbsp;&nbsp; "
         "<b>Analysis Mode:</b> " + str(report.get("mode", "General")),
         styles["muted"]
     ))
     story.append(Spacer(1, 12))
 
 
-    story.append(_p("Executive Summary", styles["h1"]))
+    story.append(template.heading("Executive Summary"))
     story.append(_p(report.get("executive_summary", "No executive summary available."), styles["normal"]))
     story.append(Spacer(1, 10))
 
 
-    story.append(_p("Signal Dashboard", styles["h1"]))
+    story.append(template.heading("Signal Dashboard"))
 
     sd = report.get("signal_dashboard")
     if not isinstance(sd, list) or not sd:
-
-        sd = [
-            {"metric": "Clinical Signal", "rating": "Positive", "rationale": "Reported diastolic-function improvements with tolerated hemodynamics in referenced endpoints."},
-            {"metric": "Safety", "rating": "Favorable", "rationale": "No major BP/HR changes reported; QT signal not elevated in the summarized evidence set."},
-            {"metric": "Patent Risk", "rating": "Low", "rationale": "Repurposing typically reduces FTO risk versus de novo development; monitor any formulation/use claims."},
-            {"metric": "India Unmet Need", "rating": "High", "rationale": "HFpEF remains underdiagnosed and undertreated; accessible options and evidence generation are needed."},
-        ]
-
-    sd_rows = []
-    for item in sd:
-        sd_rows.append([
-            item.get("metric", ""),
-            item.get("rating", ""),
-            item.get("rationale", ""),
-        ])
-
-
-    story.append(
-        _make_wrapped_table(
-            headers=["Metric", "Rating", "Rationale"],
-            rows=sd_rows,
-            col_widths=[120, 90, 305],
-            styles=styles,
+        story.extend(template.section("signal_dashboard" if demo else "no_signal_dashboard"))
+    else:
+        sd_rows = []
+        for item in sd:
+            sd_rows.append([
+                item.get("metric", ""),
+                item.get("rating", ""),
+                item.get("rationale", ""),
+            ])
+
+        headers, col_widths = SIGNAL_DASHBOARD_COLUMNS
+        story.extend(
+            _table_flowables(
+                headers=headers,
+                rows=sd_rows,
+                col_widths=col_widths,
+                styles=styles,
+                large=large,
+            )
         )
-    )
     story.append(Spacer(1, 14))
 
 
-    story.append(_p("Clinical Evidence (Key Outcomes)", styles["h1"]))
+    story.append(template.heading("Clinical Evidence (Key Outcomes)"))
 
     outcomes = report.get("clinical_outcomes")
-    if not isinstance(outcomes, list) or not outcomes:
-        outcomes = [
-            {"parameter": "LVEDV", "result": "↑ Significant improvement", "p_value": "&lt; 0.001"},
-            {"parameter": "E/E′", "result": "↓ Improved diastolic function", "p_value": "0.05"},
-            {"parameter": "Blood Pressure / HR", "result": "No meaningful change", "p_value": "&gt; 0.05"},
-            {"parameter": "QT Interval", "result": "No prolongation signal", "p_value": "0.27"},
-        ]
-
-    out_rows = []
-    for o in outcomes:
-        out_rows.append([o.get("parameter", ""), o.get("result", ""), o.get("p_value", "")])
-
-    story.append(
-        _make_wrapped_table(
-            headers=["Parameter", "Result", "p-value"],
-            rows=out_rows,
-            col_widths=[140, 275, 100],
-            styles=styles,
+    if isinstance(outcomes, list) and outcomes:
+        out_rows = [[o.get("parameter", ""), o.get("result", ""), o.get("p_value", "")] for o in outcomes]
+    else:
+        out_rows = [] if demo else _endpoint_rows(report)
+    if not out_rows:
+        story.extend(template.section("clinical_outcomes" if demo else "no_clinical_outcomes"))
+    else:
+        headers, col_widths = CLINICAL_OUTCOME_COLUMNS
+        story.extend(
+            _table_flowables(
+                headers=headers,
+                rows=out_rows,
+                col_widths=col_widths,
+                styles=styles,
+                large=large,
+            )
         )
-    )
     story.append(Spacer(1, 14))
 
-    story.append(_p("Key Charts", styles["h1"]))
+    story.append(template.heading("Key Charts"))
 
     chart = report.get("charts", {}) if isinstance(report.get("charts", {}), dict) else {}
-    lvedv_vals = chart.get("lvedv_change_ml", {"Placebo": 0, "Ranolazine": 33.34})
-
-    labels = list(lvedv_vals.keys())
-    values = [float(lvedv_vals[k]) for k in labels]
 
-    img_buf = _bar_chart_png(
-        title="LVEDV Improvement (ml)",
-        labels=labels,
-        values=values,
-        ylabel="Change in LVEDV (ml)",
-    )
-    story.append(_p("<b>Figure 1.</b> LVEDV Improvement", styles["normal"]))
-    story.append(Spacer(1, 6))
-    story.append(Image(img_buf, width=6.5 * inch, height=3.25 * inch))
-    story.append(Spacer(1, 14))
-
-
-    story.append(_p("Feasibility", styles["h1"]))
-    feas = report.get("feasibility", [])
-    feas_list = _as_list(feas)
-    if not feas_list:
-        feas_list = [
-            "Off-patent or reduced exclusivity risk profile relative to novel entities (confirm claim scope).",
-            "Oral administration supports outpatient adoption and affordability assumptions.",
-            "Regulatory pathway may be supplemental indication (jurisdiction-specific validation required).",
-        ]
-    for item in feas_list:
-        story.append(Paragraph(f"• {item}", styles["bullet"]))
+    for n, (key, vals) in enumerate(_chart_series(chart, demo), start=1):
+        labels = [str(k) for k in vals.keys()]
+        values = [float(vals[k]) for k in vals.keys()]
+
+        if key == "lvedv_change_ml":
+            title, ylabel, caption = "LVEDV Improvement (ml)", "Change in LVEDV (ml)", "LVEDV Improvement"
+        else:
+            title = caption = key.replace("_", " ").title()
+            ylabel = title
+
+        story.append(_p(f"<b>Figure {n}.</b> {caption}", styles["normal"]))
+        story.append(Spacer(1, 6))
+        with span(PDF_PHASE_DURATION, phase="charts"):
+            story.append(_bar_chart(title=title, labels=labels, values=values, ylabel=ylabel))
+        story.append(Spacer(1, 14))
+
+    story.append(template.heading("Feasibility"))
+    feas_list = _as_list(report.get("feasibility", []))
+    if feas_list:
+        story.extend(Paragraph(f"• {item}", styles["bullet"]) for item in feas_list)
+    else:
+        story.extend(template.section("feasibility"))
     story.append(Spacer(1, 10))
 
-    story.append(_p("Recommendation", styles["h1"]))
-    story.append(_p(
-        report.get(
-            "recommendation",
-            "Proceed with targeted Phase II/III Indian clinical trials evaluating Ranolazine as adjunct therapy for HFpEF, focusing on diastolic endpoints and hospitalization reduction."
-        ),
-        styles["normal"]
-    ))
+    story.append(template.heading("Recommendation"))
+    if "recommendation" in report:
+        story.append(_p(report["recommendation"], styles["normal"]))
+    else:
+        story.extend(template.section("recommendation" if demo else "no_recommendation"))
     story.append(Spacer(1, 10))
 
-    story.append(_p("Conclusion", styles["h1"]))
+    story.append(template.heading("Conclusion"))
     conclusion = report.get("conclusion")
-    if not conclusion:
-        conclusion = (
-            "Overall, the current evidence suggests a positive clinical signal for diastolic-function improvement "
-            "with a favorable tolerability profile in the summarized datasets. The primary value-creation step is "
-            "a well-designed India-focused clinical program with clearly defined HFpEF phenotyping, diastolic endpoints, "
-            "and pragmatic outcomes (including hospitalization and functional status)."
-        )
-    story.append(_p(conclusion, styles["normal"]))
+    if conclusion:
+        story.append(_p(conclusion, styles["normal"]))
+    else:
+        story.extend(template.section("conclusion" if demo else "no_conclusion"))
     story.append(Spacer(1, 10))
 
 
-    story.append(_p("Limitations and Assumptions", styles["h1"]))
-    limitations = report.get("limitations", [])
-    limitations_list = _as_list(limitations)
-    if not limitations_list:
-        limitations_list = [
-            "Evidence summarized here may include heterogeneous study designs and endpoints; external validation required.",
-            "Signal strength depends on patient phenotyping and comparators; India-specific epidemiology may differ.",
-            "Patent/FTO requires a dedicated legal search for jurisdictional claims and formulation/use patents.",
-        ]
-    for item in limitations_list:
-        story.append(Paragraph(f"• {item}", styles["bullet"]))
+    story.append(template.heading("Limitations and Assumptions"))
+    limitations_list = _as_list(report.get("limitations", []))
+    if limitations_list:
+        story.extend(Paragraph(f"• {item}", styles["bullet"]) for item in limitations_list)
+    else:
+        story.extend(template.section("limitations"))
     story.append(Spacer(1, 12))
 
-    story.append(_p("Key References", styles["h1"]))
+    story.append(template.heading("Key References"))
     refs = report.get("references", [])
 
  
@@ -365,23 +824,25 @@ def build_pdf(report: dict) -> bytes:
                 else:
                     story.append(_p(f"• {s}", styles["normal"]))
     else:
-        story.append(_p("No references available.", styles["normal"]))
+        story.extend(template.section("no_references"))
 
     story.append(Spacer(1, 10))
 
     raw = report.get("raw_agent_output")
     if raw:
         story.append(PageBreak())
-        story.append(_p("Appendix: Raw Agent Output", styles["h1"]))
-        story.append(_p(
-            "This section contains unedited agent text for auditability and traceability.",
-            styles["muted"]
-        ))
+        story.append(template.heading("Appendix: Raw Agent Output"))
+        story.extend(template.section("appendix_note"))
         story.append(Spacer(1, 8))
-        story.append(_p(str(raw).replace("\n", "<br/>"), styles["cell"]))
-
-    doc.build(story)
-
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    return pdf_bytes
\ No newline at end of file
+        if large:
+            story.extend(
+                _Deferred(lambda chunk=chunk: _p(chunk, styles["cell"]), hAlign="LEFT")
+                for chunk in _appendix_chunks(str(raw))
+            )
+        else:
+            story.append(_p(str(raw).replace("\n", "<br/>"), styles["cell"]))
+
+    with span(PDF_PHASE_DURATION, phase="layout"):
+        doc.build(story)
+
+    PDF_PHASE_DURATION.observe(time.perf_counter() - started, phase="total")
\ No newline at end of file
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import heapq
+import re
+from datetime import date
+from typing import Dict, List
+
+import numpy as np
+
+from agents.evidence_store import get_evidence_store
+from agents.knowledge_graph import get_knowledge_graph
+from agents.market_data import get_market_dataset
+from agents.master import known_drugs
+from agents.patent import BLOCKING_CLAIMS, PATENT_JURISDICTION
+from agents.patent_index import get_patent_index
+
+# Weights of the per-drug feature columns in the screening score (each column is in [0, 1]).
+SCREENING_WEIGHTS: Dict[str, float] = {
+    "clinical": 0.35,
+    "mechanism": 0.25,
+    "patent": 0.2,
+    "market": 0.2,
+}
+
+# Significant endpoints beyond this count add nothing to the clinical feature.
+CLINICAL_SATURATION = 3
+MECHANISM_MAX_DEPTH = 5
+
+_P_VALUE = re.compile(r"p\s*([<=>≤])\s*([0-9]*\.?[0-9]+)", re.IGNORECASE)
+
+
+def _significant(text: str) -> bool:
+    m = _P_VALUE.search(text)
+    if m is None or "NS" in text:
+        return False
+    return m.group(1) != ">" and float(m.group(2)) <= 0.05
+
+
+def candidate_drugs(indication: str) -> List[str]:
+    """Every drug known to any source: the query vocabulary, the mechanism graph and the evidence store."""
+    seen: Dict[str, str] = {}
+    for name in [*known_drugs(), *get_knowledge_graph().nodes_of_type("drug"),
+                 *get_evidence_store().drugs_for(indication)]:
+        seen.setdefault(name.lower(), name)
+    return sorted(seen.values(), key=str.lower)
+
+
+def _clinical(drugs: List[str], indication: str) -> np.ndarray:
+    """Significant endpoints per drug, from one store query, saturating at CLINICAL_SATURATION."""
+    rows = get_evidence_store().endpoints_for(indication)
+    index = {d.lower(): i for i, d in enumerate(drugs)}
+    codes = np.array([index.get(d.lower(), -1) for d, _ in rows], dtype=np.int64)
+    hits = np.array([_significant(s) for _, s in rows], dtype=np.float64)
+    keep = codes >= 0
+    counts = np.bincount(codes[keep], weights=hits[keep], minlength=len(drugs))
+    return np.minimum(counts, CLINICAL_SATURATION) / CLINICAL_SATURATION
+
+
+def _mechanism(drugs: List[str], indication: str) -> np.ndarray:
+    """1 for drugs with a graph path to the indication, from a single reverse BFS."""
+    reach = {n.lower() for n in get_knowledge_graph().distances_to(indication, MECHANISM_MAX_DEPTH)}
+    return np.array([d.lower() in reach for d in drugs], dtype=np.float64)
+
+
+def _patent(drugs: List[str], indication: str, at: date) -> np.ndarray:
+    """Freedom to operate: 1 when nothing covers the use, 0.5 with design-around patents only, 0 if blocked."""
+    index = get_patent_index()
+    out = np.ones(len(drugs))
+    for i, drug in enumerate(drugs):
+        in_force = index.in_force(drug, PATENT_JURISDICTION, at, use=indication)
+        if any(p["claim_type"] in BLOCKING_CLAIMS for p in in_force):
+            out[i] = 0.0
+        elif in_force:
+            out[i] = 0.5
+    return out
+
+
+def _class_key(name: str) -> str:
+    return name.lower().rstrip("s")
+
+
+def _market(drugs: List[str], geography: str, indication: str) -> np.ndarray:
+    """Whitespace: 1 minus the share of indication spend already held by the drug's therapy class."""
+    kg = get_knowledge_graph()
+    shares = {_class_key(c): s for c, s in get_market_dataset().class_shares(geography, indication).items()}
+    held = np.array([shares.get(_class_key(kg.node_class(d) or d), 0.0) for d in drugs])
+    return 1.0 - held
+
+
+def screen(indication: str, geography: str, k: int = 5) -> dict:
+    """
+    Ranks every candidate drug for one indication in a single batched pass.
+
+    Each source is queried once for the whole candidate set and produces one
+    feature column; the score is the weighted sum of the columns and the
+    shortlist is the top-k by heap selection. Nothing here runs the agents, so
+    screening N drugs costs a few array passes rather than N orchestrations.
+    """
+    drugs = candidate_drugs(indication)
+    features = {
+        "clinical": _clinical(drugs, indication),
+        "mechanism": _mechanism(drugs, indication),
+        "patent": _patent(drugs, indication, date.today()),
+        "market": _market(drugs, geography, indication),
+    }
+    scores = sum(SCREENING_WEIGHTS[name] * col for name, col in features.items())
+    top = heapq.nlargest(k, range(len(drugs)), key=lambda i: (scores[i], -i))
+    return {
+        "indication": indication,
+        "geography": geography,
+        "candidates_screened": len(drugs),
+        "weights": dict(SCREENING_WEIGHTS),
+        "shortlist": [
+            {
+                "rank": rank,
+                "drug": drugs[i],
+                "score": round(float(scores[i]), 4),
+                "features": {name: round(float(col[i]), 4) for name, col in features.items()},
+            }
+            for rank, i in enumerate(top, start=1)
+        ],
+    }
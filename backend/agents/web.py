@@ -1,3 +1,8 @@
+from agents.bm25 import get_corpus_index
+
+PASSAGES_PER_SECTION = 3
+
+
 def run_web_intelligence_agent(geography: str, indication: str) -> dict:
     """
     Web Intelligence Agent
@@ -8,21 +13,29 @@ def run_web_intelligence_agent(geography: str, indication: str) -> dict:
 
     Working (prototype):
       - In production, this agent would crawl guideline PDFs + trusted reviews.
-      - Here, it returns the India-specific unmet need signals you already validated.
+      - Here, it retrieves the top BM25 passages from the local guideline/review corpus
+        (data/corpus, indexed by agents/bm25.py) for the burden and guideline-gap questions.
 
     Output:
       - Prevalence, mortality, current therapy gap, urgency.
     """
+    index = get_corpus_index()
+    burden = index.search(f"{indication} {geography} burden prevalence mortality cases underdiagnosed",
+                          k=PASSAGES_PER_SECTION, require=indication)
+    gap = index.search(f"{indication} guideline therapy treatment drug proven disease-modifying",
+                       k=PASSAGES_PER_SECTION, require=indication)
+
+    sources = []
+    for hit in burden + gap:
+        if hit["title"] not in sources:
+            sources.append(hit["title"])
+
     return {
-        "india_burden": [
-            "HFpEF accounts for ~15–30% of HF cases in India.",
-            "High burden with ~40% mortality at ~3 years in reported cohorts.",
-            "Underdiagnosed and increasing prevalence."
-        ],
-        "guideline_gap": [
-            "Only SGLT2 inhibitors have proven benefit in HFpEF.",
-            "No single curative/disease-modifying drug established.",
-            "Ionic dysfunction (Na⁺/Ca²⁺ handling) central to HFpEF pathophysiology."
-        ],
-        "implication": "Clear therapeutic gap supports mechanism-driven repurposing candidates."
-    }
\ No newline at end of file
+        "india_burden": [hit["text"] for hit in burden],
+        "guideline_gap": [hit["text"] for hit in gap],
+        "implication": (
+            "Clear therapeutic gap supports mechanism-driven repurposing candidates."
+            if gap else f"No guideline evidence indexed for {indication} in {geography}."
+        ),
+        "sources": sources
+    }
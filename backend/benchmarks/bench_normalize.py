@@ -0,0 +1,69 @@
+"""
+Per-query cost of vocabulary matching as the vocabulary grows.
+
+Compares the compiled Aho–Corasick automaton used by normalize_query with a
+naive scan that runs one substring check per term.
+
+    cd backend
+    python -m benchmarks.bench_normalize [--sizes 100 1000 10000 100000] [--queries 2000]
+"""
+import argparse
+import random
+import string
+import time
+
+from agents.matcher import AhoCorasick
+
+QUERIES = [
+    "Assess repurposing potential of Ranolazine for HFpEF in India",
+    "Can Ranexa improve diastolic dysfunction in Indian patients with preserved ejection fraction?",
+    "Evaluate jardiance for heart failure with preserved ejection fraction",
+    "Find repurposing potential for Ranolazine",
+]
+
+
+def _synthetic_terms(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    terms = ["ranolazine", "ranexa", "hfpef", "preserved ejection", "diastolic", "india", "jardiance"]
+    while len(terms) < n:
+        words = rng.randint(1, 3)
+        terms.append(" ".join(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 11))) for _ in range(words)
+        ))
+    return terms[:n]
+
+
+def _bench(fn, queries, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for q in queries:
+            fn(q)
+    return (time.perf_counter() - started) / (repeat * len(queries)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=2_000, help="queries timed per size")
+    args = parser.parse_args()
+
+    print(f"{'terms':>8} {'build ms':>10} {'automaton us/q':>15} {'naive us/q':>12}")
+    for n in args.sizes:
+        terms = _synthetic_terms(n)
+
+        started = time.perf_counter()
+        matcher = AhoCorasick()
+        for t in terms:
+            matcher.add(t, t)
+        matcher.build()
+        build_ms = (time.perf_counter() - started) * 1000
+
+        repeat = max(1, args.queries // len(QUERIES))
+        ac = _bench(lambda q: list(matcher.finditer(q)), QUERIES, repeat)
+        naive_repeat = max(1, repeat * 1000 // n)
+        naive = _bench(lambda q: [t for t in terms if t in q.lower()], QUERIES, naive_repeat)
+        print(f"{n:>8} {build_ms:>10.1f} {ac:>15.2f} {naive:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+Benchmark suite for the request path: normalize_query, run_orchestration,
+build_pdf at several report sizes, and the /analyze and /export/pdf handlers
+through an in-process ASGI client. "startup import main" guards cold start: it
+times `import main` in fresh interpreters, so heavy imports that creep onto the
+startup path show up as a regression.
+
+Each case reports median and p95 wall time and median process CPU time per
+call (all threads, so pool work is included) over timed rounds. It also
+reports the tracemalloc peak of one extra traced call. Results can be saved as
+a baseline and later compared against it; with --compare the run exits 1 when
+any case's median wall or CPU time regresses beyond --tolerance (the startup
+case is gated on peak RSS instead, which is far steadier). Baselines are
+only comparable on the same machine and Python build.
+
+    cd backend
+    python -m benchmarks.suite                      # run everything
+    python -m benchmarks.suite -k build_pdf         # cases whose name contains "build_pdf"
+    python -m benchmarks.suite --save-baseline      # write benchmarks/baselines.json
+    python -m benchmarks.suite --compare            # fail on regressions vs baselines.json
+    python -m benchmarks.suite -k startup --compare # cold-start check only
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines.json"
+BACKEND_DIR = BASELINE_PATH.parent.parent
+# Cases gated on peak memory instead of time: a fresh interpreter's import time swings
+# with machine load, while its RSS tracks the imported modules almost exactly.
+MEMORY_GATED = {"startup import main"}
+
+QUERY = "Assess repurposing potential of Ranolazine for HFpEF in India"
+QUERIES = [
+    QUERY,
+    "Can Ranexa improve diastolic dysfunction in Indian patients with preserved ejection fraction?",
+    "Evaluate jardiance for heart failure with preserved ejection fraction",
+    "Find repurposing potential for Ranolazine",
+]
+
+# build_pdf sizes: (signal_dashboard rows, clinical_outcomes rows, references, raw_agent_output KiB, rounds divisor).
+# "small" and "medium" render in the default layout (one-paragraph appendix); "large" is past the
+# is_large_report thresholds, so it measures large-report mode: chunked LongTables and the 32 KiB
+# appendix split into ~APPENDIX_CHUNK_CHARS paragraphs. It is still the slowest case, so it runs fewer rounds.
+PDF_SIZES: Dict[str, Tuple[int, int, int, int, int]] = {
+    "small": (4, 4, 5, 1, 1),
+    "medium": (60, 60, 40, 8, 1),
+    "large": (400, 400, 250, 32, 4),
+}
+
+
+def synthetic_report(rows: int, outcomes: int, refs: int, raw_kib: int) -> dict:
+    """Deterministic build_pdf input of the given size."""
+    line = "Agent output line with endpoint values, citations and reviewer notes for traceability."
+    return {
+        "mode": "General",
+        "executive_summary": "Synthetic benchmark report. " * 20,
+        "signal_dashboard": [
+            {"metric": f"Signal {i}", "rating": ("Positive", "Neutral", "Low")[i % 3],
+             "rationale": f"Rationale {i}: " + "supporting evidence summary " * (1 + i % 5)}
+            for i in range(rows)
+        ],
+        "clinical_outcomes": [
+            {"parameter": f"Endpoint {i}", "result": "Improved versus baseline " * (1 + i % 3),
+             "p_value": f"0.{i % 100:02d}"}
+            for i in range(outcomes)
+        ],
+        "references": [
+            {"title": f"Reference {i}: study of diastolic function", "url": f"https://example.org/ref/{i}"}
+            for i in range(refs)
+        ],
+        "raw_agent_output": "\n".join(line for _ in range(raw_kib * 1024 // (len(line) + 1))),
+    }
+
+
+def measure(fn: Callable[[], object], rounds: int, warmup: int = 1) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    walls: List[float] = []
+    cpus: List[float] = []
+    for _ in range(rounds):
+        cpu0, wall0 = time.process_time(), time.perf_counter()
+        fn()
+        walls.append(time.perf_counter() - wall0)
+        cpus.append(time.process_time() - cpu0)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    walls.sort()
+    return {
+        "rounds": rounds,
+        "wall_ms": statistics.median(walls) * 1000,
+        "wall_p95_ms": walls[min(len(walls) - 1, int(0.95 * len(walls)))] * 1000,
+        "cpu_ms": statistics.median(cpus) * 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def _cases(rounds: int) -> List[Tuple[str, Callable[[], Dict[str, float]]]]:
+    from agents.master import agent_caches, normalize_query, orchestration_cache, run_orchestration
+    from agents.report_pdf import build_pdf
+
+    def clear_caches() -> None:
+        orchestration_cache.invalidate()
+        for cache in agent_caches().values():
+            cache.invalidate()
+
+    def normalize() -> None:
+        for q in QUERIES:
+            normalize_query(q)
+
+    def orchestrate_cold() -> None:
+        clear_caches()
+        run_orchestration(QUERY, "India")
+
+    cases = [
+        ("startup import main", lambda: _cold_import(rounds)),
+        ("normalize_query[x4]", lambda: measure(normalize, rounds * 20)),
+        ("run_orchestration[cold]", lambda: measure(orchestrate_cold, rounds)),
+        ("run_orchestration[memoized]", lambda: measure(lambda: run_orchestration(QUERY, "India"), rounds)),
+    ]
+    for size, (*spec, divisor) in PDF_SIZES.items():
+        report = synthetic_report(*spec)
+        n = max(2, rounds // divisor)
+        cases.append((f"build_pdf[{size}]", lambda report=report, n=n: measure(lambda: build_pdf(report), n)))
+
+    cases.append(("asgi /analyze[cached]", lambda: _asgi("/analyze", rounds, cold=False, clear=clear_caches)))
+    cases.append(("asgi /analyze[cold]", lambda: _asgi("/analyze", rounds, cold=True, clear=clear_caches)))
+    cases.append(("asgi /export/pdf[cached]", lambda: _asgi("/export/pdf", rounds, cold=False, clear=clear_caches)))
+    return cases
+
+
+_IMPORT_PROBE = """
+import json, resource, time
+wall, cpu = time.perf_counter(), time.process_time()
+import main
+print(json.dumps({"wall": time.perf_counter() - wall, "cpu": time.process_time() - cpu,
+                  "rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+"""
+
+
+def _cold_import(rounds: int) -> Dict[str, float]:
+    """`import main` in a fresh interpreter per round; peak is the child's max RSS rather than tracemalloc."""
+    samples = []
+    for _ in range(rounds):
+        out = subprocess.run([sys.executable, "-c", _IMPORT_PROBE], cwd=BACKEND_DIR,
+                             capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(out.strip().splitlines()[-1]))
+    walls = sorted(s["wall"] for s in samples)
+    return {
+        "rounds": rounds,
+        "wall_ms": statistics.median(walls) * 1000,
+        "wall_p95_ms": walls[min(len(walls) - 1, int(0.95 * len(walls)))] * 1000,
+        "cpu_ms": statistics.median(s["cpu"] for s in samples) * 1000,
+        "peak_kib": statistics.median(s["rss_kib"] for s in samples),
+    }
+
+
+def _asgi(path: str, rounds: int, cold: bool, clear: Callable[[], None]) -> Dict[str, float]:
+    """Times one POST through the full FastAPI stack (routing, validation, serialization) without a socket."""
+    import httpx
+    from main import analyze_cache, app
+
+    body = {"query": QUERY, "mode": "General", "geography": "India"}
+    loop = asyncio.new_event_loop()
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+    def call() -> None:
+        if cold:
+            clear()
+            analyze_cache.invalidate()
+        response = loop.run_until_complete(client.post(path, json=body))
+        response.raise_for_status()
+
+    try:
+        return measure(call, rounds)
+    finally:
+        loop.run_until_complete(client.aclose())
+        loop.close()
+
+
+def _machine() -> Dict[str, str]:
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="pattern", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--rounds", type=int, default=10, help="timed rounds per case")
+    parser.add_argument("--save-baseline", action="store_true", help=f"write results to {BASELINE_PATH.name}")
+    parser.add_argument("--compare", action="store_true", help="exit 1 on regressions vs the saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown ratio (default 0.25)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    baseline = {}
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8")).get("results", {})
+
+    results: Dict[str, Dict[str, float]] = {}
+    regressions: List[str] = []
+    if not args.json:
+        print(f"{'case':<30} {'wall ms':>10} {'p95 ms':>10} {'cpu ms':>10} {'peak KiB':>10} {'vs base':>9}")
+    for name, run in _cases(args.rounds):
+        if args.pattern not in name:
+            continue
+        r = results[name] = run()
+        base = baseline.get(name)
+        delta = ""
+        if base:
+            ratio = r["wall_ms"] / base["wall_ms"] - 1
+            delta = f"{ratio:+.0%}"
+            if name in MEMORY_GATED:
+                if r["peak_kib"] / max(base["peak_kib"], 1e-9) - 1 > args.tolerance:
+                    regressions.append(name)
+            elif ratio > args.tolerance or r["cpu_ms"] / max(base["cpu_ms"], 1e-9) - 1 > args.tolerance:
+                regressions.append(name)
+        if not args.json:
+            print(f"{name:<30} {r['wall_ms']:>10.2f} {r['wall_p95_ms']:>10.2f} {r['cpu_ms']:>10.2f} "
+                  f"{r['peak_kib']:>10.0f} {delta:>9}", flush=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    if args.save_baseline:
+        merged = {**baseline, **results}
+        BASELINE_PATH.write_text(json.dumps({"machine": _machine(), "results": merged}, indent=2) + "\n",
+                                 encoding="utf-8")
+        print(f"baseline written to {BASELINE_PATH}", file=sys.stderr)
+    if args.compare and regressions:
+        print(f"regressions beyond {args.tolerance:.0%}: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
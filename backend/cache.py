@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple, Union
+
+
+_MISSING = object()
+
+# "memory" keeps each cache in-process; "sqlite" shares it between all processes on the host.
+CACHE_BACKEND = os.getenv("INDICURE_CACHE_BACKEND", "memory")
+CACHE_PATH = Path(os.getenv(
+    "INDICURE_CACHE_PATH",
+    Path(__file__).resolve().parent / "data" / "cache.sqlite3",
+))
+
+
+class TTLCache:
+    """
+    Thread-safe in-process cache with LRU size bounds and per-entry TTL expiry.
+
+    Used for orchestration results and other deterministic, per-key outputs.
+    Keeps hit/miss/eviction counters so callers can expose them on an endpoint.
+    With `max_bytes` and `sizeof`, entries are also evicted once their total
+    size exceeds the byte budget (e.g. for rendered PDFs).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: Optional[float] = 600.0,
+        name: str = "cache",
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda value: 0)
+        self._bytes = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value, _ = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._pop(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        size = self._sizeof(value)
+        with self._lock:
+            self._pop(key)
+            self._data[key] = (expires_at, value, size)
+            self._bytes += size
+            while self._data and (
+                len(self._data) > self.maxsize
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                self._pop(next(iter(self._data)))
+                self.evictions += 1
+
+    def _pop(self, key: Hashable) -> bool:
+        entry = self._data.pop(key, _MISSING)
+        if entry is _MISSING:
+            return False
+        self._bytes -= entry[2]
+        return True
+
+    def invalidate(self, key: Hashable = _MISSING) -> int:
+        """Drops one key, or everything when called without a key. Returns the number of entries removed."""
+        with self._lock:
+            if key is _MISSING:
+                n = len(self._data)
+                self._data.clear()
+                self._bytes = 0
+                return n
+            return 1 if self._pop(key) else 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            return entry is not _MISSING and (entry[0] is None or entry[0] > time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "backend": "memory",
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+# Bumped whenever the layout changes; an older cache file is dropped and recreated.
+_SQLITE_SCHEMA_VERSION = 2
+
+# The pickled value goes last so reads of size/expiry/access time never touch its
+# overflow pages. cache_totals keeps per-namespace entry and byte counts, maintained
+# by triggers in the writer's transaction, so eviction never has to SUM(size).
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    ns TEXT NOT NULL,
+    key TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (ns, key)
+);
+CREATE INDEX IF NOT EXISTS cache_entries_lru ON cache_entries (ns, accessed_at);
+CREATE INDEX IF NOT EXISTS cache_entries_expiry ON cache_entries (ns, expires_at);
+CREATE TABLE IF NOT EXISTS cache_totals (
+    ns TEXT PRIMARY KEY,
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS cache_entries_ins AFTER INSERT ON cache_entries BEGIN
+    INSERT INTO cache_totals (ns, entries, bytes) VALUES (NEW.ns, 1, NEW.size)
+    ON CONFLICT (ns) DO UPDATE SET entries = entries + 1, bytes = bytes + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_entries_upd AFTER UPDATE OF size ON cache_entries BEGIN
+    UPDATE cache_totals SET bytes = bytes - OLD.size + NEW.size WHERE ns = NEW.ns;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_entries_del AFTER DELETE ON cache_entries BEGIN
+    UPDATE cache_totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE ns = OLD.ns;
+END;
+"""
+
+
+class SQLiteCache:
+    """
+    TTLCache-compatible cache stored in a SQLite file, shared by every process
+    (e.g. uvicorn workers) that opens the same path.
+
+    Several caches live in one file, namespaced by `name`. Values are pickled;
+    keys must have a stable repr (tuples of strings, as used here). Writers take
+    BEGIN IMMEDIATE transactions in WAL mode, so concurrent sets serialize
+    cleanly while readers never block. Eviction is approximate LRU: access
+    times are only rewritten when older than `touch_interval`, so hot reads
+    stay read-only. Size is bounded by `maxsize` entries and, optionally,
+    `max_bytes` of pickled data. Hit/miss counters are per process.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = CACHE_PATH,
+        maxsize: int = 256,
+        ttl: Optional[float] = 600.0,
+        name: str = "cache",
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+        touch_interval: float = 5.0,
+    ):
+        # sizeof is accepted for TTLCache compatibility; the stored size is the pickled length.
+        self.path = Path(path)
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._write() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SQLITE_SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS cache_entries")
+                conn.execute("DROP TABLE IF EXISTS cache_totals")
+                conn.execute(f"PRAGMA user_version = {_SQLITE_SCHEMA_VERSION}")
+        self._conn().executescript(_SQLITE_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _count(self, **counters: int) -> None:
+        with self._lock:
+            for name, n in counters.items():
+                setattr(self, name, getattr(self, name) + n)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        k = repr(key)
+        row = self._conn().execute(
+            "SELECT value, expires_at, accessed_at FROM cache_entries WHERE ns = ? AND key = ?", (self.name, k)
+        ).fetchone()
+        if row is None:
+            self._count(misses=1)
+            return default
+        value, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at is not None and expires_at <= now:
+            with self._write() as conn:
+                conn.execute("DELETE FROM cache_entries WHERE ns = ? AND key = ? AND expires_at <= ?",
+                             (self.name, k, now))
+            self._count(expirations=1, misses=1)
+            return default
+        if accessed_at < now - self.touch_interval:
+            with self._write() as conn:
+                conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE ns = ? AND key = ?", (now, self.name, k))
+        self._count(hits=1)
+        return pickle.loads(value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._write() as conn:
+            # An upsert (not INSERT OR REPLACE) so the update trigger keeps cache_totals right.
+            conn.execute(
+                "INSERT INTO cache_entries (ns, key, size, expires_at, accessed_at, value) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (ns, key) DO UPDATE SET size = excluded.size, expires_at = excluded.expires_at, "
+                "accessed_at = excluded.accessed_at, value = excluded.value",
+                (self.name, repr(key), len(blob), now + ttl if ttl is not None else None, now, blob),
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        expired = conn.execute(
+            "DELETE FROM cache_entries WHERE ns = ? AND expires_at <= ?", (self.name, now)
+        ).rowcount
+        count, total = self._totals(conn)
+        victims = []
+        if count > self.maxsize or (self.max_bytes is not None and total > self.max_bytes):
+            for k, size in conn.execute(
+                "SELECT key, size FROM cache_entries WHERE ns = ? ORDER BY accessed_at", (self.name,)
+            ):
+                if count <= self.maxsize and (self.max_bytes is None or total <= self.max_bytes):
+                    break
+                victims.append((self.name, k))
+                count -= 1
+                total -= size
+            conn.executemany("DELETE FROM cache_entries WHERE ns = ? AND key = ?", victims)
+        self._count(expirations=expired, evictions=len(victims))
+
+    def invalidate(self, key: Hashable = _MISSING) -> int:
+        """Drops one key, or everything in this namespace when called without a key (in every process)."""
+        with self._write() as conn:
+            if key is _MISSING:
+                return conn.execute("DELETE FROM cache_entries WHERE ns = ?", (self.name,)).rowcount
+            return conn.execute(
+                "DELETE FROM cache_entries WHERE ns = ? AND key = ?", (self.name, repr(key))
+            ).rowcount
+
+    def __contains__(self, key: Hashable) -> bool:
+        row = self._conn().execute(
+            "SELECT expires_at FROM cache_entries WHERE ns = ? AND key = ?", (self.name, repr(key))
+        ).fetchone()
+        return row is not None and (row[0] is None or row[0] > time.time())
+
+    def _totals(self, conn: sqlite3.Connection) -> Tuple[int, int]:
+        row = conn.execute("SELECT entries, bytes FROM cache_totals WHERE ns = ?", (self.name,)).fetchone()
+        return row if row is not None else (0, 0)
+
+    def __len__(self) -> int:
+        return self._totals(self._conn())[0]
+
+    def stats(self) -> Dict[str, Any]:
+        size, total = self._totals(self._conn())
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "backend": "sqlite",
+            "path": str(self.path),
+            "size": size,
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+def make_cache(
+    maxsize: int = 256,
+    ttl: Optional[float] = 600.0,
+    name: str = "cache",
+    max_bytes: Optional[int] = None,
+    sizeof: Optional[Callable[[Any], int]] = None,
+) -> Union[TTLCache, SQLiteCache]:
+    """Cache on the backend selected by INDICURE_CACHE_BACKEND, for results worth sharing across workers."""
+    if CACHE_BACKEND == "sqlite":
+        return SQLiteCache(CACHE_PATH, maxsize=maxsize, ttl=ttl, name=name, max_bytes=max_bytes, sizeof=sizeof)
+    if CACHE_BACKEND != "memory":
+        raise ValueError(f"INDICURE_CACHE_BACKEND must be 'memory' or 'sqlite', not {CACHE_BACKEND!r}")
+    return TTLCache(maxsize=maxsize, ttl=ttl, name=name, max_bytes=max_bytes, sizeof=sizeof)
+
+
+def memoize(
+    ttl: Optional[float],
+    maxsize: int = 512,
+    name: Optional[str] = None,
+    wait_timeout: Optional[float] = 30.0,
+) -> Callable:
+    """
+    Memoizes a function on its positional arguments with a TTLCache.
+
+    The wrapped function should take exactly the inputs its output depends on,
+    so that calls differing only in irrelevant context share an entry.
+    Concurrent calls with the same arguments are collapsed into one execution
+    (single-flight); the others wait up to `wait_timeout` seconds for it and read
+    the cached value, then compute on their own. Coroutine functions get an async
+    wrapper that caches the awaited result (and stays a coroutine function).
+    The cache is exposed as `wrapper.cache`.
+    """
+    def decorator(fn: Callable) -> Callable:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl, name=name or fn.__name__)
+        if inspect.iscoroutinefunction(fn):
+            wrapper = _memoize_async(fn, cache, wait_timeout)
+        else:
+            wrapper = _memoize_sync(fn, cache, wait_timeout)
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def _memoize_sync(fn: Callable, cache: TTLCache, wait_timeout: Optional[float]) -> Callable:
+    inflight: Dict[Hashable, threading.Event] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(fn)
+    def wrapper(*args):
+        value = cache.get(args, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with lock:
+            event = inflight.get(args)
+            leader = event is None
+            if leader:
+                event = inflight[args] = threading.Event()
+
+        if not leader:
+            event.wait(wait_timeout)
+            value = cache.get(args, _MISSING)
+            if value is not _MISSING:
+                return value
+            # The leader failed or is stuck; compute independently so its error surfaces here too.
+            return fn(*args)
+
+        try:
+            value = fn(*args)
+            cache.set(args, value)
+            return value
+        finally:
+            with lock:
+                inflight.pop(args, None)
+            event.set()
+
+    return wrapper
+
+
+def _memoize_async(fn: Callable, cache: TTLCache, wait_timeout: Optional[float]) -> Callable:
+    # Futures belong to one event loop, so single-flight is per loop.
+    inflight: Dict[tuple, asyncio.Future] = {}
+
+    @functools.wraps(fn)
+    async def wrapper(*args):
+        value = cache.get(args, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), args)
+        shared = inflight.get(key)
+        if shared is not None:
+            try:
+                value = await asyncio.wait_for(asyncio.shield(shared), wait_timeout)
+            except asyncio.TimeoutError:
+                value = _MISSING
+            if value is not _MISSING:
+                return value
+            return await fn(*args)
+
+        shared = inflight[key] = loop.create_future()
+        value = _MISSING
+        try:
+            value = await fn(*args)
+            cache.set(args, value)
+            return value
+        finally:
+            inflight.pop(key, None)
+            shared.set_result(value)  # _MISSING tells followers to compute themselves
+
+    return wrapper
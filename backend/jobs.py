@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+
+def _render_in_worker(report: dict) -> Tuple[bytes, float]:
+    """Runs in a pool process: renders one PDF and returns (pdf_bytes, render_ms)."""
+    from agents.report_pdf import build_pdf
+
+    started = time.perf_counter()
+    pdf_bytes = build_pdf(report)
+    return pdf_bytes, (time.perf_counter() - started) * 1000
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the export queue is at capacity; endpoints map it to 503."""
+
+
+class ExportJobs:
+    """
+    PDF export jobs rendered on a bounded process pool.
+
+    build_pdf is CPU-bound, so rendering in worker processes keeps it off the
+    GIL shared with the API. The pool is created on first use (spawn context,
+    so workers never inherit the server's threads), and finished jobs are kept
+    for `retain_seconds` so clients can download them; at most `max_finished`
+    are retained, the oldest being dropped first. Render times (jobs and pack
+    renders alike) feed an EWMA that retry_after() uses, as AdmissionGate does.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: int = 64,
+        retain_seconds: float = 900.0,
+        max_finished: int = 256,
+        initial_estimate: float = 1.0,
+        alpha: float = 0.2,
+    ):
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.max_pending = max_pending
+        self.retain_seconds = retain_seconds
+        self.max_finished = max_finished
+        self.alpha = alpha
+        self.ewma_render_seconds = initial_estimate
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._renders_inflight = 0  # submit_future() renders not yet finished
+        self.submitted = 0
+        self.failed = 0
+        self.rejected = 0
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def submit_future(self, report: dict) -> Future:
+        """
+        Renders without registering a job; the future resolves to (pdf_bytes, render_ms).
+        The render still counts towards pending() until it finishes.
+        """
+        pool = self.pool
+        # Counted before submitting, so a render that has already started is never missed.
+        with self._lock:
+            self._renders_inflight += 1
+        try:
+            future = pool.submit(_render_in_worker, report)
+        except BaseException:
+            with self._lock:
+                self._renders_inflight -= 1
+            raise
+        # Runs at once if the render already finished, so the count never goes negative.
+        future.add_done_callback(self._render_done)
+        return future
+
+    def _render_done(self, future: Future) -> None:
+        with self._lock:
+            self._renders_inflight -= 1
+        if not future.cancelled() and future.exception() is None:
+            self._observe(future.result()[1])
+
+    def _observe(self, render_ms: float) -> None:
+        with self._lock:
+            self.ewma_render_seconds += self.alpha * (render_ms / 1000 - self.ewma_render_seconds)
+
+    def retry_after(self, renders: int) -> int:
+        """Seconds until `renders` queued renders have drained across the workers, at the observed render time."""
+        return max(1, math.ceil(self.ewma_render_seconds * renders / self.max_workers))
+
+    def submit(self, report: dict, filename: str = "report.pdf") -> str:
+        self._prune()
+        if self.pending() >= self.max_pending:
+            self.rejected += 1
+            raise QueueFullError(f"Export queue is full ({self.max_pending} pending jobs).")
+
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "filename": filename,
+            "submitted_at": time.time(),
+            "_submitted": time.perf_counter(),
+            "_future": None,
+        }
+        with self._lock:
+            self._jobs[job_id] = job
+        future = self.pool.submit(_render_in_worker, report)
+        job["_future"] = future
+        future.add_done_callback(lambda f, job=job: self._finish(job, f))
+        self.submitted += 1
+        return job_id
+
+    def _finish(self, job: Dict[str, Any], future: Future) -> None:
+        job["total_ms"] = round((time.perf_counter() - job["_submitted"]) * 1000, 3)
+        job["finished_at"] = time.time()
+        if future.cancelled() or future.exception() is not None:
+            self.failed += 1
+            job["error"] = "cancelled" if future.cancelled() else repr(future.exception())
+            return
+        pdf_bytes, render_ms = future.result()
+        self._observe(render_ms)
+        job["render_ms"] = round(render_ms, 3)
+        job["queue_ms"] = round(max(job["total_ms"] - render_ms, 0.0), 3)
+        job["size_bytes"] = len(pdf_bytes)
+
+    @staticmethod
+    def _state(job: Dict[str, Any]) -> str:
+        future: Optional[Future] = job["_future"]
+        if future is None or not (future.running() or future.done()):
+            return "queued"
+        if not future.done() or "finished_at" not in job:
+            return "running"
+        return "failed" if "error" in job else "done"
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        self._prune()
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        out = {k: v for k, v in job.items() if not k.startswith("_")}
+        out["status"] = self._state(job)
+        return out
+
+    def result(self, job_id: str) -> Optional[bytes]:
+        """PDF bytes for a finished job, None if unknown or not done yet."""
+        self._prune()
+        job = self._jobs.get(job_id)
+        if job is None or self._state(job) != "done":
+            return None
+        return job["_future"].result()[0]
+
+    def pending(self) -> int:
+        """Unfinished jobs plus unfinished submit_future() renders (e.g. report packs)."""
+        jobs = sum(1 for job in list(self._jobs.values()) if self._state(job) in ("queued", "running"))
+        return jobs + self._renders_inflight
+
+    def _prune(self) -> None:
+        """Drops finished jobs past `retain_seconds`, then the oldest beyond `max_finished`."""
+        cutoff = time.time() - self.retain_seconds
+        with self._lock:
+            finished = sorted(
+                (job["finished_at"], job_id) for job_id, job in self._jobs.items() if "finished_at" in job
+            )
+            excess = len(finished) - self.max_finished
+            for i, (finished_at, job_id) in enumerate(finished):
+                if finished_at < cutoff or i < excess:
+                    del self._jobs[job_id]
+
+    def stats(self) -> Dict[str, Any]:
+        self._prune()
+        jobs = list(self._jobs.values())
+        states = [self._state(j) for j in jobs]
+        renders = [j["render_ms"] for j in jobs if "render_ms" in j]
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "queued": states.count("queued"),
+            "running": states.count("running"),
+            "done": states.count("done"),
+            "pack_renders": self._renders_inflight,
+            "submitted": self.submitted,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_render_ms": round(sum(renders) / len(renders), 3) if renders else None,
+            "ewma_render_ms": round(self.ewma_render_seconds * 1000, 3),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+class _ZipSink:
+    """Write-only, non-seekable file object for zipfile; drain() hands out what was written so far."""
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buf += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = bytes(self._buf)
+        self._buf.clear()
+        return data
+
+
+async def stream_report_pack(jobs: ExportJobs, items: List[Tuple[str, dict]]) -> AsyncIterator[bytes]:
+    """
+    Renders every (filename, report) on the export pool at once and yields a ZIP
+    archive incrementally: each PDF is written as soon as its render finishes, so
+    the download starts with the first finished render and ends shortly after the
+    slowest one. A manifest.json with per-file render times (or errors) closes the archive.
+    PDFs are already compressed, so entries are stored, not deflated.
+    """
+    started = time.perf_counter()
+    futures = {name: jobs.submit_future(report) for name, report in items}
+
+    async def one(name: str, future: Future):
+        try:
+            return name, await asyncio.wrap_future(future), None
+        except Exception as exc:
+            return name, None, f"{type(exc).__name__}: {exc}"
+
+    sink = _ZipSink()
+    archive = zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED)
+    manifest: List[Dict[str, Any]] = []
+    try:
+        for next_done in asyncio.as_completed([one(name, f) for name, f in futures.items()]):
+            name, result, error = await next_done
+            entry: Dict[str, Any] = {"file": name, "finished_ms": round((time.perf_counter() - started) * 1000, 3)}
+            if error is None:
+                pdf_bytes, render_ms = result
+                archive.writestr(name, pdf_bytes)
+                entry.update(render_ms=round(render_ms, 3), size_bytes=len(pdf_bytes))
+            else:
+                entry["error"] = error
+            manifest.append(entry)
+            yield sink.drain()
+        archive.writestr("manifest.json", json.dumps({"files": manifest}, indent=2))
+        archive.close()
+        yield sink.drain()
+    finally:
+        # Client went away (or we failed): don't keep rendering into the void.
+        for future in futures.values():
+            future.cancel()
+
@@ -1,12 +1,143 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
-from agents.report_pdf import build_pdf
-from models import AnalyzeRequest, AnalyzeResponse, AgentTraceItem
-from agents.master import run_orchestration
-from agents.report_pdf import build_pdf
+import startup
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict, List, Tuple, get_args
+
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-app = FastAPI(title="IndiCure AI Prototype API", version="1.0")
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from models import (
+    AnalyzeRequest,
+    AnalyzeResponse,
+    AgentTraceItem,
+    Geography,
+    Mode,
+    ReportPackRequest,
+    ScreenRequest,
+)
+from agents.master import (
+    AGENT_WORKERS,
+    MASTER_AGENT,
+    REPORT_AGENT,
+    WORKER_AGENTS,
+    agent_caches,
+    cache_for_report,
+    canonical_term,
+    get_orchestration,
+    get_orchestration_async,
+    normalize_pair,
+    normalize_query,
+    orchestration_cache,
+    orchestration_key,
+)
+from admission import AdmissionGate, OverloadedError
+from cache import make_cache
+from jobs import ExportJobs, QueueFullError, stream_report_pack
+from metrics import render_prometheus
+
+# ReportLab (and matplotlib, if used) are only loaded by the first export, or by the
+# optional INDICURE_WARMUP=1 background warm-up, keeping them off the cold-start path.
+# The same goes for the source clients (httpx), orjson and the screening features:
+# they are imported by the first request that needs them.
+PDF_MODULE = "agents.report_pdf"
+
+
+def build_pdf(report: dict) -> bytes:
+    return startup.lazy_import(PDF_MODULE).build_pdf(report)
+
+
+def build_pdf_spooled(report: dict):
+    return startup.lazy_import(PDF_MODULE).build_pdf_spooled(report)
+
+
+PDF_STREAM_CHUNK = 64 * 1024
+
+
+def _iter_file(f):
+    """Streams a spooled PDF in chunks and closes (deletes) it when the response is done."""
+    try:
+        while chunk := f.read(PDF_STREAM_CHUNK):
+            yield chunk
+    finally:
+        f.close()
+
+
+export_jobs = ExportJobs(
+    max_workers=int(os.getenv("INDICURE_EXPORT_WORKERS", "0")) or None,
+    max_pending=int(os.getenv("INDICURE_EXPORT_QUEUE", "64")),
+    retain_seconds=float(os.getenv("INDICURE_EXPORT_RETAIN", "900")),
+    max_finished=int(os.getenv("INDICURE_EXPORT_RETAIN_MAX", "256")),
+)
+
+REPORT_QUERY = "Assess repurposing potential of Ranolazine for HFpEF"
+
+# Rendered /api/report/pdf output, keyed on (mode, geo): value is (etag, pdf_bytes).
+pdf_cache = make_cache(
+    maxsize=64,
+    ttl=orchestration_cache.ttl,
+    name="report_pdf",
+    max_bytes=int(os.getenv("INDICURE_PDF_CACHE_BYTES", str(64 * 1024 * 1024))),
+    sizeof=lambda entry: len(entry[1]),
+)
+
+
+def _render_report_pdf(mode: str, geo: str):
+    entry = pdf_cache.get((mode, geo))
+    if entry is None:
+        report = get_orchestration(REPORT_QUERY, geo, mode)
+        report["analysis_mode"] = mode
+        pdf_bytes = build_pdf(report)
+        entry = ('"' + hashlib.sha256(pdf_bytes).hexdigest()[:32] + '"', pdf_bytes)
+        cache_for_report(pdf_cache, (mode, geo), report, entry)
+    return entry
+
+
+# Renders admitted at once per PDF endpoint; the rest queue on the event loop, then get 503 + Retry-After.
+export_pdf_gate = AdmissionGate.from_env("/export/pdf", "EXPORT_PDF")
+report_pdf_gate = AdmissionGate.from_env("/api/report/pdf", "REPORT_PDF")
+
+
+def _overloaded(exc: OverloadedError) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": str(exc.retry_after)})
+
+
+def _prerender_report_pdfs():
+    for geo in get_args(Geography):
+        for mode in get_args(Mode):
+            _render_report_pdf(mode, geo)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [t.strip() for t in if_none_match.split(",")]
+    return "*" in candidates or any(t.removeprefix("W/") == etag for t in candidates)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup.mark("app_started")
+    if os.getenv("INDICURE_WARMUP") == "1":
+        startup.warm_up_in_background(PDF_MODULE)
+    if os.getenv("INDICURE_PRERENDER_PDFS") == "1":
+        threading.Thread(target=_prerender_report_pdfs, name="pdf-prerender", daemon=True).start()
+    yield
+    export_jobs.shutdown()
+    sources = sys.modules.get("sources")
+    if sources is not None and sources.get_source_hub.cache_info().currsize:
+        sources.get_source_hub().shutdown()
+
+
+app = FastAPI(title="IndiCure AI Prototype API", version="1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -23,32 +154,81 @@ app.add_middleware(
 
 @app.get("/health")
 def health():
+    startup.mark("first_health")
     return {"status": "ok"}
 
-@app.post("/analyze", response_model=AnalyzeResponse)
-def analyze(req: AnalyzeRequest):
-    trace = [
-        AgentTraceItem(agent="Master Orchestration Agent", status="completed",
-                       note="Parsed query, identified drug/indication/geography."),
-        AgentTraceItem(agent="Clinical Trials Agent", status="completed",
-                       note="Extracted endpoints and safety signals."),
-        AgentTraceItem(agent="Web Intelligence Agent", status="completed",
-                       note="Captured India-specific unmet need and guidance gap."),
-        AgentTraceItem(agent="Patent Landscape Agent", status="completed",
-                       note="Assessed patent/FTO feasibility (prototype)."),
-        AgentTraceItem(agent="IQVIA Insights Agent", status="completed",
-                       note="Summarized market rationale (prototype)."),
-        AgentTraceItem(agent="Internal Knowledge Agent", status="completed",
-                       note="Produced mechanistic rationale and differentiation."),
-        AgentTraceItem(agent="Report Generator Agent", status="completed",
-                       note="Assembled dashboard fields and export-ready report."),
-    ]
-
-    report = run_orchestration(req.query, req.geography)
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Prometheus text exposition of agent, orchestration and build_pdf phase latencies."""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+@app.get("/debug/startup")
+def startup_profile():
+    return startup.startup_report()
+
+@app.get("/cache/stats")
+def cache_stats():
+    return {
+        "orchestration": orchestration_cache.stats(),
+        "agents": {name: c.stats() for name, c in agent_caches().items()},
+        "report_pdf": pdf_cache.stats(),
+        "analyze_payload": analyze_cache.stats(),
+    }
+
+@app.get("/sources/stats")
+def source_stats():
+    """Upstream source clients: circuit state, request/retry counts and conditional-cache counters."""
+    return startup.lazy_import("sources").get_source_hub().stats()
+
+@app.get("/admission/stats")
+def admission_stats():
+    return {gate.name: gate.stats() for gate in (export_pdf_gate, report_pdf_gate)}
+
+@app.post("/cache/invalidate")
+def cache_invalidate(include_agents: bool = False):
+    out = {
+        "orchestration": orchestration_cache.invalidate(),
+        "analyze_payload": analyze_cache.invalidate(),
+        "report_pdf": pdf_cache.invalidate(),
+    }
+    if include_agents:
+        out["agents"] = {name: c.invalidate() for name, c in agent_caches().items()}
+    return out
 
+AGENT_NOTES = {
+    MASTER_AGENT: "Parsed query, identified drug/indication/geography.",
+    "Clinical Trials Agent": "Extracted endpoints and safety signals.",
+    "Web Intelligence Agent": "Captured India-specific unmet need and guidance gap.",
+    "Patent Landscape Agent": "Assessed patent/FTO feasibility (prototype).",
+    "IQVIA Insights Agent": "Summarized market rationale (prototype).",
+    "Internal Knowledge Agent": "Produced mechanistic rationale and differentiation.",
+    REPORT_AGENT: "Assembled dashboard fields and export-ready report.",
+}
+
+
+def _build_trace(report: dict) -> list:
+    """Trace from the statuses actually recorded during orchestration."""
+    statuses = report.get("agent_status", {})
+    timings = report.get("timings", {})
+    trace = [AgentTraceItem(agent=MASTER_AGENT, status="completed", note=AGENT_NOTES[MASTER_AGENT],
+                            duration_ms=timings.get("normalize_ms"))]
+    for name, _, _ in WORKER_AGENTS:
+        st = statuses.get(name, {"status": "completed"})
+        trace.append(AgentTraceItem(
+            agent=name,
+            status=st["status"],
+            note=st.get("error") or AGENT_NOTES.get(name, ""),
+            duration_ms=st.get("duration_ms"),
+        ))
+    trace.append(AgentTraceItem(agent=REPORT_AGENT, status="completed", note=AGENT_NOTES[REPORT_AGENT],
+                                duration_ms=timings.get("aggregate_ms")))
+    return trace
+
+
+def _analyze_payload(report: dict) -> dict:
     return {
         "normalized": report["normalized"],
-        "trace": trace,
+        "trace": _build_trace(report),
         "executive_summary": report["executive_summary"],
         "evidence": report["evidence"],
         "unmet_need": report["unmet_need"],
@@ -57,37 +237,381 @@ def analyze(req: AnalyzeRequest):
         "references": report["references"],
     }
 
+
+# Serialized /analyze payloads keyed on the orchestration key: value is (etag, {content-coding: body}).
+analyze_cache = make_cache(
+    maxsize=orchestration_cache.maxsize,
+    ttl=orchestration_cache.ttl,
+    name="analyze_payload",
+    max_bytes=int(os.getenv("INDICURE_ANALYZE_CACHE_BYTES", str(32 * 1024 * 1024))),
+    sizeof=lambda entry: sum(len(body) for body in entry[1].values()),
+)
+# Payloads smaller than this are only stored uncompressed.
+ANALYZE_COMPRESS_MIN_BYTES = 512
+
+
+@lru_cache(maxsize=1)
+def _brotli():
+    """The brotli module when installed (br variants are optional), else None."""
+    try:
+        return startup.lazy_import("brotli")
+    except ImportError:
+        return None
+
+
+def _encode_payload(report: dict) -> Tuple[str, Dict[str, bytes]]:
+    """
+    The /analyze body serialized once with orjson and compressed once per
+    supported content-coding. The Response bypasses response_model, so the
+    payload is validated through AnalyzeResponse here, once per cache fill.
+    """
+    orjson = startup.lazy_import("orjson")
+    body = orjson.dumps(AnalyzeResponse.model_validate(_analyze_payload(report)).model_dump())
+    variants = {"identity": body}
+    if len(body) >= ANALYZE_COMPRESS_MIN_BYTES:
+        variants["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+        brotli = _brotli()
+        if brotli is not None:
+            variants["br"] = brotli.compress(body, quality=11)
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"', variants
+
+
+def _analyze_entry(key: tuple, report: dict) -> Tuple[str, Dict[str, bytes]]:
+    entry = analyze_cache.get(key)
+    if entry is None:
+        entry = _encode_payload(report)
+        cache_for_report(analyze_cache, key, report, entry)
+    return entry
+
+
+def _pick_encoding(accept_encoding: str, available: Dict[str, bytes]) -> str:
+    """Smallest stored variant the client accepts (q=0 excludes); identity otherwise."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        q = params.strip().removeprefix("q=")
+        if coding.strip() and (not q or _q_value(q) > 0):
+            accepted.add(coding.strip())
+    candidates = [c for c in available if c != "identity" and (c in accepted or "*" in accepted)]
+    return min(candidates, key=lambda c: len(available[c]), default="identity")
+
+
+def _q_value(q: str) -> float:
+    try:
+        return float(q)
+    except ValueError:
+        return 0.0
+
+
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@app.post("/corpus/reindex")
+def corpus_reindex():
+    """Re-indexes new/changed files in the guideline corpus and drops stale web-agent results."""
+    from agents.bm25 import get_corpus_index
+
+    index = get_corpus_index()
+    counts = index.refresh()
+    if any(counts.values()):
+        index.save()
+        agent_caches()["Web Intelligence Agent"].invalidate()
+        orchestration_cache.invalidate()
+        analyze_cache.invalidate()
+    return counts
+
+@app.post("/analyze", response_model=AnalyzeResponse)
+async def analyze(req: AnalyzeRequest, request: Request):
+    """
+    Hot queries are answered from analyze_cache: the stored body in the best
+    content-coding the client accepts, with its ETag, without re-encoding.
+    """
+    norm = normalize_query(req.query)
+    key = orchestration_key(req.query, req.geography, req.mode, norm)
+    entry = analyze_cache.get(key)
+    if entry is None:
+        report = await get_orchestration_async(req.query, req.geography, req.mode, norm=norm)
+        entry = _analyze_entry(key, report)
+    startup.mark("first_analyze")
+
+    etag, variants = entry
+    coding = _pick_encoding(request.headers.get("accept-encoding", ""), variants)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if coding != "identity":
+        # A strong validator names one representation, so each coding gets its own.
+        headers["ETag"] = f'{etag[:-1]}-{coding}"'
+        headers["Content-Encoding"] = coding
+    return Response(content=variants[coding], media_type="application/json", headers=headers)
+
+@app.post("/analyze/stream")
+async def analyze_stream(req: AnalyzeRequest):
+    """
+    Server-Sent Events variant of /analyze.
+    Emits one `agent` event per status change (queued/running/completed, with timings),
+    then a single `result` event carrying the AnalyzeResponse payload.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run():
+        try:
+            return await get_orchestration_async(req.query, req.geography, req.mode, on_event=queue.put_nowait)
+        finally:
+            queue.put_nowait(None)
+
+    async def events():
+        task = asyncio.create_task(run())
+        while (ev := await queue.get()) is not None:
+            ev.setdefault("note", AGENT_NOTES.get(ev["agent"], ""))
+            yield _sse("agent", json.dumps(ev, ensure_ascii=False))
+        try:
+            report = await task
+        except Exception as exc:
+            yield _sse("error", json.dumps({"detail": f"{type(exc).__name__}: {exc}"}))
+            return
+        key = orchestration_key(req.query, req.geography, req.mode)
+        yield _sse("result", _analyze_entry(key, report)[1]["identity"].decode())
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# Concurrency beyond the agent pool only queues on it, so it is capped at the pool size.
+BATCH_CONCURRENCY = min(int(os.getenv("INDICURE_BATCH_CONCURRENCY", "8")), AGENT_WORKERS)
+BATCH_MAX = int(os.getenv("INDICURE_BATCH_MAX", "256"))
+
+
+async def _batch_lines(reqs: List[AnalyzeRequest], concurrency: int):
+    """
+    Yields one NDJSON line per request, in completion order.
+
+    At most `concurrency` requests are in flight; responses are written out and
+    dropped as soon as they are ready, so memory does not grow with the batch.
+    Requests that normalize to the same orchestration key share one run, and
+    the per-agent memo (single-flight) shares agent calls across different keys.
+    """
+    inflight: Dict[tuple, asyncio.Future] = {}
+
+    async def one(index: int, req: AnalyzeRequest):
+        key = orchestration_key(req.query, req.geography, req.mode)
+        shared = inflight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(get_orchestration_async(req.query, req.geography, req.mode))
+            inflight[key] = shared
+            shared.add_done_callback(lambda _, key=key: inflight.pop(key, None))
+        return index, await asyncio.shield(shared)
+
+    def line(index: int, task: asyncio.Task) -> str:
+        try:
+            _, report = task.result()
+        except Exception as exc:
+            return json.dumps({"index": index, "error": f"{type(exc).__name__}: {exc}"}) + "\n"
+        req = reqs[index]
+        key = orchestration_key(req.query, req.geography, req.mode)
+        body = _analyze_entry(key, report)[1]["identity"].decode()
+        return f'{{"index": {index}, "response": {body}}}\n'
+
+    pending: Dict[asyncio.Task, int] = {}
+    for index, req in enumerate(reqs):
+        pending[asyncio.ensure_future(one(index, req))] = index
+        if len(pending) >= concurrency:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield line(pending.pop(task), task)
+    while pending:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            yield line(pending.pop(task), task)
+
+@app.post("/analyze/batch")
+async def analyze_batch(
+    reqs: List[AnalyzeRequest],
+    concurrency: int = Query(BATCH_CONCURRENCY, ge=1, le=AGENT_WORKERS),
+):
+    """
+    Screens many queries at once. Streams NDJSON lines of the form
+    {"index": i, "response": AnalyzeResponse} (or {"index": i, "error": ...}) as each finishes.
+    """
+    if len(reqs) > BATCH_MAX:
+        raise HTTPException(status_code=413, detail=f"Batch has {len(reqs)} queries; the limit is {BATCH_MAX}.")
+    return StreamingResponse(
+        _batch_lines(reqs, concurrency),
+        media_type="application/x-ndjson",
+    )
+
+@app.post("/screen")
+async def screen_indication(req: ScreenRequest):
+    """
+    Repurposing screen: ranks every known drug for one indication from batched
+    clinical, mechanism, patent and market features, then runs the full agent
+    pipeline only for the top_k shortlist (reports share the /analyze cache).
+    """
+    screen = startup.lazy_import("agents.screening").screen
+    # Same vocabulary as /analyze, so synonyms and long forms score like the canonical name.
+    indication = canonical_term("indications", req.indication)
+    result = await asyncio.to_thread(screen, indication, req.geography, req.top_k)
+    if req.include_reports:
+        reports = await asyncio.gather(*(
+            get_orchestration_async(
+                "", req.geography, req.mode,
+                norm=normalize_pair(c["drug"], indication, req.geography),
+            )
+            for c in result["shortlist"]
+        ))
+        for candidate, report in zip(result["shortlist"], reports):
+            candidate["report"] = _analyze_payload(report)
+    return result
+
 @app.post("/export/pdf")
-def export_pdf(req: AnalyzeRequest):
-    report = run_orchestration(req.query, req.geography)
+async def export_pdf(req: AnalyzeRequest):
+    """
+    Renders into a spooled temp file and streams it, so large reports never sit in memory twice.
+    Admission-controlled: 503 with Retry-After once export_pdf_gate's queue is full.
+    """
+    try:
+        async with export_pdf_gate.admit():
+            report = await asyncio.to_thread(_export_report, req)
+            pdf = await asyncio.to_thread(build_pdf_spooled, report)
+    except OverloadedError as exc:
+        raise _overloaded(exc)
+    size = pdf.seek(0, os.SEEK_END)
+    pdf.seek(0)
+
+    return StreamingResponse(
+        _iter_file(pdf),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{_export_filename(report)}"',
+            "Content-Length": str(size),
+        },
+    )
+
+REPORT_PACK_MAX = int(os.getenv("INDICURE_REPORT_PACK_MAX", "48"))
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", text).strip("-")
+
+
+@app.post("/export/pack")
+async def export_pack(req: ReportPackRequest):
+    """
+    Bulk export of queries x modes x geographies as one streamed ZIP.
+
+    Queries are deduplicated by their normalized form, orchestration runs once
+    per unique (query, geography) (mode only labels the report), and all PDFs
+    render in parallel on the export process pool. Archive entries are written
+    as renders finish, followed by manifest.json.
+    """
+    plans: Dict[tuple, dict] = {}
+    for query in req.queries:
+        norm = normalize_query(query)
+        for geo in dict.fromkeys(req.geographies):
+            plans.setdefault((tuple(sorted(norm.items())), geo), {"query": query, "norm": norm, "geo": geo})
+    modes = list(dict.fromkeys(req.modes))
+    total = len(plans) * len(modes)
+    if total > REPORT_PACK_MAX:
+        raise HTTPException(status_code=413, detail=f"Report pack has {total} PDFs; the limit is {REPORT_PACK_MAX}.")
+    excess = export_jobs.pending() + total - export_jobs.max_pending
+    if excess > 0:
+        # Long enough for `excess` queued renders to finish and make room for the pack.
+        retry_after = export_jobs.retry_after(excess)
+        raise HTTPException(status_code=503, detail="Export queue is too busy for this pack.",
+                            headers={"Retry-After": str(retry_after)})
+
+    reports = await asyncio.gather(*(
+        get_orchestration_async(p["query"], p["geo"], modes[0], norm=p["norm"]) for p in plans.values()
+    ))
+    items = []
+    for plan, report in zip(plans.values(), reports):
+        stem = f'{_slug(plan["norm"]["drug"])}_{_slug(plan["norm"]["repurposing_target"])}_{_slug(plan["geo"])}'
+        for mode in modes:
+            items.append((f"{stem}_{mode}.pdf", {**report, "analysis_mode": mode}))
+
+    return StreamingResponse(
+        stream_report_pack(export_jobs, items),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="indicure_report_pack.zip"'},
+    )
+
+
+def _export_report(req: AnalyzeRequest) -> dict:
+    report = get_orchestration(req.query, req.geography, req.mode)
 
     if getattr(req, "analysis_mode", None):
         report["analysis_mode"] = req.analysis_mode
 
-    pdf_bytes = build_pdf(report)
+    return report
+
+
+def _export_filename(report: dict) -> str:
+    norm = report["normalized"]
+    return f'indicure_{_slug(norm["drug"])}_{_slug(norm["repurposing_target"])}_report.pdf'.lower()
+
+@app.post("/export/jobs", status_code=202)
+def submit_export_job(req: AnalyzeRequest):
+    """Queues a PDF render on the export process pool and returns its job id."""
+    try:
+        report = _export_report(req)
+        job_id = export_jobs.submit(report, filename=_export_filename(report))
+    except QueueFullError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    return {
+        "job_id": job_id,
+        "status_url": f"/export/jobs/{job_id}",
+        "download_url": f"/export/jobs/{job_id}/pdf",
+    }
+
+@app.get("/export/jobs")
+def export_job_stats():
+    return export_jobs.stats()
+
+@app.get("/export/jobs/{job_id}")
+def export_job_status(job_id: str):
+    status = export_jobs.status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Unknown export job.")
+    return status
+
+@app.get("/export/jobs/{job_id}/pdf")
+def export_job_download(job_id: str):
+    status = export_jobs.status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Unknown export job.")
+    if status["status"] != "done":
+        raise HTTPException(status_code=409, detail=f"Export job is {status['status']}.")
 
     return Response(
-        content=pdf_bytes,
+        content=export_jobs.result(job_id),
         media_type="application/pdf",
-        headers={"Content-Disposition": 'attachment; filename="indicure_ranolazine_report.pdf"'},
+        headers={"Content-Disposition": f'attachment; filename="{status["filename"]}"'},
     )
 
 @app.get("/api/report/pdf")
-def report_pdf(mode: str = "General", geo: str = "India"):
-    report = run_orchestration(
-        "Assess repurposing potential of Ranolazine for HFpEF",
-        geo,
-    )
-
-    report["analysis_mode"] = mode
+async def report_pdf(request: Request, mode: str = "General", geo: str = "India"):
+    """Cached PDFs are served directly; only renders go through report_pdf_gate (503 + Retry-After when full)."""
+    entry = pdf_cache.get((mode, geo))
+    if entry is None:
+        try:
+            async with report_pdf_gate.admit():
+                # Re-checks the cache first: an earlier request may have rendered it while this one queued.
+                entry = await asyncio.to_thread(_render_report_pdf, mode, geo)
+        except OverloadedError as exc:
+            raise _overloaded(exc)
+    etag, pdf_bytes = entry
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
 
-    pdf_bytes = build_pdf(report)
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
 
+    headers["Content-Disposition"] = f'attachment; filename="IndiCure_Ranolazine_HFpEF_{geo}_{mode}.pdf"'
     return Response(
         content=pdf_bytes,
         media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="IndiCure_Ranolazine_HFpEF_{geo}_{mode}.pdf"'
-        },
+        headers=headers,
     )
 
+
+startup.mark("app_imported")
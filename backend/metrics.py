@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+# Seconds; spans from sub-millisecond agent lookups up to multi-second renders.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """
+    Minimal Prometheus-style histogram (cumulative buckets + sum + count) per label set.
+    Values live in this process only; pool worker processes keep their own copies.
+    """
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][idx] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = [(k, list(v[0]), v[1], v[2]) for k, v in sorted(self._series.items())]
+        for key, counts, total, count in items:
+            base = [f'{n}="{v}"' for n, v in zip(self.labelnames, key)]
+            cumulative = 0
+            for bound, c in zip(self.buckets + (float("inf"),), counts):
+                cumulative += c
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = ",".join(base + ['le="' + le + '"'])
+                lines.append(f"{self.name}_bucket{{{labels}}} {cumulative}")
+            suffix = f"{{{','.join(base)}}}" if base else ""
+            lines.append(f"{self.name}_sum{suffix} {total}")
+            lines.append(f"{self.name}_count{suffix} {count}")
+        return lines
+
+
+REGISTRY: List[Histogram] = []
+
+
+@contextmanager
+def span(histogram: Histogram, **labels: str) -> Iterator[None]:
+    """Times the enclosed block and records it (in seconds) on `histogram`."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - started, **labels)
+
+
+def render_prometheus() -> str:
+    lines: List[str] = []
+    for h in REGISTRY:
+        lines.extend(h.render())
+    return "\n".join(lines) + "\n"
+
+
+AGENT_DURATION = Histogram(
+    "indicure_agent_duration_seconds",
+    "Worker agent runtime during orchestration.",
+    ("agent", "status"),
+)
+ORCHESTRATION_DURATION = Histogram(
+    "indicure_orchestration_duration_seconds",
+    "End-to-end run_orchestration time (cache misses only).",
+    ("mode",),
+)
+PDF_PHASE_DURATION = Histogram(
+    "indicure_pdf_phase_duration_seconds",
+    "build_pdf time by phase (styles, tables, charts, layout, total).",
+    ("phase",),
+)
+SOURCE_REQUEST_DURATION = Histogram(
+    "indicure_source_request_duration_seconds",
+    "Upstream source calls by outcome (ok, not_modified, fresh, error), including retries.",
+    ("source", "outcome"),
+)
@@ -0,0 +1,110 @@
+"""
+Local stand-in for the upstream sources (ClinicalTrials.gov, PubMed, PatentScope,
+IQVIA), serving the bundled local datasets in JSON under /<source>/... .
+
+Every response carries an ETag and honours If-None-Match, so the client's
+conditional cache is exercised. Latency, failures and rate limiting are
+injectable for tests and benchmarks:
+
+    cd backend
+    INDICURE_MOCK_LATENCY_MS=50 INDICURE_MOCK_FAILURE_RATE=0.1 uvicorn mock_sources:app --port 8100
+    INDICURE_SOURCE_BASE_URL=http://127.0.0.1:8100 uvicorn main:app --reload --port 8000
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+from collections import Counter
+from typing import Any, Dict
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response
+
+MOCK_LATENCY_MS = float(os.getenv("INDICURE_MOCK_LATENCY_MS", "0"))
+MOCK_FAILURE_RATE = float(os.getenv("INDICURE_MOCK_FAILURE_RATE", "0"))
+# Requests per second allowed per source before answering 429; 0 disables the limit.
+MOCK_RATE_LIMIT = float(os.getenv("INDICURE_MOCK_RATE", "0"))
+MOCK_MAX_AGE = int(os.getenv("INDICURE_MOCK_MAX_AGE", "0"))
+
+app = FastAPI(title="IndiCure mock sources", version="1.0")
+
+counters: Counter = Counter()
+_windows: Dict[str, list] = {}
+
+
+@app.middleware("http")
+async def inject_faults(request: Request, call_next):
+    source = request.url.path.strip("/").split("/", 1)[0]
+    counters[f"{source}:requests"] += 1
+    if MOCK_RATE_LIMIT > 0 and source != "_stats":
+        now = time.monotonic()
+        window = [t for t in _windows.get(source, []) if now - t < 1.0]
+        if len(window) >= MOCK_RATE_LIMIT:
+            _windows[source] = window
+            counters[f"{source}:throttled"] += 1
+            return Response(status_code=429, headers={"Retry-After": "1"})
+        window.append(now)
+        _windows[source] = window
+    if MOCK_LATENCY_MS > 0:
+        await asyncio.sleep(MOCK_LATENCY_MS / 1000 * random.uniform(0.5, 1.5))
+    if MOCK_FAILURE_RATE > 0 and source != "_stats" and random.random() < MOCK_FAILURE_RATE:
+        counters[f"{source}:failed"] += 1
+        return Response(status_code=503)
+    return await call_next(request)
+
+
+def _json(request: Request, payload: Any) -> Response:
+    body = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": f"max-age={MOCK_MAX_AGE}"}
+    if request.headers.get("If-None-Match") == etag:
+        counters["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.get("/ctgov/studies")
+def ctgov_studies(request: Request, drug: str, condition: str):
+    from agents.evidence_store import get_evidence_store
+
+    evidence = get_evidence_store().lookup(drug, condition)
+    studies = [] if evidence is None else [{"drug": drug, "condition": condition, **evidence}]
+    return _json(request, {"totalCount": len(studies), "studies": studies})
+
+
+@app.get("/pubmed/esearch")
+def pubmed_esearch(request: Request, term: str, retmax: int = 5):
+    from agents.bm25 import get_corpus_index
+
+    hits = get_corpus_index().search(term, k=retmax)
+    return _json(request, {"count": len(hits), "results": hits})
+
+
+@app.get("/patentscope/search")
+def patentscope_search(request: Request, drug: str, jurisdiction: str = ""):
+    from agents.patent_index import get_patent_index
+
+    records = [
+        r for r in get_patent_index().for_drug(drug)
+        if not jurisdiction or r["jurisdiction"].upper() == jurisdiction.upper()
+    ]
+    return _json(request, {"total": len(records), "patents": records})
+
+
+@app.get("/iqvia/market")
+def iqvia_market(request: Request, geography: str, indication: str):
+    from agents.market_data import get_market_dataset
+
+    row = get_market_dataset().lookup(geography, indication)
+    if row is None:
+        raise HTTPException(status_code=404, detail="No market data for this segment.")
+    return _json(request, {k: v.item() if hasattr(v, "item") else v for k, v in row.items()})
+
+
+@app.get("/_stats")
+def stats():
+    return dict(counters)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Literal, Optional
+from typing import Annotated, Dict, Any, List, Literal, Optional
 
 Mode = Literal["General", "Clinical", "Patent", "Market"]
 OutputFormat = Literal["Summary + Risks + Recommendation"]
@@ -11,10 +11,23 @@ class AnalyzeRequest(BaseModel):
     output_format: OutputFormat = "Summary + Risks + Recommendation"
     geography: Geography = "India"
 
+class ScreenRequest(BaseModel):
+    indication: str = Field(min_length=2)
+    geography: Geography = "India"
+    mode: Mode = "General"
+    top_k: int = Field(default=5, ge=1, le=25)
+    include_reports: bool = True
+
+class ReportPackRequest(BaseModel):
+    queries: List[Annotated[str, Field(min_length=10)]] = Field(min_length=1)
+    modes: List[Mode] = Field(default_factory=lambda: ["General", "Clinical", "Patent", "Market"], min_length=1)
+    geographies: List[Geography] = Field(default_factory=lambda: ["India"], min_length=1)
+
 class AgentTraceItem(BaseModel):
     agent: str
-    status: Literal["queued", "running", "completed"]
+    status: Literal["queued", "running", "completed", "timeout", "failed"]
     note: str
+    duration_ms: Optional[float] = None
 
 class AnalyzeResponse(BaseModel):
     normalized: Dict[str, Any]
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import httpx
+
+from cache import TTLCache
+from metrics import SOURCE_REQUEST_DURATION
+
+# Upstream sources the agents are meant to query in production, with conservative
+# default client limits. Every value can be overridden per source through
+# INDICURE_SOURCE_<NAME>_{URL,RATE,BURST,CONCURRENCY}; INDICURE_SOURCE_BASE_URL
+# points every source at one host (e.g. the mock server) under /<name>.
+SOURCE_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "ctgov": {"url": "https://clinicaltrials.gov/api/v2", "rate": 5.0, "burst": 5, "concurrency": 4},
+    "pubmed": {"url": "https://eutils.ncbi.nlm.nih.gov/entrez/eutils", "rate": 3.0, "burst": 3, "concurrency": 3},
+    "patentscope": {"url": "https://patentscope.wipo.int/search/en", "rate": 2.0, "burst": 2, "concurrency": 2},
+    "iqvia": {"url": "", "rate": 5.0, "burst": 5, "concurrency": 4},
+}
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_RETRY_AFTER = 30.0
+
+
+class SourceError(RuntimeError):
+    """An upstream source request failed after retries (or was rejected with a non-retryable status)."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class CircuitOpenError(SourceError):
+    """Raised without touching the network while a source's circuit breaker is open."""
+
+
+class TokenBucket:
+    """
+    Rate limiter: `rate` requests per second with bursts of up to `burst`.
+    Callers reserve a token immediately and sleep off any deficit, so waiters
+    are served in arrival order without polling.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+
+class CircuitBreaker:
+    """
+    Closed → open after `failure_threshold` consecutive failed calls; open
+    rejects calls for `reset_timeout` seconds, then lets a single probe
+    through (half-open) whose outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def before_call(self) -> None:
+        if self.state == "closed":
+            return
+        # Half-open means the single probe is already in flight.
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = "half_open"
+            return
+        raise CircuitOpenError("circuit open")
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def _max_age(response: httpx.Response) -> float:
+    for directive in response.headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "no-store":
+            return -1.0
+        if name.lower() == "max-age" and value.isdigit():
+            return float(value)
+    return 0.0
+
+
+class SourceClient:
+    """
+    JSON client for one upstream source.
+
+    Requests share a keep-alive connection pool capped at `concurrency`
+    connections, pass a per-source token bucket, and are retried with
+    exponential backoff (honouring Retry-After) on transport errors, 429 and
+    5xx gateway statuses. A circuit breaker stops calling a source that keeps
+    failing, and identical concurrent requests are coalesced into one call.
+    Responses with an ETag or Last-Modified are kept in a TTLCache and
+    revalidated with a conditional request; a 304 reuses the cached body, and
+    a fresh max-age skips the request entirely.
+
+    All methods must run on one event loop (SourceHub's).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        rate: float = 5.0,
+        burst: int = 5,
+        concurrency: int = 4,
+        retries: int = 3,
+        backoff: float = 0.25,
+        timeout: float = 10.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        cache_size: int = 1024,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.cache = TTLCache(maxsize=cache_size, ttl=24 * 3600, name=f"source:{name}")
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.requests = 0
+        self.retried = 0
+        self.not_modified = 0
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            if not self.base_url:
+                raise SourceError(f"{self.name}: no URL configured (set INDICURE_SOURCE_{self.name.upper()}_URL)")
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency,
+                    keepalive_expiry=30.0,
+                ),
+                headers={"Accept": "application/json", "User-Agent": "IndiCure/1.0"},
+                transport=self._transport,
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._client
+
+    async def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET path and decode JSON; concurrent calls for the same request share one upstream call."""
+        key = (path, tuple(sorted((params or {}).items())))
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(self._get_json(key, path, params))
+            self._inflight[key] = shared
+            shared.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+        return await asyncio.shield(shared)
+
+    async def _get_json(self, key, path: str, params: Optional[Dict[str, Any]]) -> Any:
+        http = self._http()
+        cached = self.cache.get(key)
+        if cached is not None and cached["fresh_until"] > time.monotonic():
+            SOURCE_REQUEST_DURATION.observe(0.0, source=self.name, outcome="fresh")
+            return cached["body"]
+
+        self.breaker.before_call()
+        headers = {}
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        started = time.perf_counter()
+        ok = up = False
+        try:
+            response = await self._send(http, path, params, headers)
+            ok = up = True
+        except SourceError as exc:
+            # A 4xx rejection means the source is up; only outages count against the breaker.
+            up = exc.status is not None and exc.status < 500 and exc.status != 429
+            raise
+        finally:
+            # Settled on every exit, including httpx errors that are not transport errors
+            # (DecodingError, TooManyRedirects) and cancellation, so a half-open probe
+            # can never leave the breaker stuck.
+            if up:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+            if not ok:
+                SOURCE_REQUEST_DURATION.observe(time.perf_counter() - started, source=self.name, outcome="error")
+
+        if response.status_code == 304 and cached is not None:
+            self.not_modified += 1
+            cached["fresh_until"] = time.monotonic() + max(_max_age(response), 0.0)
+            SOURCE_REQUEST_DURATION.observe(time.perf_counter() - started, source=self.name, outcome="not_modified")
+            return cached["body"]
+
+        body = response.json()
+        max_age = _max_age(response)
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if max_age >= 0 and (etag or last_modified or max_age > 0):
+            self.cache.set(key, {
+                "body": body,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fresh_until": time.monotonic() + max_age,
+            })
+        SOURCE_REQUEST_DURATION.observe(time.perf_counter() - started, source=self.name, outcome="ok")
+        return body
+
+    async def _send(self, http: httpx.AsyncClient, path: str, params, headers) -> httpx.Response:
+        for attempt in range(self.retries + 1):
+            await self.bucket.acquire()
+            status = delay = None
+            try:
+                async with self._semaphore:
+                    self.requests += 1
+                    response = await http.get(path, params=params, headers=headers)
+            except httpx.TransportError as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            else:
+                if response.status_code < 400:
+                    return response
+                status = response.status_code
+                error = f"HTTP {status}"
+                if status not in RETRY_STATUSES:
+                    raise SourceError(f"{self.name} {path}: {error}", status)
+                delay = _retry_after(response)
+            if attempt == self.retries:
+                raise SourceError(f"{self.name} {path}: {error} after {attempt + 1} attempt(s)", status)
+            self.retried += 1
+            if delay is None:
+                delay = self.backoff * (2 ** attempt) * (0.5 + random.random())
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "circuit": self.breaker.state,
+            "requests": self.requests,
+            "retried": self.retried,
+            "not_modified": self.not_modified,
+            "cache": self.cache.stats(),
+        }
+
+
+class SourceHub:
+    """
+    Owns every SourceClient on one background event loop thread, so blocking
+    agents (running on the agent thread pool) and async code on the API loop
+    share the same connection pools, rate limits and breakers.
+    """
+
+    def __init__(self, clients: Dict[str, SourceClient]):
+        self.clients = clients
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, transport: Optional[httpx.AsyncBaseTransport] = None) -> "SourceHub":
+        base = os.getenv("INDICURE_SOURCE_BASE_URL", "").rstrip("/")
+        clients = {}
+        for name, defaults in SOURCE_DEFAULTS.items():
+            prefix = f"INDICURE_SOURCE_{name.upper()}_"
+            clients[name] = SourceClient(
+                name,
+                os.getenv(prefix + "URL") or (f"{base}/{name}" if base else defaults["url"]),
+                rate=float(os.getenv(prefix + "RATE", defaults["rate"])),
+                burst=int(os.getenv(prefix + "BURST", defaults["burst"])),
+                concurrency=int(os.getenv(prefix + "CONCURRENCY", defaults["concurrency"])),
+                transport=transport,
+            )
+        return cls(clients)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="indicure-sources", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def fetch(self, source: str, path: str, params: Optional[Dict[str, Any]] = None) -> Future:
+        """Schedules a GET on the hub loop; returns a concurrent.futures.Future with the decoded JSON."""
+        client = self.clients.get(source)
+        if client is None:
+            raise KeyError(f"unknown source {source!r}")
+        return asyncio.run_coroutine_threadsafe(client.get_json(path, params), self.loop)
+
+    def fetch_sync(self, source: str, path: str, params: Optional[Dict[str, Any]] = None,
+                   timeout: Optional[float] = None) -> Any:
+        """Blocking fetch for agents running on worker threads (never call from the hub loop itself)."""
+        return self.fetch(source, path, params).result(timeout)
+
+    async def afetch(self, source: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Awaitable fetch for coroutine agents on any other event loop."""
+        return await asyncio.wrap_future(self.fetch(source, path, params))
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: client.stats() for name, client in self.clients.items()}
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        async def _close():
+            await asyncio.gather(*(c.aclose() for c in self.clients.values()), return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_close(), loop).result(timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            loop.close()
+
+
+@lru_cache(maxsize=1)
+def get_source_hub() -> SourceHub:
+    return SourceHub.from_env()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from types import ModuleType
+from typing import Any, Dict
+
+# Imported first by main.py, so this approximates "process is loading the app".
+_T0 = time.perf_counter()
+
+_lock = threading.Lock()
+_marks: Dict[str, float] = {}
+_imports: Dict[str, float] = {}
+
+
+def _elapsed_ms() -> float:
+    return round((time.perf_counter() - _T0) * 1000, 3)
+
+
+def mark(name: str) -> None:
+    """Records the first time a milestone is reached (e.g. first /health response)."""
+    if name in _marks:
+        return
+    with _lock:
+        _marks.setdefault(name, _elapsed_ms())
+
+
+def lazy_import(module: str) -> ModuleType:
+    """
+    importlib.import_module that records how long the first import took.
+    Used for heavy dependencies (ReportLab, matplotlib) kept off the cold-start path.
+    """
+    if module in _imports:
+        return importlib.import_module(module)
+    started = time.perf_counter()
+    mod = importlib.import_module(module)
+    with _lock:
+        _imports.setdefault(module, round((time.perf_counter() - started) * 1000, 3))
+    return mod
+
+
+def warm_up_in_background(*modules: str) -> threading.Thread:
+    """Imports modules on a daemon thread so the first export does not pay for them."""
+    def _run():
+        for m in modules:
+            lazy_import(m)
+        mark("warmup_done")
+
+    t = threading.Thread(target=_run, name="warmup", daemon=True)
+    t.start()
+    return t
+
+
+def startup_report() -> Dict[str, Any]:
+    return {
+        "uptime_ms": _elapsed_ms(),
+        "milestones_ms": dict(_marks),
+        "deferred_imports_ms": dict(_imports),
+    }
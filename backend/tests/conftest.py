@@ -0,0 +1,37 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Tests import backend modules the way the app does (run from backend/).
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class _AppClient:
+    """Synchronous in-process client for the FastAPI app; each call runs on its own event loop."""
+
+    def __init__(self, app):
+        self.app = app
+
+    def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        async def go():
+            transport = httpx.ASGITransport(app=self.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.request(method, path, **kwargs)
+
+        return asyncio.run(go())
+
+    def get(self, path: str, **kwargs) -> httpx.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> httpx.Response:
+        return self.request("POST", path, **kwargs)
+
+
+@pytest.fixture
+def client() -> _AppClient:
+    import main
+
+    return _AppClient(main.app)
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+import main
+from admission import AdmissionGate, OverloadedError
+
+
+def test_full_queue_rejects_with_retry_after():
+    async def go():
+        gate = AdmissionGate("test", limit=1, queue=1, initial_estimate=4.0)
+        release = asyncio.Event()
+
+        async def hold():
+            async with gate.admit():
+                await release.wait()
+
+        holder = asyncio.ensure_future(hold())
+        waiter = asyncio.ensure_future(hold())
+        await asyncio.sleep(0)
+        assert (gate.active, len(gate._waiters)) == (1, 1)
+
+        with pytest.raises(OverloadedError) as exc:
+            async with gate.admit():
+                pass
+        # Backlog of two requests at ~4 s each on one slot.
+        assert exc.value.retry_after == 8
+        assert gate.rejected == 1
+
+        release.set()
+        await asyncio.gather(holder, waiter)
+        assert (gate.active, gate.admitted) == (0, 2)
+
+    asyncio.run(go())
+
+
+def test_queued_request_times_out():
+    async def go():
+        gate = AdmissionGate("test", limit=1, queue=4, max_wait=0.05)
+        async with gate.admit():
+            with pytest.raises(OverloadedError):
+                async with gate.admit():
+                    pass
+        assert gate.timed_out == 1 and not gate._waiters and gate.active == 0
+
+    asyncio.run(go())
+
+
+def test_export_pdf_returns_503_with_retry_after(client, monkeypatch):
+    gate = AdmissionGate("/export/pdf", limit=1, queue=0, initial_estimate=3.0)
+    gate.active = 1  # the only render slot is taken
+    monkeypatch.setattr(main, "export_pdf_gate", gate)
+
+    response = client.post("/export/pdf", json={"query": "Assess Ranolazine for HFpEF"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+    assert gate.rejected == 1
@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+import pytest
+
+import main
+
+
+def test_batch_rejects_out_of_range_concurrency(client):
+    body = [{"query": "Ranolazine for HFpEF"}]
+    assert client.post("/analyze/batch", params={"concurrency": 0}, json=body).status_code == 422
+    assert client.post("/analyze/batch", params={"concurrency": main.AGENT_WORKERS + 1}, json=body).status_code == 422
+
+
+def test_batch_rejects_oversized_batches(client, monkeypatch):
+    monkeypatch.setattr(main, "BATCH_MAX", 2)
+    response = client.post("/analyze/batch", json=[{"query": "Ranolazine for HFpEF"}] * 3)
+    assert response.status_code == 413
+    assert "limit is 2" in response.json()["detail"]
+
+
+@pytest.fixture
+def orchestration_calls(monkeypatch):
+    """Records each orchestration the batch starts; Ranolazine queries take 0.2 s longer."""
+    calls = []
+    real = main.get_orchestration_async
+
+    async def traced(query, geography, mode="General", **kwargs):
+        calls.append(query)
+        await asyncio.sleep(0.2 if "Ranolazine" in query else 0)
+        return await real(query, geography, mode, **kwargs)
+
+    monkeypatch.setattr(main, "get_orchestration_async", traced)
+    return calls
+
+
+def _lines(response):
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_batch_runs_duplicate_queries_once(client, orchestration_calls):
+    body = [
+        {"query": "Assess repurposing potential of Ranolazine for HFpEF in India"},
+        {"query": "Ranolazine in HFpEF (India)"},
+    ]
+    lines = _lines(client.post("/analyze/batch", json=body))
+
+    assert len(orchestration_calls) == 1
+    by_index = {line["index"]: line["response"] for line in lines}
+    assert sorted(by_index) == [0, 1]
+    assert by_index[0] == by_index[1]
+
+
+def test_batch_lines_arrive_in_completion_order(client, orchestration_calls):
+    body = [
+        {"query": "Assess Ranolazine for HFpEF"},
+        {"query": "Assess Empagliflozin for HFrEF"},
+        {"query": "Assess Colchicine for Atrial fibrillation"},
+    ]
+    lines = _lines(client.post("/analyze/batch", json=body))
+
+    assert [line["index"] for line in lines][-1] == 0
+    assert sorted(line["index"] for line in lines) == [0, 1, 2]
+    for line in lines:
+        drug = body[line["index"]]["query"].split()[1]
+        assert line["response"]["normalized"]["drug"] == drug
@@ -0,0 +1,35 @@
+import gzip
+import json
+
+import pytest
+from pydantic import ValidationError
+
+import main
+from agents import master
+from models import AnalyzeResponse
+
+QUERIES = [
+    "Assess repurposing potential of Ranolazine for HFpEF in India",
+    "Assess Metformin for HFpEF in India",
+    "Assess Empagliflozin for HFrEF in India",
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_every_encoded_variant_matches_the_response_model(query):
+    report = master.get_orchestration(query, "India", "General")
+    _, variants = main._encode_payload(report)
+    decoders = {"identity": lambda body: body, "gzip": gzip.decompress}
+    brotli = main._brotli()
+    if brotli is not None:
+        decoders["br"] = brotli.decompress
+    assert set(variants) <= set(decoders)
+    for coding, body in variants.items():
+        AnalyzeResponse.model_validate(json.loads(decoders[coding](body)))
+
+
+def test_invalid_report_is_rejected_before_caching():
+    report = dict(master.get_orchestration(QUERIES[0], "India", "General"))
+    report["references"] = ["bare title"]
+    with pytest.raises(ValidationError):
+        main._encode_payload(report)
@@ -0,0 +1,32 @@
+import json
+
+import main
+from agents import master
+
+QUERY = "Assess repurposing potential of Ranolazine for HFpEF in India"
+
+
+def _events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_stream_emits_agent_events_then_one_result_matching_analyze(client):
+    master.orchestration_cache.invalidate()
+    main.analyze_cache.invalidate()
+
+    response = client.post("/analyze/stream", json={"query": QUERY})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+
+    kinds = [kind for kind, _ in events]
+    assert kinds[-1] == "result" and kinds.count("result") == 1
+    assert set(kinds[:-1]) == {"agent"}
+    completed = {data["agent"] for kind, data in events if kind == "agent" and data["status"] == "completed"}
+    assert {name for name, _, _ in master.WORKER_AGENTS} <= completed
+
+    assert events[-1][1] == client.post("/analyze", json={"query": QUERY}).json()
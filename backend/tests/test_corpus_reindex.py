@@ -0,0 +1,58 @@
+import pytest
+
+import main
+from agents import bm25, master, web
+
+QUERY = "Assess repurposing potential of Ranolazine for HFpEF in India"
+
+
+def _clear_caches():
+    master.agent_caches()["Web Intelligence Agent"].invalidate()
+    master.orchestration_cache.invalidate()
+    main.analyze_cache.invalidate()
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    """A corpus directory of its own, indexed into a fresh BM25Index that the app and agent use."""
+    corpus_dir = tmp_path / "corpus"
+    corpus_dir.mkdir()
+    (corpus_dir / "review.txt").write_text(
+        "HFpEF review\n\nHFpEF burden in India is rising with hypertension and diabetes.\n", encoding="utf-8"
+    )
+
+    class Index(bm25.BM25Index):
+        def refresh(self, corpus_dir=corpus_dir):
+            return super().refresh(corpus_dir)
+
+        def save(self, path=tmp_path / "corpus.idx"):
+            super().save(path)
+
+    index = Index()
+    index.refresh()
+    monkeypatch.setattr(bm25, "get_corpus_index", lambda: index)
+    monkeypatch.setattr(web, "get_corpus_index", lambda: index)
+    _clear_caches()
+    yield corpus_dir
+    _clear_caches()
+
+
+def _burden(client):
+    return client.post("/analyze", json={"query": QUERY}).json()["unmet_need"]["india_burden"]
+
+
+def test_reindex_picks_up_corpus_changes_and_refreshes_reports(client, corpus):
+    assert _burden(client) == ["HFpEF burden in India is rising with hypertension and diabetes."]
+    assert client.post("/corpus/reindex").json() == {"added": 0, "updated": 0, "removed": 0}
+
+    (corpus / "registry.txt").write_text(
+        "HFpEF registry\n\nHFpEF mortality in India: many cases remain underdiagnosed.\n", encoding="utf-8"
+    )
+    assert client.post("/corpus/reindex").json() == {"added": 1, "updated": 0, "removed": 0}
+    assert "HFpEF mortality in India: many cases remain underdiagnosed." in _burden(client)
+
+    (corpus / "review.txt").write_text("HFpEF review\n\nHFpEF prevalence in India is now tracked.\n", encoding="utf-8")
+    (corpus / "registry.txt").unlink()
+    assert client.post("/corpus/reindex").json() == {"added": 0, "updated": 1, "removed": 1}
+    assert _burden(client) == ["HFpEF prevalence in India is now tracked."]
+    assert (corpus.parent / "corpus.idx").exists()
@@ -0,0 +1,82 @@
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from jobs import ExportJobs, QueueFullError
+
+
+def _finished_job(jobs: ExportJobs, job_id: str, finished_at: float) -> None:
+    future = Future()
+    future.set_result((b"%PDF", 1.0))
+    jobs._jobs[job_id] = {"id": job_id, "_future": future, "_submitted": 0.0, "finished_at": finished_at}
+
+
+def test_status_prunes_expired_jobs():
+    jobs = ExportJobs(max_workers=1, retain_seconds=60)
+    _finished_job(jobs, "old", time.time() - 120)
+    _finished_job(jobs, "new", time.time())
+
+    assert jobs.status("old") is None
+    assert jobs.result("new") == b"%PDF"
+    assert list(jobs._jobs) == ["new"]
+
+
+def test_finished_jobs_are_capped_oldest_first():
+    jobs = ExportJobs(max_workers=1, max_finished=3)
+    now = time.time()
+    for i in range(5):
+        _finished_job(jobs, f"job{i}", now - 10 + i)
+
+    assert jobs.status("job4")["status"] == "done"
+    assert sorted(jobs._jobs) == ["job2", "job3", "job4"]
+
+
+def test_prune_keeps_unfinished_jobs():
+    jobs = ExportJobs(max_workers=1, max_finished=0)
+    jobs._jobs["queued"] = {"id": "queued", "_future": Future(), "_submitted": 0.0}
+    _finished_job(jobs, "done", time.time())
+
+    assert jobs.status("queued")["status"] == "queued"
+    assert list(jobs._jobs) == ["queued"]
+
+
+class _FakePool:
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+
+def test_submit_future_renders_count_as_pending():
+    jobs = ExportJobs(max_workers=1, max_pending=3)
+    jobs._pool = _FakePool()
+    renders = [jobs.submit_future({}) for _ in range(2)]
+    job_id = jobs.submit({})
+    assert jobs.pending() == 3
+    assert jobs.stats()["pack_renders"] == 2
+
+    with pytest.raises(QueueFullError):
+        jobs.submit({})
+
+    renders[0].set_result((b"%PDF", 1.0))
+    renders[1].cancel()
+    assert jobs.pending() == 1
+    jobs._pool.futures[-1].set_result((b"%PDF", 1.0))
+    assert jobs.pending() == 0 and jobs.status(job_id)["status"] == "done"
+
+
+def test_retry_after_follows_observed_render_time():
+    jobs = ExportJobs(max_workers=2, initial_estimate=1.0, alpha=0.5)
+    jobs._pool = _FakePool()
+    assert jobs.retry_after(4) == 2
+
+    render = jobs.submit_future({})
+    render.set_result((b"%PDF", 5000.0))
+    assert jobs.ewma_render_seconds == 3.0
+    jobs.submit_future({}).cancel()
+    assert jobs.ewma_render_seconds == 3.0
+    assert jobs.retry_after(4) == 6 and jobs.retry_after(0) == 1
@@ -0,0 +1,69 @@
+import io
+import json
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import jobs as jobs_module
+import main
+from jobs import ExportJobs
+
+QUERIES = [
+    "Assess repurposing potential of Ranolazine for HFpEF in India",
+    "Assess Empagliflozin for HFrEF in India",
+]
+MODES = ["General", "Clinical"]
+
+
+@pytest.fixture
+def export_jobs(monkeypatch):
+    """ExportJobs rendering on threads instead of the spawn pool; same render function."""
+    jobs = ExportJobs(max_workers=len(QUERIES) * len(MODES), max_pending=8)
+    jobs._pool = ThreadPoolExecutor(max_workers=jobs.max_workers)
+    monkeypatch.setattr(main, "export_jobs", jobs)
+    yield jobs
+    jobs._pool.shutdown(wait=True)
+
+
+def test_pack_zip_has_one_pdf_per_report_and_a_manifest(client, export_jobs, monkeypatch):
+    total = len(QUERIES) * len(MODES)
+    pending_seen = []
+    # The action runs once every pack render is in flight and none has finished.
+    started = threading.Barrier(total, action=lambda: pending_seen.append(export_jobs.pending()), timeout=30)
+    render = jobs_module._render_in_worker
+
+    def counted_render(report):
+        started.wait()
+        return render(report)
+
+    monkeypatch.setattr(jobs_module, "_render_in_worker", counted_render)
+    response = client.post("/export/pack", json={"queries": QUERIES + QUERIES[:1], "modes": MODES})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    expected = {
+        f"{stem}_India_{mode}.pdf"
+        for stem in ("Ranolazine_HFpEF", "Empagliflozin_HFrEF")
+        for mode in MODES
+    }
+    assert set(archive.namelist()) == expected | {"manifest.json"}
+    for name in expected:
+        assert archive.read(name).startswith(b"%PDF")
+    manifest = json.loads(archive.read("manifest.json"))
+    assert {entry["file"] for entry in manifest["files"]} == expected
+    assert all("error" not in entry for entry in manifest["files"])
+
+    assert pending_seen == [total]
+    assert export_jobs.pending() == 0 and export_jobs.ewma_render_seconds != 1.0
+
+
+def test_busy_pack_retry_after_uses_observed_render_time(client, export_jobs):
+    export_jobs._renders_inflight = export_jobs.max_pending
+    export_jobs.ewma_render_seconds = 3.0
+    response = client.post("/export/pack", json={"queries": QUERIES, "modes": MODES})
+    assert response.status_code == 503
+    # Four renders must finish before the four-PDF pack fits: 3 s each across four workers.
+    assert response.headers["Retry-After"] == "3"
@@ -0,0 +1,40 @@
+from agents.knowledge_graph import KnowledgeGraph
+
+
+def _graph() -> KnowledgeGraph:
+    nodes = [{"name": n, "type": "drug" if n.startswith("D") else "target"} for n in ("D1", "D2", "A", "B", "C", "T")]
+    edges = [
+        {"source": "D1", "target": "A", "relation": "binds"},
+        {"source": "A", "target": "B", "relation": "drives"},
+        {"source": "B", "target": "C", "relation": "drives"},
+        {"source": "C", "target": "T", "relation": "causes"},
+        {"source": "D1", "target": "B", "relation": "binds"},
+        {"source": "D1", "target": "T", "relation": "treats"},
+        {"source": "D2", "target": "C", "relation": "binds"},
+    ]
+    return KnowledgeGraph.from_edges(nodes, edges)
+
+
+def _hops(path):
+    return [e["source"] for e in path] + [path[-1]["target"]]
+
+
+def test_paths_are_shortest_first_even_when_truncated():
+    kg = _graph()
+    assert [_hops(p) for p in kg.paths("D1", "T", limit=1)] == [["D1", "T"]]
+    assert [_hops(p) for p in kg.paths("D1", "T")] == [["D1", "T"], ["D1", "B", "C", "T"], ["D1", "A", "B", "C", "T"]]
+    assert kg.paths("D1", "T", max_depth=2) == kg.paths("D1", "T", limit=1)
+
+
+def test_paths_from_runs_one_reverse_search(monkeypatch):
+    kg = _graph()
+    calls = []
+    original = kg._distances_to
+    monkeypatch.setattr(kg, "_distances_to", lambda *a: calls.append(a) or original(*a))
+
+    found = kg.paths_from(["D1", "D2", "unknown"], "T")
+    assert len(calls) == 1
+    assert found["D1"] == kg.paths("D1", "T")
+    assert [_hops(p) for p in found["D2"]] == [["D2", "C", "T"]]
+    assert found["unknown"] == []
+    assert kg.paths_from(["D1"], "nowhere") == {"D1": []}
@@ -0,0 +1,92 @@
+import asyncio
+import inspect
+import threading
+import time
+
+from cache import memoize
+
+
+def test_sync_single_flight():
+    calls = []
+    gate = threading.Event()
+
+    @memoize(ttl=60)
+    def slow(x):
+        calls.append(x)
+        gate.wait(1)
+        return x * 2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow(3))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+    assert results == [6, 6, 6, 6]
+    assert calls == [3]
+
+
+def test_sync_follower_wait_is_bounded():
+    release = threading.Event()
+    calls = []
+
+    @memoize(ttl=60, wait_timeout=0.05)
+    def stuck(x):
+        calls.append(x)
+        if len(calls) == 1:
+            release.wait(2)  # the leader hangs
+        return x
+
+    leader = threading.Thread(target=stuck, args=(1,))
+    leader.start()
+    time.sleep(0.02)
+    started = time.perf_counter()
+    assert stuck(1) == 1
+    assert time.perf_counter() - started < 1
+    release.set()
+    leader.join()
+
+
+def test_async_wrapper_caches_awaited_result():
+    calls = []
+
+    @memoize(ttl=60)
+    async def agent(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return {"x": x}
+
+    assert inspect.iscoroutinefunction(agent)
+
+    async def run():
+        first = await asyncio.gather(*(agent(1) for _ in range(5)))
+        again = await agent(1)
+        return first, again
+
+    first, again = asyncio.run(run())
+    assert all(r == {"x": 1} for r in first)
+    assert again == {"x": 1}
+    assert calls == [1]
+    # A second event loop reads the cached value instead of a spent coroutine.
+    assert asyncio.run(agent(1)) == {"x": 1}
+
+
+def test_async_follower_recomputes_after_leader_failure():
+    calls = []
+
+    @memoize(ttl=60)
+    async def flaky(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return x
+
+    async def run():
+        return await asyncio.gather(flaky(7), flaky(7), return_exceptions=True)
+
+    first, second = asyncio.run(run())
+    assert isinstance(first, RuntimeError)
+    assert second == 7
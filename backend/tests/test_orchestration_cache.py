@@ -0,0 +1,45 @@
+import time
+
+import pytest
+
+from agents import master
+
+QUERY = "Assess repurposing potential of Ranolazine for HFpEF in India"
+
+
+def _failing_agent(*args):
+    raise RuntimeError("upstream unavailable")
+
+
+@pytest.fixture
+def failing_patent_agent(monkeypatch):
+    agents = [
+        (name, _failing_agent if name == "Patent Landscape Agent" else fn, keys)
+        for name, fn, keys in master.WORKER_AGENTS
+    ]
+    monkeypatch.setattr(master, "WORKER_AGENTS", agents)
+    master.orchestration_cache.invalidate()
+    yield
+    master.orchestration_cache.invalidate()
+
+
+def test_complete_report_is_cached():
+    master.orchestration_cache.invalidate()
+    master.get_orchestration(QUERY, "India")
+    assert master.orchestration_key(QUERY, "India") in master.orchestration_cache
+
+
+def test_degraded_report_is_not_cached_when_disabled(failing_patent_agent, monkeypatch):
+    monkeypatch.setattr(master, "DEGRADED_CACHE_TTL", 0)
+    report = master.get_orchestration(QUERY, "India")
+    assert report["agent_status"]["Patent Landscape Agent"]["status"] == "failed"
+    assert master.orchestration_key(QUERY, "India") not in master.orchestration_cache
+
+
+def test_degraded_report_gets_short_ttl(failing_patent_agent, monkeypatch):
+    monkeypatch.setattr(master, "DEGRADED_CACHE_TTL", 0.05)
+    master.get_orchestration(QUERY, "India")
+    key = master.orchestration_key(QUERY, "India")
+    assert key in master.orchestration_cache
+    time.sleep(0.1)
+    assert key not in master.orchestration_cache
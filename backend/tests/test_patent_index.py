@@ -0,0 +1,51 @@
+import random
+from datetime import date
+
+from agents.patent_index import IntervalTree, PatentIndex
+
+
+def _brute(intervals, t):
+    return sorted(idx for s, e, idx in intervals if s <= t < e)
+
+
+def test_stab_matches_brute_force():
+    rng = random.Random(7)
+    intervals = []
+    for idx in range(300):
+        start = rng.randrange(0, 1000)
+        intervals.append((start, start + rng.randrange(1, 200), idx))
+    tree = IntervalTree(intervals)
+    for t in list(range(-5, 1205, 7)) + [s for s, _, _ in intervals[:50]] + [e for _, e, _ in intervals[:50]]:
+        assert sorted(tree.stab(t)) == _brute(intervals, t)
+
+
+def test_degenerate_intervals_are_dropped():
+    intervals = [(10, 10, 0), (20, 15, 1), (5, 30, 2), (10, 10, 3)]
+    tree = IntervalTree(intervals)
+    assert tree.stab(10) == [2]
+    assert tree.stab(17) == [2]
+    assert IntervalTree([(3, 3, 0)] * 50).stab(3) == []
+
+
+def _record(pid, priority, expiry, claim_type="compound", use=""):
+    return {
+        "patent_id": pid,
+        "drug": "Ranolazine",
+        "claim_type": claim_type,
+        "use": use,
+        "jurisdiction": "US",
+        "priority_date": priority,
+        "expiry_date": expiry,
+    }
+
+
+def test_in_force_with_same_day_priority_and_expiry():
+    index = PatentIndex([
+        _record("A", "2010-01-01", "2010-01-01"),
+        _record("B", "2005-01-01", "2025-01-01"),
+        _record("C", "2012-01-01", "2030-01-01", claim_type="use", use="HFpEF"),
+    ])
+    assert [r["patent_id"] for r in index.in_force("ranolazine", "us", date(2010, 1, 1))] == ["B"]
+    assert [r["patent_id"] for r in index.in_force("Ranolazine", "US", date(2020, 6, 1), use="hfpef")] == ["B", "C"]
+    assert index.in_force("Ranolazine", "US", date(2020, 6, 1), use="angina") == [index.records[1]]
+    assert len(index.for_drug("ranolazine")) == 3
@@ -0,0 +1,122 @@
+from io import BytesIO
+
+import pytest
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import Paragraph, SimpleDocTemplate
+
+from agents.report_pdf import (
+    ReportTemplate,
+    _appendix_chunks,
+    _bar_chart_vector,
+    _build_styles,
+    _chart_series,
+    _Replay,
+    build_pdf_to,
+)
+
+# Wrapped in <u> so every chunk boundary falls inside an open tag.
+RAW = "<u>" + "\n".join(
+    f"<b>Agent {i}</b> output: p &lt; 0.05 &amp; <i>italic run that keeps going across "
+    f"several words and\nover the next line</i> with <font color='red'>{'word ' * 30}</font>"
+    for i in range(40)
+) + "</u>"
+
+
+def _plain(markup: str) -> str:
+    return Paragraph(markup, _build_styles()["cell"]).getPlainText()
+
+
+def test_appendix_chunks_never_split_markup():
+    for size in (7, 64, 500):
+        chunks = _appendix_chunks(RAW, size=size)
+        assert len(chunks) > 1
+        words = " ".join(_plain(chunk) for chunk in chunks).split()
+        assert words == _plain(RAW.replace("\n", "<br/>")).split()
+
+
+def test_large_mode_renders_markup_like_normal_mode():
+    sizes = {}
+    for large in (False, True):
+        out = BytesIO()
+        build_pdf_to({"raw_agent_output": RAW}, out, large=large)
+        assert out.getvalue().startswith(b"%PDF")
+        sizes[large] = len(out.getvalue())
+    # Same text and styling, only paragraph boundaries differ.
+    assert abs(sizes[True] - sizes[False]) < 0.1 * sizes[False]
+
+
+def test_non_numeric_chart_series_are_skipped():
+    charts = {
+        "lvedv_change_ml": {"Placebo": 0, "Drug": 12.5},
+        "hospitalizations": {"Placebo": 20, "Drug": 14},
+        "notes": {"Placebo": "n/a", "Drug": 3},
+        "flags": {"Placebo": True},
+        "empty": {},
+        "not_a_series": [1, 2],
+    }
+    assert [key for key, _ in _chart_series(charts)] == ["lvedv_change_ml", "hospitalizations"]
+    assert _chart_series({"lvedv_change_ml": {"Placebo": None}}) == []
+
+    out = BytesIO()
+    build_pdf_to({"charts": charts}, out)
+    assert out.getvalue().startswith(b"%PDF")
+
+
+def _render(story) -> bytes:
+    out = BytesIO()
+    doc = SimpleDocTemplate(out, pagesize=A4, rightMargin=40, leftMargin=40, topMargin=40, bottomMargin=40, invariant=1)
+    doc.build(story)
+    return out.getvalue()
+
+
+def test_replayed_sections_are_byte_identical_to_a_direct_render():
+    template = ReportTemplate()
+    chart = _bar_chart_vector("LVEDV Improvement (ml)", ("Placebo", "Drug"), (0.0, 33.34), "Change in LVEDV (ml)")
+
+    def story(replay: bool):
+        flowables = []
+        # Repeated so that sections straddle page breaks and take the split fallback too.
+        for _ in range(4):
+            for name, recordings in template._sections.items():
+                heading = name.replace("_", " ").title()
+                if replay:
+                    flowables.append(template.heading(heading))
+                    flowables.extend(template.section(name))
+                    flowables.append(_Replay(chart))
+                else:
+                    flowables.append(Paragraph(heading, template.styles["h1"]))
+                    flowables.extend(r.factory() for r in recordings)
+                    flowables.append(chart.factory())
+        return flowables
+
+    direct = _render(story(False))
+    assert direct.count(b"/Type /Page\n") > 4
+    assert _render(story(True)) == direct
+
+
+@pytest.fixture
+def uncompressed(monkeypatch):
+    """PDF content streams left uncompressed so tests can search the drawn text."""
+    from reportlab import rl_config
+
+    monkeypatch.setattr(rl_config, "pageCompression", 0)
+
+
+def test_pdf_for_another_pair_never_shows_the_demo_content(client, uncompressed):
+    response = client.post("/export/pdf", json={"query": "Assess Empagliflozin for HFrEF"})
+    assert response.status_code == 200
+    assert 'filename="indicure_empagliflozin_hfref_report.pdf"' in response.headers["content-disposition"]
+    pdf = response.content
+    assert b"Empagliflozin" in pdf and b"HFrEF \\(India\\)" in pdf
+    assert b"Ranolazine" not in pdf and b"HFpEF" not in pdf and b"LVEDV" not in pdf
+
+
+def test_demo_pair_keeps_the_demo_sections(uncompressed):
+    out = BytesIO()
+    build_pdf_to({"normalized": {"drug": "Ranolazine", "repurposing_target": "HFpEF", "geography": "India"}}, out)
+    pdf = out.getvalue()
+    assert b"Ranolazine" in pdf and b"LVEDV" in pdf and b"HFpEF \\(India\\)" in pdf
+
+    out = BytesIO()
+    build_pdf_to({"normalized": {"drug": "Metformin", "repurposing_target": "HFpEF", "geography": "India"}}, out)
+    assert b"LVEDV" not in out.getvalue() and b"No clinical outcomes are on record" in out.getvalue()
@@ -0,0 +1,33 @@
+from agents.master import get_orchestration
+from models import AnalyzeResponse
+
+
+def _screen(client, indication):
+    response = client.post("/screen", json={"indication": indication, "include_reports": False})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_screen_normalizes_long_form_indication(client):
+    long_form = _screen(client, "heart failure with preserved ejection fraction")
+    assert long_form["indication"] == "HFpEF"
+    assert long_form["shortlist"] == _screen(client, "HFpEF")["shortlist"]
+    assert len({c["score"] for c in long_form["shortlist"]}) > 1
+
+
+def test_report_narrative_follows_the_queried_pair():
+    report = get_orchestration("Assess Empagliflozin for HFrEF", "India")
+    text = report["executive_summary"] + report["recommendation"]
+    assert "Empagliflozin" in text and "HFrEF" in text
+    assert "Ranolazine" not in text and "HFpEF" not in text
+    assert all("Ranolazine" not in str(ref) for ref in report["references"])
+
+    reference = get_orchestration("Assess Ranolazine for HFpEF", "India")
+    assert reference["executive_summary"].startswith("Ranolazine, approved for chronic angina")
+
+
+def test_non_curated_analyze_payload_matches_the_response_model(client):
+    payload = client.post("/analyze", json={"query": "Assess Metformin for HFpEF in India"}).json()
+    assert payload["normalized"]["drug"] == "Metformin"
+    response = AnalyzeResponse.model_validate(payload)
+    assert response.references and all(set(ref) == {"title", "url"} for ref in response.references)
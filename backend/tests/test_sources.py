@@ -0,0 +1,61 @@
+import asyncio
+
+import httpx
+import pytest
+
+from sources import CircuitOpenError, SourceClient
+
+
+def _client(handler, **kwargs) -> SourceClient:
+    return SourceClient(
+        "test", "http://upstream", rate=1000, burst=1000, retries=0,
+        failure_threshold=1, reset_timeout=0.0, transport=httpx.MockTransport(handler), **kwargs,
+    )
+
+
+def test_half_open_probe_settles_on_non_transport_httpx_error():
+    async def go():
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(503)
+            if len(calls) == 2:
+                raise httpx.DecodingError("bad gzip", request=request)
+            return httpx.Response(200, json={"ok": True})
+
+        client = _client(handler)
+        with pytest.raises(Exception):
+            await client.get_json("/a")
+        assert client.breaker.state == "open"
+
+        with pytest.raises(httpx.DecodingError):
+            await client.get_json("/a")  # the half-open probe
+        assert client.breaker.state == "open"
+
+        assert await client.get_json("/a") == {"ok": True}
+        assert client.breaker.state == "closed"
+        await client.aclose()
+
+    asyncio.run(go())
+
+
+def test_open_circuit_rejects_without_calling_upstream():
+    async def go():
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(502)
+
+        client = _client(handler)
+        client.breaker.reset_timeout = 60.0
+        with pytest.raises(Exception):
+            await client.get_json("/a")
+        with pytest.raises(CircuitOpenError):
+            await client.get_json("/a")
+        assert len(calls) == 1
+        await client.aclose()
+
+    asyncio.run(go())
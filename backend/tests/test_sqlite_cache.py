@@ -0,0 +1,55 @@
+import multiprocessing
+import sqlite3
+
+from cache import SQLiteCache
+
+
+def _fill(path, name, start, count, size):
+    cache = SQLiteCache(path, maxsize=4, name=name, max_bytes=8 * 1024)
+    for i in range(start, start + count):
+        cache.set(("key", i), b"x" * size)
+
+
+def _in_child(*args):
+    proc = multiprocessing.get_context("spawn").Process(target=_fill, args=args)
+    proc.start()
+    proc.join(60)
+    assert proc.exitcode == 0
+
+
+def _sum_sizes(path, name):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE ns = ?", (name,)).fetchone()
+
+
+def test_entries_written_by_another_process_are_hits(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = SQLiteCache(path, maxsize=4, name="pdf")
+    _in_child(path, "pdf", 0, 2, 100)
+
+    assert cache.get(("key", 1)) == b"x" * 100
+    assert ("key", 0) in cache
+    assert cache.hits == 1 and cache.misses == 0
+    assert SQLiteCache(path, name="other").get(("key", 1)) is None
+
+
+def test_eviction_bounds_entries_and_bytes_across_processes(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = SQLiteCache(path, maxsize=4, name="pdf", max_bytes=8 * 1024)
+    cache.set(("key", "parent"), b"p" * 100)
+    _in_child(path, "pdf", 0, 6, 100)
+
+    # The child's sets evicted least recently used first, including the parent's entry.
+    assert len(cache) == 4
+    assert cache.get(("key", "parent")) is None
+    assert [cache.get(("key", i)) is not None for i in range(6)] == [False, False, True, True, True, True]
+
+    _in_child(path, "pdf", 10, 3, 3000)
+    stats = cache.stats()
+    assert stats["bytes"] <= 8 * 1024
+    assert (stats["size"], stats["bytes"]) == _sum_sizes(path, "pdf")
+
+    cache.set(("key", 10), b"y" * 10)  # overwrite keeps the running total exact
+    assert (len(cache), cache.stats()["bytes"]) == _sum_sizes(path, "pdf")
+    cache.invalidate()
+    assert (len(cache), cache.stats()["bytes"]) == (0, 0)